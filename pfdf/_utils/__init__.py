@@ -28,9 +28,9 @@ Modules:
 from __future__ import annotations
 
 import typing
+from math import ceil, floor
 
 import numpy as np
-import rasterio.transform
 
 if typing.TYPE_CHECKING:
     from typing import Any, Callable
@@ -59,11 +59,15 @@ def aslist(input: Any) -> list:
     the input is a list, returns it unchanged. Otherwise, places the input within
     a new list.
     """
-    if isinstance(input, (tuple, np.ndarray)):
-        input = list(input)
-    elif not isinstance(input, list):
-        input = [input]
-    return input
+    # Exact type checks are a fast path for the most common inputs
+    kind = type(input)
+    if kind is list:
+        return input
+    elif kind is tuple or isinstance(input, (tuple, np.ndarray)):
+        return list(input)
+    elif isinstance(input, list):
+        return input
+    return [input]
 
 
 def astuple(input: Any) -> tuple:
@@ -75,28 +79,25 @@ def astuple(input: Any) -> tuple:
     the input is a tuple, returns it unchanged. Otherwise, places the input within
     a new tuple.
     """
-    if isinstance(input, (list, np.ndarray)):
-        input = tuple(input)
-    elif not isinstance(input, tuple):
-        input = (input,)
-    return input
+    # Exact type checks are a fast path for the most common inputs
+    kind = type(input)
+    if kind is tuple:
+        return input
+    elif kind is list or isinstance(input, (list, np.ndarray)):
+        return tuple(input)
+    elif isinstance(input, tuple):
+        return input
+    return (input,)
 
 
 def all_nones(*args: Any) -> bool:
     "True if every input is None. Otherwise False"
-    for arg in args:
-        if arg is not None:
-            return False
-    return True
+    return all(arg is None for arg in args)
 
 
 def no_nones(*args: Any) -> bool:
     "True if none of the inputs are None. Otherwise False"
-
-    for arg in args:
-        if arg is None:
-            return False
-    return True
+    return all(arg is not None for arg in args)
 
 
 #####
@@ -107,7 +108,9 @@ def no_nones(*args: Any) -> bool:
 def clean_dims(X: RealArray, keepdims: bool) -> RealArray:
     "Optionally removes trailing singleton dimensions"
     if not keepdims:
-        X = np.atleast_1d(np.squeeze(X))
+        X = np.squeeze(X)
+        if X.ndim == 0:
+            X = X.reshape(1)
     return X
 
 
@@ -123,20 +126,52 @@ def limits(start: int, stop: int, length: int) -> start_stop:
 #####
 
 
-def rowcol(
-    affine: Affine, xs: vector, ys: vector, op: Callable
-) -> tuple[indices, indices]:
-    "Converts spatial coordinates to pixel indices"
+# Numpy equivalents of scalar rounding functions used to convert pixel coordinates
+_ROUNDING = {round: np.rint, floor: np.floor, ceil: np.ceil}
 
-    rows, cols = rasterio.transform.rowcol(affine, xs, ys, op=op)
-    rows = np.array(rows).astype(int).tolist()
-    cols = np.array(cols).astype(int).tolist()
+
+def _rowcol(
+    affine: Affine, xs: vector, ys: vector, op: Callable
+) -> tuple[np.ndarray, np.ndarray]:
+    "Converts spatial coordinates to pixel indices as numpy int arrays"
+
+    # Apply the inverse affine transform directly, rather than dispatching
+    # through rasterio. Use a 3x3 matrix product, as rasterio 1.4+ does, so that
+    # coordinates on pixel edges round the same way as rasterio.transform.rowcol
+    inverse = np.array(~affine).reshape(3, 3)
+    xs, ys = np.broadcast_arrays(
+        np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+    )
+    shape = xs.shape
+    points = np.stack((xs.ravel(), ys.ravel(), np.ones(xs.size)))
+    cols, rows = np.dot(inverse, points)[:2]
+    cols = cols.reshape(shape)
+    rows = rows.reshape(shape)
+
+    # Convert to pixel indices. Use numpy rounding when available
+    op = _ROUNDING.get(op, op)
+    if not isinstance(op, np.ufunc):
+        op = np.vectorize(op, otypes=[float])
+    rows = op(rows).astype(int)
+    cols = op(cols).astype(int)
     return rows, cols
 
 
+def rowcol(
+    affine: Affine, xs: vector, ys: vector, op: Callable, *, as_array: bool = False
+) -> tuple[indices, indices] | tuple[np.ndarray, np.ndarray]:
+    "Converts spatial coordinates to pixel indices, optionally as numpy int arrays"
+
+    rows, cols = _rowcol(affine, xs, ys, op)
+    if as_array:
+        return rows, cols
+    return rows.tolist(), cols.tolist()
+
+
 def pixel_limits(affine: Affine, bounds) -> tuple[start_stop, start_stop]:
+    "Returns the (min, max) row and column indices of a bounding box's corners"
 
-    rows, cols = rowcol(affine, bounds.xs, bounds.ys, op=round)
-    rows = (min(rows), max(rows))
-    cols = (min(cols), max(cols))
+    rows, cols = _rowcol(affine, bounds.xs, bounds.ys, op=round)
+    rows = (int(rows.min()), int(rows.max()))
+    cols = (int(cols.min()), int(cols.max()))
     return rows, cols
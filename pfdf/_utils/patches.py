@@ -9,12 +9,45 @@ released by pysheds.
 Contents:
     Patch   - A context manager that patches the broken pysheds function
     _new    - A patched version of the `pysheds.sview.Raster.__new__` method
+
+Imports:
+    _sview  - Returns the pysheds.sview module
+    _sgrid  - Returns the pysheds.sgrid module
+    _numba  - Returns the pysheds._sgrid module of numba functions
+----------
+Note that pysheds is imported on first use, rather than at the module level. This way,
+importing this module does not load pysheds (and its scipy/numba dependencies) until a
+patch is actually applied. The imported modules are cached, so applying a patch does
+not repeat the import lookup.
 """
 
+from functools import cache
+
 import numpy as np
-from pysheds import _sgrid as _self
-from pysheds.sgrid import sGrid
-from pysheds.sview import Raster, ViewFinder
+
+
+@cache
+def _sview():
+    "Returns the pysheds.sview module"
+    from pysheds import sview
+
+    return sview
+
+
+@cache
+def _sgrid():
+    "Returns the pysheds.sgrid module"
+    from pysheds import sgrid
+
+    return sgrid
+
+
+@cache
+def _numba():
+    "Returns the pysheds._sgrid module of numba functions"
+    from pysheds import _sgrid
+
+    return _sgrid
 
 
 class NodataPatch:
@@ -30,19 +63,22 @@ class NodataPatch:
 
     def __init__(self):
         "Stores a reference to the original (buggy) function"
-        self.initial = Raster.__new__
+        self.initial = _sview().Raster.__new__
 
     def __enter__(self):
         "Replaces the affected function with the patched code"
-        Raster.__new__ = self.patch
+        _sview().Raster.__new__ = self.patch
 
     def __exit__(self, *args, **kwargs) -> None:
         "Restores the original function"
-        Raster.__new__ = self.initial
+        _sview().Raster.__new__ = self.initial
 
     @staticmethod  # pragma: no cover
     def patch(cls, input_array, viewfinder=None, metadata={}):
         "A patched version of pysheds.sview.Raster.__new__"
+        sview = _sview()
+        Raster, ViewFinder = sview.Raster, sview.ViewFinder
+
         try:
             # MultiRaster must be subclass of ndarray
             assert isinstance(input_array, np.ndarray)
@@ -58,7 +94,8 @@ class NodataPatch:
         # Create a numpy array from the input
         obj = np.asarray(input_array).view(cls)
         # If no viewfinder provided, construct one congruent with the array shape
-        if viewfinder is None:
+        new_viewfinder = viewfinder is None
+        if new_viewfinder:
             viewfinder = ViewFinder(shape=obj.shape)
         # If a viewfinder is provided, ensure that it is a viewfinder...
         else:
@@ -88,9 +125,11 @@ class NodataPatch:
 
         except:
             raise TypeError("`nodata` value not representable in dtype of array.")
-        # Don't allow original viewfinder and metadata to be modified
-        viewfinder = viewfinder.copy()
-        metadata = metadata.copy()
+        # Don't allow original viewfinder and metadata to be modified. (Copies
+        # are not needed for a new viewfinder or empty metadata)
+        if not new_viewfinder:
+            viewfinder = viewfinder.copy()
+        metadata = metadata.copy() if metadata else {}
         # Set attributes of array
         obj._viewfinder = viewfinder
         obj.metadata = metadata
@@ -110,15 +149,15 @@ class RidgePatch:
 
     def __init__(self):
         "Stores a reference to the original (buggy) function"
-        self.initial = sGrid._d8_distance_to_ridge
+        self.initial = _sgrid().sGrid._d8_distance_to_ridge
 
     def __enter__(self):
         "Replaces the affected function with the patched code"
-        sGrid._d8_distance_to_ridge = self.patch
+        _sgrid().sGrid._d8_distance_to_ridge = self.patch
 
     def __exit__(self, *args, **kwargs) -> None:
         "Restores the original function"
-        sGrid._d8_distance_to_ridge = self.initial
+        _sgrid().sGrid._d8_distance_to_ridge = self.initial
 
     @staticmethod  # pragma: no cover
     def patch(
@@ -131,11 +170,13 @@ class RidgePatch:
         **kwargs,
     ):
         "A patched version of pysheds.sgrid.sGrid._d8_distance_to_ridge"
+        _self = _numba()
+
         # Find nodata cells and invalid cells
         nodata_cells = self._get_nodata_cells(fdir)
-        invalid_cells = ~np.isin(fdir.ravel(), dirmap).reshape(fdir.shape)
-        # Set nodata cells to zero
-        fdir[nodata_cells] = 0
+        invalid_cells = np.isin(fdir, dirmap, invert=True)
+        # Set nodata and invalid cells to zero in a single pass
+        invalid_cells |= nodata_cells
         fdir[invalid_cells] = 0
         # TODO: Should this be ones for all cells?
         if weights is None:
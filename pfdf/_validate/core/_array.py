@@ -18,6 +18,7 @@ Shape and Type:
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 
 import numpy as np
 
@@ -38,6 +39,9 @@ if typing.TYPE_CHECKING:
         strs,
     )
 
+# Tuple of real-valued dtypes. Used to skip conversion for the most common case
+_REAL = tuple(real)
+
 #####
 # Low Level
 #####
@@ -76,12 +80,11 @@ def dtype_(name: str, allowed: dtypes, actual: type) -> None:
     Raises:
         TypeError: If the dtype is not allowed
     """
-    # Iterate through allowed types. Exit if any match
+    # Exit if any of the allowed types match
     if allowed is not None:
-        allowed = aslist(allowed)
-        for type in allowed:
-            if np.issubdtype(actual, type):
-                return
+        allowed = _REAL if allowed is real else astuple(allowed)
+        if _issubdtype(actual, allowed):
+            return
 
         # TypeError if type was not allowed
         allowed = ", ".join([str(type)[8:-2] for type in allowed])
@@ -91,6 +94,15 @@ def dtype_(name: str, allowed: dtypes, actual: type) -> None:
         )
 
 
+@lru_cache(maxsize=256)
+def _issubdtype(actual: type, allowed: tuple) -> bool:
+    "Caches whether a dtype is derived from any of a tuple of allowed dtypes"
+    for type in allowed:
+        if np.issubdtype(actual, type):
+            return True
+    return False
+
+
 def shape_(name: str, axes: strs, required: shape, actual: shape) -> None:
     """
     shape_  Checks that a numpy ndarray shape is valid
@@ -114,16 +126,27 @@ def shape_(name: str, axes: strs, required: shape, actual: shape) -> None:
 
     # Convert inputs to sequences
     if required is not None:
-        axes = aslist(axes)
         required = astuple(required)
         actual = astuple(actual)
 
+        # Compare directly when there is only a single dimension (e.g. vectors)
+        if len(required) == 1 and len(actual) == 1:
+            axis = axes if isinstance(axes, str) else axes[0]
+            _check_length(name, axis, required[0], actual[0])
+            return
+
         # Check the length of each dimension
+        axes = aslist(axes)
         for axis, required, actual in zip(axes, required, actual):
-            if required != -1 and required != actual:
-                raise ShapeError(
-                    f"{name} must have {required} {axis}, but it has {actual} {axis} instead."
-                )
+            _check_length(name, axis, required, actual)
+
+
+def _check_length(name: str, axis: str, required: int, actual: int) -> None:
+    "Checks the length of a single dimension of an array"
+    if required != -1 and required != actual:
+        raise ShapeError(
+            f"{name} must have {required} {axis}, but it has {actual} {axis} instead."
+        )
 
 
 def nonsingleton(array: np.ndarray) -> list[bool]:
@@ -183,17 +206,20 @@ def array(
         EmptyArrayError - If the array is empty
     """
 
-    # Convert to array with minimum of 1D. Copy as needed.
-    # Use copy parameter directly - numpy 1.26+ requires bool, not None
-    input = np.array(input, copy=copy)
-    input = np.atleast_1d(input)
+    # Convert to array with minimum of 1D. Copy as needed. Arrays that are
+    # already at least 1D do not need conversion when not copying.
+    if copy:
+        input = np.atleast_1d(np.array(input, copy=True))
+    elif type(input) is not np.ndarray or input.ndim == 0:
+        input = np.atleast_1d(np.asarray(input))
 
     # Optionally prevent empty arrays
     if not allow_empty and input.size == 0:
         raise EmptyArrayError(f"{name} does not have any elements.")
 
     # Optionally check dtype
-    dtype_(name, allowed=dtype, actual=input.dtype)
+    if dtype is not None:
+        dtype_(name, allowed=dtype, actual=input.dtype)
     return input
 
 
@@ -271,16 +297,17 @@ def vector(
     # Initial validation
     input = array(input, name, dtype, copy=False, allow_empty=allow_empty)
 
-    # Only 1 non-singleton dimension is allowed
-    nonsingletons = nonsingleton(input)
-    if sum(nonsingletons) > 1:
+    # Only 1 non-singleton dimension is allowed. (1D arrays always pass)
+    if input.ndim > 1 and sum(nonsingleton(input)) > 1:
         raise DimensionError(
             f"{name} can only have 1 dimension with a length greater than 1."
         )
 
     # Optionally check shape. Return as 1D vector.
     shape_(name, "element(s)", required=length, actual=input.size)
-    return input.reshape(-1)
+    if input.ndim > 1:
+        input = input.reshape(-1)
+    return input
 
 
 def matrix(
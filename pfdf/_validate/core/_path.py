@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import typing
 from pathlib import Path
+from stat import S_ISREG
 
 import pfdf._validate.core._low as validate
 
@@ -19,8 +20,9 @@ if typing.TYPE_CHECKING:
     from typing import Any
 
 
-def _path(path: Any, isparent: bool = False) -> Path:
-    "Checks an input represents a Path object and returns the resolved path"
+def _path(path: Any, isparent: bool = False, strict: bool = False) -> Path:
+    """Checks an input represents a Path object and returns the resolved path.
+    Set strict=True to require the path to exist"""
 
     # Get names
     if isparent:
@@ -32,15 +34,14 @@ def _path(path: Any, isparent: bool = False) -> Path:
     if isinstance(path, str):
         path = Path(path)
     validate.type(path, name, Path, type_name)
-    return path.resolve()
+    return path.resolve(strict=strict)
 
 
 def input_file(path: Any) -> Path:
     """Checks an input is an existing path. Note that folders are permitted because
     many GIS "files" are actually a structured folder (e.g. geodatabases)"""
 
-    path = _path(path)
-    return path.resolve(strict=True)
+    return _path(path, strict=True)
 
 
 def output_file(path: Any, overwrite: bool) -> Path:
@@ -70,13 +71,18 @@ def download_path(parent: Any, name: Any, default_name: str, overwrite: bool) ->
     else:
         name = validate.string(name, "name")
 
-    # Optionally prevent overwriting
+    # Check whether the path exists using a single stat call
     path = parent / name
-    if path.exists():
-        if not overwrite:
-            raise FileExistsError(f"Download path already exists:\n\t{path}")
-        elif not path.is_file():
-            raise FileExistsError(
-                f"Cannot overwrite because the current path is not a file:\n\t{path}"
-            )
+    try:
+        mode = path.stat().st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return path
+
+    # Optionally prevent overwriting
+    if not overwrite:
+        raise FileExistsError(f"Download path already exists:\n\t{path}")
+    elif not S_ISREG(mode):
+        raise FileExistsError(
+            f"Cannot overwrite because the current path is not a file:\n\t{path}"
+        )
     return path
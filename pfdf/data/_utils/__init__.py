@@ -2,7 +2,7 @@
 Utilities used to support data acquisition
 ----------
 Functions:
-    unzip       - Extracts a zip archive represented as a byte string
+    unzip       - Extracts a zip archive represented as a byte string or file path
 
 Modules:
     _unzip      - Implements the "unzip" function
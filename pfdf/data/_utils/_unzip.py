@@ -2,13 +2,14 @@
 Function to extract zip archives downloaded via a HTTP request
 ----------
 Function:
-    unzip   - Extracts a zip archive represented as a byte string
+    unzip   - Extracts a zip archive represented as a byte string or file path
 """
 
 from __future__ import annotations
 
 import shutil
 import typing
+from io import BytesIO
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from zipfile import ZipFile
@@ -17,22 +18,21 @@ if typing.TYPE_CHECKING:
     from typing import Optional
 
 
-def unzip(data: bytes, path: Path, item: Optional[str] = None) -> None:
+def unzip(data: bytes | Path, path: Path, item: Optional[str] = None) -> None:
     """Extracts a zip archive provided in bytes (as is the case for zip files downloaded
-    via HTTP request)"""
+    via HTTP request), or as the path to a zip file already on disk"""
 
-    # Save the archive to disk in a temp folder
-    with TemporaryDirectory() as temp:
-        temp = Path(temp)
-        zipped = temp / "archive.zip"
-        zipped.write_bytes(data)
+    # Read byte strings from memory, rather than writing them to a temp file first
+    if not isinstance(data, Path):
+        data = BytesIO(data)
 
-        # Extract the zip archive
-        extracted = temp / "extracted"
-        with ZipFile(zipped) as zipped:
+    # Extract the zip archive in a temp folder
+    with TemporaryDirectory() as temp:
+        extracted = Path(temp) / "extracted"
+        with ZipFile(data) as zipped:
             zipped.extractall(extracted)
 
         # Get the final output folder and move to the requested path
         if item is not None:
             extracted = extracted / item
-        shutil.copytree(src=extracted, dst=path)
+        shutil.move(extracted, path)
@@ -6,13 +6,17 @@ from remote servers. Many of these functions are intended to help validate serve
 responses and provide informative errors when an HTTP request is invalid.
 ----------
 Main functions:
+    session             - Returns a shared requests.Session used for HTTP requests
     query_url           - Builds a query URL from base URL and parameters
     get                 - Validates and returns an HTTP response
     content             - Validates and returns HTTP response content (as bytes)
     json                - Validates and returns an HTTP response as a JSON dict
+    parse_json          - Returns the content of an HTTP response as a JSON dict
+    download            - Streams an HTTP response to a local file
 
 Utilities:
     _validate           - Parses timeout and error info for an HTTP request
+    _get                - Makes an HTTP request with pre-validated inputs
     _connect_timeout    - Builds an informative error for a connection timeout
     _read_timeout       - Builds an informative error for a read timeout
     _check_connections  - Adds connection info to a timeout error
@@ -20,19 +24,29 @@ Utilities:
 
 from __future__ import annotations
 
+import atexit
+import os
 import typing
-from urllib.parse import unquote
+from itertools import chain
+from json import loads
+from pathlib import Path
+from shutil import copyfileobj
+from tempfile import NamedTemporaryFile
+from threading import Lock
+from urllib.parse import unquote, urlencode, urlsplit, urlunsplit
 
 import requests
-from requests.exceptions import ConnectTimeout, HTTPError, JSONDecodeError, ReadTimeout
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectTimeout, HTTPError, ReadTimeout
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 
 from pfdf._utils import aslist
 from pfdf._validate import core as validate
 from pfdf.errors import InvalidJSONError
 
 if typing.TYPE_CHECKING:
-    from pathlib import Path
-    from typing import Any, Optional
+    from typing import Any, Iterable, Optional
 
     from requests import Response
 
@@ -42,11 +56,72 @@ if typing.TYPE_CHECKING:
     outages = list[str | None]
 
 
+# Number of bytes written to disk at a time when streaming a download
+_CHUNK_SIZE = 2**20
+
+# Shared sessions, keyed by whether they retry server overload statuses. Reusing a
+# session allows repeated queries to the same server (such as polling an LFPS job) to
+# reuse pooled connections, rather than opening a new TCP/TLS connection for every
+# request. Initialized on first use, under a lock so that concurrent downloads cannot
+# create competing sessions.
+_SESSIONS: dict[bool, requests.Session] = {}
+_SESSION_LOCK = Lock()
+
+# Retries for transient failures. Connection failures are always safe to retry, as are
+# server overload statuses. Read timeouts are not retried because LFPS submits jobs via
+# GET, so a retry could create a duplicate job. Exhausted status retries return the
+# final response, so that the usual HTTPError is raised.
+_RETRIES = Retry(
+    total=3,
+    connect=3,
+    read=False,
+    status=3,
+    backoff_factor=1,
+    status_forcelist=frozenset({429, 502, 503, 504}),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=True,
+    raise_on_status=False,
+)
+
+# Retries for requests that are not safe to replay once they reach the server (such
+# as submitting an LFPS job). Only connection failures are retried, since a gateway
+# error may arrive after the server has already acted on the request.
+_NO_STATUS_RETRIES = Retry(
+    total=3,
+    connect=3,
+    read=False,
+    status=0,
+    backoff_factor=1,
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+
 #####
 # Main
 #####
 
 
+def session(retry: bool = True) -> requests.Session:
+    """Returns a shared requests.Session used for HTTP requests. Set retry=False to
+    return a session that does not retry server overload statuses"""
+
+    if retry not in _SESSIONS:
+        with _SESSION_LOCK:
+            if retry not in _SESSIONS:
+                retries = _RETRIES if retry else _NO_STATUS_RETRIES
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=4, pool_maxsize=16, max_retries=retries
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                atexit.register(session.close)
+                _SESSIONS[retry] = session
+    return _SESSIONS[retry]
+
+
 def _validate(
     timeout: Any, servers: strs, outages: strs | None
 ) -> tuple[timeout, servers, outages]:
@@ -62,10 +137,18 @@ def _validate(
 
 
 def query_url(base: str, params: dict, decode: bool) -> str:
-    "Builds a query URL from a base URL and parameters"
-
-    request = requests.Request(url=base, params=params)
-    url = request.prepare().url
+    """Builds a query URL from a base URL and parameters. Encodes parameters in the
+    same way as requests, but without the overhead of preparing a full request"""
+
+    # Drop unset parameters and encode the rest. Sequences become repeated keys
+    params = {key: value for key, value in params.items() if value is not None}
+    query = urlencode(params, doseq=True)
+
+    # Append to any existing query. Use "/" for an empty path, as per requests
+    scheme, netloc, path, existing, fragment = urlsplit(base)
+    if existing:
+        query = f"{existing}&{query}" if query else existing
+    url = urlunsplit((scheme, netloc, path or "/", query, fragment))
     if decode:
         url = unquote(url)
     return url
@@ -77,14 +160,40 @@ def get(
     timeout: Any,
     servers: strs,
     outages: Optional[strs] = None,
+    *,
+    stream: bool = False,
+    headers: Optional[dict[str, str]] = None,
 ) -> Response:
     """Makes an HTTP request and returns the response. Provides informative errors if
-    the request times out, or the request was not successful"""
+    the request times out, or the request was not successful. Set stream=True to
+    defer downloading the response content until it is accessed. Use headers to send
+    additional HTTP headers with the request"""
 
-    # Validate. Make the query
     timeout, servers, outages = _validate(timeout, servers, outages)
+    return _get(url, params, timeout, servers, outages, stream, headers)
+
+
+def _get(
+    url: str,
+    params: dict[str, Any],
+    timeout: timeout,
+    servers: servers,
+    outages: outages,
+    stream: bool = False,
+    headers: Optional[dict[str, str]] = None,
+    retry: bool = True,
+) -> Response:
+    """Makes an HTTP request using timeout and error info that were already validated.
+    Set retry=False to disable retries of server overload statuses"""
+
+    # Only pass headers when there are any
+    kwargs = {} if not headers else {"headers": headers}
+
+    # Make the query
     try:
-        response = requests.get(url, params=params, timeout=timeout)
+        response = session(retry).get(
+            url, params=params, timeout=timeout, stream=stream, **kwargs
+        )
 
     # Informative error if the request timed out
     except ConnectTimeout as error:
@@ -112,7 +221,8 @@ def content(
 ) -> bytes:
     "Validates an HTTP request and returns the response content as bytes"
 
-    response = get(url, params, timeout, servers, outages)
+    timeout, servers, outages = _validate(timeout, servers, outages)
+    response = _get(url, params, timeout, servers, outages)
     return response.content
 
 
@@ -122,20 +232,26 @@ def json(
     timeout: Any,
     servers: strs,
     outages: Optional[strs] = None,
+    *,
+    retry: bool = True,
 ) -> dict:
-    "Validates and returns an HTTP request as a JSON dict"
+    """Validates and returns an HTTP request as a JSON dict. Set retry=False for
+    requests that are not safe to replay after a server overload status"""
 
-    # Validate and get response
-    servers = aslist(servers)
-    response = get(url, params, timeout, servers, outages)
+    timeout, servers, outages = _validate(timeout, servers, outages)
+    response = _get(url, params, timeout, servers, outages, retry=retry)
+    return parse_json(response, servers[0])
+
+
+def parse_json(response: Response, server: str) -> dict:
+    "Returns the content of an HTTP response as a JSON dict"
 
-    # Convert response to JSON
+    # Parse the raw bytes directly, as this avoids the encoding detection and text
+    # decoding used by Response.json
     try:
-        return response.json()
-    except JSONDecodeError as error:
-        raise InvalidJSONError(
-            f"The {servers[0]} response was not valid JSON"
-        ) from error
+        return loads(response.content)
+    except ValueError as error:
+        raise InvalidJSONError(f"The {server} response was not valid JSON") from error
 
 
 def download(
@@ -146,10 +262,30 @@ def download(
     servers: strs,
     outages: Optional[strs] = None,
 ) -> Path:
-    "Downloads a web dataset to the indicated path"
+    """Downloads a web dataset to the indicated path. Streams the response to disk in
+    chunks, so that large datasets are never held in memory all at once"""
 
-    response = content(url, params, timeout, servers, outages)
-    path.write_bytes(response)
+    timeout, servers, outages = _validate(timeout, servers, outages)
+    with _get(url, params, timeout, servers, outages, stream=True) as response:
+
+        # Stream into a temporary file in the output folder, so that an interrupted
+        # download never leaves a truncated file at the final path
+        temp = NamedTemporaryFile(dir=path.parent, delete=False)
+        try:
+            with temp:
+                # Copy the raw stream directly to the file. Decode any content
+                # encoding (gzip, etc.) as the stream is read, as iter_content would
+                response.raw.decode_content = True
+                try:
+                    copyfileobj(response.raw, temp, _CHUNK_SIZE)
+                except (ReadTimeoutError, ProtocolError) as error:
+                    raise _read_timeout(servers, outages) from error
+            os.replace(temp.name, path)
+
+        # Remove the partial file if anything went wrong
+        except BaseException:
+            Path(temp.name).unlink(missing_ok=True)
+            raise
     return path
 
 
@@ -162,8 +298,8 @@ def _connect_timeout(servers: servers, outages: outages) -> ConnectTimeout:
     "Builds a ConnectTimeout error with an informative error message"
 
     message = f"Took too long to connect to the {servers[0]} server."
-    servers = ["your internet connection"] + servers
-    outages = [None] + outages
+    servers = chain(["your internet connection"], servers)
+    outages = chain([None], outages)
     message += _check_connections(servers, outages)
     return ConnectTimeout(message)
 
@@ -176,16 +312,16 @@ def _read_timeout(servers: servers, outages: outages) -> ReadTimeout:
     return ReadTimeout(message)
 
 
-def _check_connections(connections: servers, outages: outages) -> str:
+def _check_connections(
+    connections: Iterable[str], outages: Iterable[str | None]
+) -> str:
     "Builds an informative message indicating server connections that may be down"
-    message = " Try checking:\n"
+    lines = [" Try checking:"]
     for connection, outage in zip(connections, outages, strict=True):
-        line = f"  * If {connection} is down"
-        if outage is not None:
-            line += f" ({outage})"
-        message += line + "\n"
-    message += (
-        "If a connection is down, then wait a bit and try again later.\n"
-        'Otherwise, try increasing "timeout" to a longer interval.'
-    )
-    return message
+        if outage is None:
+            lines.append(f"  * If {connection} is down")
+        else:
+            lines.append(f"  * If {connection} is down ({outage})")
+    lines.append("If a connection is down, then wait a bit and try again later.")
+    lines.append('Otherwise, try increasing "timeout" to a longer interval.')
+    return "\n".join(lines)
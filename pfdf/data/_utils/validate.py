@@ -4,31 +4,57 @@ Functions used to validate data acquisition routines
 Functions:
     bounds          - Validates a bounding box. Optionally converts to delimited EPSG:4326 string
     strings         - Checks an input represents a delimited string list
+
+Internal:
+    _epsg4326       - Returns a cached EPSG:4326 string for a bounding box
 """
 
 from __future__ import annotations
 
 import typing
+from functools import lru_cache
 
 import pfdf._validate.projection as pvalidate
 from pfdf._utils import aslist
+from pfdf.projection import CRS, BoundingBox
 
 if typing.TYPE_CHECKING:
     from typing import Any
 
+# Bounding boxes in this CRS can be formatted without reprojection
+_EPSG4326 = CRS.from_epsg(4326)
+
 
 def bounds(bounds: Any, as_string: bool = True, delimiter: str = ",") -> str:
     "Validates a bounding box as a delimited EPSG:4326 string"
     bounds = pvalidate.bounds(bounds, require_crs=True)
     if as_string:
-        bounds = bounds.reproject(4326)
-        bounds = delimiter.join(str(bound) for bound in bounds.bounds)
+        bounds = _epsg4326(bounds.bounds, bounds.crs, delimiter)
     return bounds
 
 
+@lru_cache(maxsize=32)
+def _epsg4326(bounds: tuple[float, ...], crs: CRS, delimiter: str) -> str:
+    """Caches the delimited EPSG:4326 string for a bounding box, so that repeated
+    queries for the same area do not need to reproject the box"""
+
+    # Only reproject if the box is not already in EPSG:4326
+    if crs != _EPSG4326:
+        bounds = BoundingBox(*bounds, crs).reproject(_EPSG4326).bounds
+
+    # A bounding box always has exactly 4 edges, so format them directly
+    left, bottom, right, top = bounds
+    return f"{left}{delimiter}{bottom}{delimiter}{right}{delimiter}{top}"
+
+
 def strings(strings: Any, name: str, delimiter=",") -> str:
     "Converts a list of names to a delimited string"
 
+    # A single string is already delimited
+    if isinstance(strings, str):
+        return strings
+
+    # Otherwise, require a list of strings
     strings = aslist(strings)
     for s, string in enumerate(strings):
         if not isinstance(string, str):
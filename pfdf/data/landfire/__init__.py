@@ -19,8 +19,10 @@ for low-level interactions with the LFPS API. Most users will not need this modu
 developers may find them useful for custom data acquisition routines.
 ----------
 Functions:
-    read        - Reads a LANDFIRE raster dataset into memory as a Raster object
-    download    - Download one or more LANDFIRE data products to the local filesystem
+    read            - Reads a LANDFIRE raster dataset into memory as a Raster object
+    download        - Download one or more LANDFIRE data products to the local filesystem
+    download_many   - Concurrently download multiple LANDFIRE data products
+    clear_cache     - Removes all cached LFPS jobs and product info
 
 Modules:
     url         - Functions returning URLs used to query the LFPS API
@@ -29,8 +31,9 @@ Modules:
 
 Internal modules:
     _landfire   - Module implementing the read and download functions
+    _cache      - In-memory caches of LFPS jobs and product info
     _validate   - Module for validating LFPS parameters
 """
 
 from pfdf.data.landfire import job, products, url
-from pfdf.data.landfire._landfire import download, read
+from pfdf.data.landfire._landfire import clear_cache, download, download_many, read
@@ -0,0 +1,171 @@
+"""
+In-memory caches of LFPS jobs and product info
+----------
+LFPS jobs are slow to queue and process, so repeated queries for the same data can
+waste a lot of time. This module records the ID of each job submitted by the `download`
+and `read` commands, keyed by the validated job parameters. Subsequent identical
+queries can then reuse the existing job, rather than submitting (and waiting for) a
+new one. Cached jobs expire after a fixed period, since LFPS eventually deletes old
+jobs from its system.
+
+This module also holds the most recent LFPS product catalog. The catalog changes
+rarely, so the functions in the `products` module reuse a recent catalog, rather than
+querying LFPS for every call. The cached catalog is indexed by lowercase acronym and
+layer name, so that lookups do not require a scan of every product. The cache also
+records any ETag and Last-Modified headers from the catalog query. Once the catalog
+expires, these allow a conditional query that confirms the cached catalog is still
+current without downloading it again. Both caches only persist for the current Python
+session.
+----------
+Jobs:
+    key             - Returns the cache key for a set of validated job parameters
+    get             - Returns the ID of a cached job, or None if there is no valid job
+    add             - Adds a job ID to the cache
+    remove          - Removes a job from the cache
+
+Product catalog:
+    catalog         - Returns the cached product catalog, or None if it is not recent
+    set_catalog     - Indexes and caches a product catalog
+    validators      - Returns headers for a conditional query of the cached catalog
+    renew_catalog   - Marks the cached catalog as recent and returns it, if there is one
+
+All:
+    clear           - Removes all jobs and product info from the cache
+"""
+
+from __future__ import annotations
+
+import typing
+from threading import Lock
+from time import monotonic
+
+if typing.TYPE_CHECKING:
+    from typing import Mapping, Optional
+
+    JobKey = tuple[tuple[str, str], ...]
+
+# Maximum age (in seconds) of a cached job
+_MAX_AGE = 3600
+
+# Maximum age (in seconds) of a cached product catalog
+_CATALOG_AGE = 600
+
+# Maps job keys to (job ID, submission time). Guarded by a lock for concurrent downloads
+_JOBS: dict = {}
+_LOCK = Lock()
+
+# The most recent (indexed product catalog, query time, conditional query headers).
+# Guarded by the same lock as the jobs
+_CATALOG: Optional[tuple[dict, float, dict]] = None
+
+
+#####
+# Jobs
+#####
+
+
+def key(params: dict) -> JobKey:
+    "Returns the cache key for a set of validated job submission parameters"
+    return tuple(params.items())
+
+
+def get(key: JobKey) -> Optional[str]:
+    "Returns the ID of a cached job, or None if there is no valid cached job"
+    with _LOCK:
+        if key not in _JOBS:
+            return None
+        id, submitted = _JOBS[key]
+        if monotonic() - submitted > _MAX_AGE:
+            del _JOBS[key]
+            return None
+        return id
+
+
+def add(key: JobKey, id: str) -> None:
+    "Adds a job ID to the cache"
+    with _LOCK:
+        _JOBS[key] = (id, monotonic())
+
+
+def remove(key: JobKey) -> None:
+    "Removes a job from the cache"
+    with _LOCK:
+        _JOBS.pop(key, None)
+
+
+#####
+# Product catalog
+#####
+
+
+def catalog() -> Optional[dict]:
+    """Returns the cached product catalog, or None if there is no recent catalog. The
+    catalog is a dict with a "products" key holding the list of product info dicts,
+    an "acronyms" key mapping lowercase acronyms to lists of product info dicts, and
+    a "layers" key mapping lowercase layer names to product info dicts"""
+    with _LOCK:
+        if _CATALOG is None:
+            return None
+        catalog, queried, _ = _CATALOG
+    if monotonic() - queried > _CATALOG_AGE:
+        return None
+    return catalog
+
+
+def set_catalog(products: list[dict], headers: Optional[Mapping] = None) -> dict:
+    """Indexes and caches a product catalog. Records any ETag and Last-Modified values
+    from the response headers. Returns the indexed catalog"""
+    global _CATALOG
+
+    acronyms = {}
+    layers = {}
+    for product in products:
+        acronyms.setdefault(product["acronym"].lower(), []).append(product)
+        layers.setdefault(product["layerName"].lower(), product)
+    catalog = {"products": products, "acronyms": acronyms, "layers": layers}
+
+    # Convert the response validators to conditional request headers
+    validators = {}
+    if headers is not None:
+        if "ETag" in headers:
+            validators["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            validators["If-Modified-Since"] = headers["Last-Modified"]
+    with _LOCK:
+        _CATALOG = (catalog, monotonic(), validators)
+    return catalog
+
+
+def validators() -> dict:
+    """Returns headers for a conditional query of the cached catalog (even if it has
+    expired). Returns an empty dict if there is no catalog, or it has no validators"""
+    with _LOCK:
+        if _CATALOG is None:
+            return {}
+        return dict(_CATALOG[2])
+
+
+def renew_catalog() -> Optional[dict]:
+    """Marks the cached catalog as recent and returns it. Used when LFPS confirms that
+    an expired catalog is still current. Returns None if the cache was cleared since
+    the catalog was queried"""
+    global _CATALOG
+    with _LOCK:
+        if _CATALOG is None:
+            return None
+        catalog, _, validators = _CATALOG
+        _CATALOG = (catalog, monotonic(), validators)
+    return catalog
+
+
+#####
+# All
+#####
+
+
+def clear() -> None:
+    "Removes all jobs and product info from the cache"
+    global _CATALOG
+    with _LOCK:
+        _JOBS.clear()
+        _CATALOG = None
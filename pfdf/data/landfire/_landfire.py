@@ -4,32 +4,53 @@ Functions to acquire data from LFPS
 Functions:
     read            - Read data from a LFPS raster dataset as a Raster object
     download        - Downloads a LFPS data product to the local file system
+    download_many   - Concurrently downloads multiple LFPS data products
+    clear_cache     - Removes all cached LFPS jobs and product info
 
 Utilities:
+    _job_url        - Returns the download URL for a completed job
     _execute_job    - Queries a job until it succeeds or times out
     _check_status   - Checks if a job has succeeded
 """
 
 from __future__ import annotations
 
+import os
 import typing
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from tempfile import TemporaryDirectory
 from time import sleep
 
 import pfdf._validate.core as cvalidate
+from pfdf._utils import real
 from pfdf.data._utils import requests, unzip
-from pfdf.data.landfire import _validate, job
-from pfdf.errors import DataAPIError, InvalidLFPSJobError, LFPSJobTimeoutError
+from pfdf.data.landfire import _cache, _validate, job
+from pfdf.errors import (
+    DataAPIError,
+    InvalidLFPSJobError,
+    LFPSJobTimeoutError,
+    MissingLFPSJobError,
+)
 from pfdf.raster import Raster
 
 if typing.TYPE_CHECKING:
     from typing import Optional
 
-    from pfdf.typing.core import Pathlike, timeout
+    from pfdf.typing.core import Pathlike, strs, timeout
     from pfdf.typing.raster import BoundsInput
 
 
+# Status codes for jobs that are still processing
+_RUNNING = frozenset({"Pending", "Executing"})
+
+# Reasons and advice for jobs that did not succeed
+_FAILURES = {
+    "Canceled": ("was cancelled", "Try submitting a new job."),
+    "Failed": ("failed", "Try submitting a new job with different parameters."),
+}
+
+
 #####
 # User Functions
 #####
@@ -42,9 +63,10 @@ def download(
     *,
     parent: Optional[Pathlike] = None,
     name: Optional[str] = None,
-    timeout: Optional[timeout] = 10,
+    timeout: Optional[timeout] = (3.05, 30),
     max_job_time: Optional[float] = 60,
     refresh_rate: float = 15,
+    use_cache: bool = True,
 ) -> Path:
     """
     Download a product from LANDFIRE LFPS
@@ -82,18 +104,28 @@ def download(
     of time - this may be useful for some large queries, but is generally not
     recommended as your code may hang indefinitely if the job is slow.
 
-    After the job has been created, this command will query the API on a fixed interval
-    to check if the job has completed processing. Use the `refresh_rate` option to
-    specify this fixed interval (in seconds - default is every 15 seconds). The refresh
-    rate must be a value between 15 (seconds) and 3600 (1 hour).
+    After the job has been created, this command will query the API to check if the job
+    has completed processing. The first query occurs after 1 second, and the interval
+    between queries then doubles after each query, up to a maximum interval set by the
+    `refresh_rate` option (in seconds - default is 15 seconds). This way, small jobs
+    are detected soon after they finish, while long jobs are not queried excessively.
+    The refresh rate must be a value between 1 (second) and 3600 (1 hour).
 
     Finally, the "timeout" option specifies a maximum time in seconds for connecting to
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
+
+    download(..., *, use_cache=False)
+    By default, this command records the ID of each submitted LFPS job. If you later
+    request the same layer, bounds, and email in the same Python session, the command
+    will reuse the existing job, rather than submitting and waiting for a new one.
+    Cached jobs expire after one hour. Set use_cache=False to always submit a new job.
+    Use the `clear_cache` command to remove all cached jobs.
     ----------
     Inputs:
         layer: The name of a LFPS data layer
@@ -103,9 +135,11 @@ def download(
             Defaults to the current folder.
         name: The name for the downloaded data folder. Defaults to landfire-<layer>
         max_job_time: A maximum allowed time (in seconds) for a job to complete processing
-        refresh_rate: The frequency (in seconds) at which this command should check the
-            status of a submitted job.
+        refresh_rate: The maximum interval (in seconds) between checks of the status
+            of a submitted job.
         timeout: The maximum time in seconds to establish a connection with the LFPS server
+        use_cache: True (default) to reuse matching LFPS jobs from the current session.
+            False to always submit a new job.
 
     Outputs:
         Path: The path to the downloaded data folder
@@ -119,40 +153,140 @@ def download(
     max_job_time = _validate.max_job_time(max_job_time)
     refresh_rate = _validate.refresh_rate(refresh_rate)
 
-    # Submit job. Query status until the job succeeds or times out. Get the download
-    # URL and extract the download ID. (Note that this differs from the processing ID
-    # used to query the job). Download the dataset.
-    id = job.submit(layer, bounds, email, timeout=timeout)
-    url = _execute_job(id, max_job_time, refresh_rate, timeout)
+    # Get the download URL for a completed job, and extract the download ID. (Note
+    # that this differs from the processing ID used to query the job)
+    url = _job_url(layer, bounds, email, max_job_time, refresh_rate, timeout, use_cache)
     id = Path(url).stem
-    data = requests.content(url, {}, timeout, "LANDFIRE LFPS")
 
-    # Unzip the dataset in a temp folder
+    # Stream the zip archive into a temp folder and unzip
     with TemporaryDirectory() as temp:
-        extracted = Path(temp) / "extracted"
-        unzip(data, extracted)
+        temp = Path(temp)
+        archive = temp / "archive.zip"
+        requests.download(archive, url, {}, timeout, "LANDFIRE LFPS")
+        extracted = temp / "extracted"
+        unzip(archive, extracted)
 
         # Replace the job ID in filenames with the download name. Note that the
-        # download job ID is different from the processing job ID used for queries
-        for file in list(extracted.iterdir()):
-            filename = file.name
-            if id in filename:
-                filename = filename.replace(id, path.name)
-                file.rename(extracted / filename)
+        # download job ID is different from the processing job ID used for queries.
+        # Collect the entries first, so renaming does not alter the directory scan
+        stem = path.name
+        with os.scandir(extracted) as entries:
+            files = [entry.name for entry in entries if id in entry.name]
+        for file in files:
+            os.replace(extracted / file, extracted / file.replace(id, stem))
 
         # Also rename the folder and return the final path
-        extracted.rename(path)
+        extracted.replace(path)
     return path
 
 
+def download_many(
+    layers: strs,
+    bounds: BoundsInput,
+    email: str,
+    *,
+    parent: Optional[Pathlike] = None,
+    timeout: Optional[timeout] = (3.05, 30),
+    max_job_time: Optional[float] = 60,
+    refresh_rate: float = 15,
+    max_workers: int = 4,
+    use_cache: bool = True,
+) -> list[Path]:
+    """
+    Concurrently downloads multiple products from LANDFIRE LFPS
+    ----------
+    download_many(layers, bounds, email)
+    Downloads data files for each of the indicated data layers to the local file
+    system. Each layer is processed as a separate LFPS job, and the jobs are submitted,
+    monitored, and downloaded concurrently. As such, the total time is typically
+    similar to the time to download the slowest layer, rather than the sum of the
+    times for all the layers. The `layers` input should be a list of LFPS raster layer
+    names. The `bounds` and `email` inputs are the same as for the `download` command.
+
+    Each layer is downloaded into a folder named "landfire-<layer>" within the current
+    directory. Raises an error if any of these paths already exist, before any jobs
+    are submitted. Returns a list with the path to each downloaded data folder, in the
+    same order as the input layers.
+
+    download_many(..., *, parent)
+    Specifies the parent folder where the data folders should be downloaded. If a
+    relative path, then `parent` is interpreted relative to the current folder.
+
+    download_many(..., *, max_job_time)
+    download_many(..., *, refresh_rate)
+    download_many(..., *, timeout)
+    Timing parameters for each layer's download. These options are the same as for
+    the `download` command, and are applied to each layer individually.
+
+    download_many(..., *, max_workers)
+    Specifies the maximum number of layers that should be processed at the same time.
+    Default is 4.
+
+    download_many(..., *, use_cache=False)
+    By default, this command records the ID of each submitted LFPS job. If you later
+    request the same layer, bounds, and email in the same Python session, the command
+    will reuse the existing job, rather than submitting and waiting for a new one.
+    Cached jobs expire after one hour. Set use_cache=False to always submit a new job.
+    Use the `clear_cache` command to remove all cached jobs.
+    ----------
+    Inputs:
+        layers: The names of the LFPS data layers that should be downloaded
+        bounds: The bounding box in which data should be downloaded
+        email: An email address associated with the data request
+        parent: The path to the parent folder where the data folders should be
+            downloaded. Defaults to the current folder.
+        max_job_time: A maximum allowed time (in seconds) for each job to complete
+            processing
+        refresh_rate: The maximum interval (in seconds) between checks of the status
+            of a submitted job.
+        timeout: The maximum time in seconds to establish a connection with the LFPS server
+        max_workers: The maximum number of layers to process at the same time
+        use_cache: True (default) to reuse matching LFPS jobs from the current session.
+            False to always submit new jobs.
+
+    Outputs:
+        list[Path]: The paths to the downloaded data folders
+    """
+
+    # Validate the layers and the concurrency limit
+    layers = _validate.layers(layers)
+    max_workers = cvalidate.scalar(max_workers, "max_workers", dtype=real)
+    cvalidate.positive(max_workers, "max_workers")
+    cvalidate.integers(max_workers, "max_workers")
+
+    # Check all the output paths before submitting any jobs
+    for layer in layers:
+        cvalidate.download_path(
+            parent, None, default_name=f"landfire-{layer}", overwrite=False
+        )
+
+    # Download each layer in a separate thread. The threads spend most of their time
+    # waiting on the LFPS server, so they can overlap in spite of the GIL.
+    def download_layer(layer: str) -> Path:
+        return download(
+            layer,
+            bounds,
+            email,
+            parent=parent,
+            timeout=timeout,
+            max_job_time=max_job_time,
+            refresh_rate=refresh_rate,
+            use_cache=use_cache,
+        )
+
+    with ThreadPoolExecutor(max_workers=int(max_workers)) as executor:
+        return list(executor.map(download_layer, layers))
+
+
 def read(
     layer: str,
     bounds: BoundsInput,
     email: str,
     *,
-    timeout: Optional[timeout] = 10,
+    timeout: Optional[timeout] = (3.05, 30),
     max_job_time: Optional[float] = 60,
     refresh_rate: float = 15,
+    use_cache: bool = True,
 ) -> Raster:
     """
     Reads a LANDFIRE raster into memory as a Raster object
@@ -177,27 +311,39 @@ def read(
     of time - this may be useful for some large queries, but is generally not
     recommended as your code may hang indefinitely if the job is slow.
 
-    After the job has been created, this command will query the API on a fixed interval
-    to check if the job has completed processing. Use the `refresh_rate` option to
-    specify this fixed interval (in seconds - default is every 15 seconds). The refresh
-    rate must be a value between 15 (seconds) and 3600 (1 hour).
+    After the job has been created, this command will query the API to check if the job
+    has completed processing. The first query occurs after 1 second, and the interval
+    between queries then doubles after each query, up to a maximum interval set by the
+    `refresh_rate` option (in seconds - default is 15 seconds). This way, small jobs
+    are detected soon after they finish, while long jobs are not queried excessively.
+    The refresh rate must be a value between 1 (second) and 3600 (1 hour).
 
     Finally, the "timeout" option specifies a maximum time in seconds for connecting to
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
+
+    read(..., *, use_cache=False)
+    By default, this command records the ID of each submitted LFPS job. If you later
+    request the same layer, bounds, and email in the same Python session, the command
+    will reuse the existing job, rather than submitting and waiting for a new one.
+    Cached jobs expire after one hour. Set use_cache=False to always submit a new job.
+    Use the `clear_cache` command to remove all cached jobs.
     ----------
     Inputs:
         layer: The name of a LFPS data layer
         bounds: The bounding box in which data should be read
         email: An email address associated with the data request
         max_job_time: A maximum allowed time (in seconds) for a job to complete processing
-        refresh_rate: The frequency (in seconds) at which this command should check the
-            status of a submitted job.
+        refresh_rate: The maximum interval (in seconds) between checks of the status
+            of a submitted job.
         timeout: The maximum time in seconds to establish a connection with the LFPS server
+        use_cache: True (default) to reuse matching LFPS jobs from the current session.
+            False to always submit a new job.
 
     Outputs:
         Raster: The queried LANDFIRE raster dataset
@@ -215,6 +361,7 @@ def read(
             timeout=timeout,
             max_job_time=max_job_time,
             refresh_rate=refresh_rate,
+            use_cache=use_cache,
         )
 
         # Ensure the file was a raster
@@ -230,28 +377,84 @@ def read(
         return Raster.from_file(path)
 
 
+def clear_cache() -> None:
+    """
+    Removes all cached LFPS jobs and product info
+    ----------
+    clear_cache()
+    Removes all cached LFPS jobs and product info from the current session. After
+    calling this command, the `download` and `read` commands will submit new jobs for
+    all queries, and the functions in the `products` module will query LFPS for a new
+    product catalog.
+    """
+    _cache.clear()
+
+
 #####
 # Utilities
 #####
 
 
+def _job_url(
+    layer: str,
+    bounds: BoundsInput,
+    email: str,
+    max_job_time: float,
+    refresh_rate: float,
+    timeout: timeout,
+    use_cache: bool,
+) -> str:
+    """Returns the download URL for a completed job. Reuses a cached job if possible,
+    and otherwise submits a new job. Resubmits if a cached job is no longer valid"""
+
+    # Validate the job parameters once, then check for a cached job
+    params = _validate.submit_job(layer, bounds, email)
+    id = None
+    if use_cache:
+        key = _cache.key(params)
+        id = _cache.get(key)
+
+    # Reuse a cached job if possible. Discard the job if it was deleted or failed
+    if id is not None:
+        try:
+            return _execute_job(id, max_job_time, refresh_rate, timeout)
+        except (MissingLFPSJobError, InvalidLFPSJobError):
+            _cache.remove(key)
+
+    # Otherwise, submit a new job and query until it succeeds or times out
+    id = job._submit(params, timeout)
+    if use_cache:
+        _cache.add(key, id)
+    try:
+        return _execute_job(id, max_job_time, refresh_rate, timeout)
+    except (ValueError, InvalidLFPSJobError):
+        if use_cache:
+            _cache.remove(key)
+        raise
+
+
 def _execute_job(
     id: str, max_job_time: float, refresh_rate: float, timeout: timeout
 ) -> dict:
-    "Queries a job until it succeeds or times out"
-
-    # Wait several seconds, then query the job status
-    while max_job_time > 0:
-        sleep(refresh_rate)
+    """Queries a job until it succeeds or times out. Queries use exponential backoff,
+    starting at 1 second and doubling up to a maximum interval of refresh_rate"""
+
+    # Wait a bit, then query the job status
+    delay = min(1, refresh_rate)
+    elapsed = 0
+    while elapsed < max_job_time:
+        wait = min(delay, max_job_time - elapsed)
+        sleep(wait)
+        elapsed += wait
         info = job.status(id, timeout=timeout, strict=True)
         status = _validate.field(info, "status", "job status")
         succeeded = _check_status(id, status)
 
-        # If successful, return the download URL. Otherwise, reduce the timeout clock
+        # If successful, return the download URL. Otherwise, increase the wait time
         if succeeded:
             url = _validate.field(info, "outputFile", '"outputFile" download URL')
             return url
-        max_job_time -= refresh_rate
+        delay = min(2 * delay, refresh_rate)
 
     # Informative error if timed out
     raise LFPSJobTimeoutError(
@@ -265,23 +468,17 @@ def _check_status(id: str, status: str) -> bool:
     "Checks that a job has succeeded, or provides an informative error if it failed"
 
     # Extract completion status. Return boolean for valid status codes
-    if status in ["Pending", "Executing"]:
+    if status in _RUNNING:
         return False
     elif status == "Succeeded":
         return True
 
     # Informative error if the job failed
-    if status == "Canceled":
-        raise InvalidLFPSJobError(
-            f"Cannot download job {id} because the job was cancelled. "
-            f"Try submitting a new job.",
-            id,
-        )
-    elif status == "Failed":
+    failure = _FAILURES.get(status)
+    if failure is not None:
+        reason, advice = failure
         raise InvalidLFPSJobError(
-            f"Cannot download job {id} because the job failed. "
-            f"Try submitting a new job with different parameters.",
-            id,
+            f"Cannot download job {id} because the job {reason}. {advice}", id
         )
     else:
         raise DataAPIError(
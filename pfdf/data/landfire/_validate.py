@@ -3,7 +3,8 @@ Functions that validate LFPS query parameters
 ----------
 Individual inputs:
     layer           - Checks an input represents a single data layer
-    job_time        - Ensures a timing parameter is a number greater than 15
+    layers          - Checks an input represents a list of unique single data layers
+    job_time        - Ensures a timing parameter is a number above a minimum
     max_job_time    - Checks an input represents the maximum job time
     refresh_rate    - Checks an input represents a refresh rate
 
@@ -21,7 +22,7 @@ import typing
 from math import inf
 
 import pfdf._validate.core as cvalidate
-from pfdf._utils import real
+from pfdf._utils import aslist, real
 from pfdf.data._utils import validate
 from pfdf.errors import MissingAPIFieldError
 
@@ -43,10 +44,21 @@ def layer(layer: Any) -> str:
     return layer
 
 
-def job_time(time: Any, name: str) -> float:
-    "Ensures a job querying parameter is a float >= 15 (seconds)"
+def layers(layers: Any) -> list[str]:
+    "Checks an input represents a list of unique single data layers"
+
+    layers = aslist(layers)
+    for k, name in enumerate(layers):
+        layers[k] = layer(name)
+    if len(set(layers)) != len(layers):
+        raise ValueError("layers cannot contain duplicate layer names")
+    return layers
+
+
+def job_time(time: Any, name: str, min: float = 15) -> float:
+    "Ensures a job querying parameter is a float >= a minimum (default 15 seconds)"
     time = cvalidate.scalar(time, name, dtype=real)
-    cvalidate.inrange(time, name, min=15)
+    cvalidate.inrange(time, name, min=min)
     return float(time)
 
 
@@ -58,7 +70,7 @@ def max_job_time(time: Any) -> float:
 
 
 def refresh_rate(time: Any) -> float:
-    time = job_time(time, "refresh_rate")
+    time = job_time(time, "refresh_rate", min=1)
     if time > 3600:
         raise ValueError("refresh_rate cannot be greater than 3600 seconds (1 hour)")
     return time
@@ -8,31 +8,47 @@ you can query a job's status using the `query` or `status` commands. Once comple
 job will contain the zip archive download URL in the JSON response.
 ----------
 Functions:
-    submit      - Submits a job to LANDFIRE LFPS and returns the job ID
-    status      - Queries the status of an LFPS job and returns the JSON response
-    status_code - Returns the status code of a queried LFPS job
+    submit        - Submits a job to LANDFIRE LFPS and returns the job ID
+    status        - Queries the status of an LFPS job and returns the JSON response
+    status_code   - Returns the status code of a queried LFPS job
+    poll          - Waits for an LFPS job to finish and returns its final status code
 
 Internal:
-    _job_error  - Returns an informative error for a failed job status query
+    _submit       - Submits a job using validated submission parameters
+    _poll_time    - Checks that a polling time option is a positive scalar
+    _job_error    - Returns an informative error for a failed job status query
+    _missing_job  - Returns an informative error for a job missing from LFPS
 """
 
 from __future__ import annotations
 
 import typing
+from random import uniform
+from time import monotonic, sleep
 
+import pfdf._validate.core as cvalidate
+from pfdf._utils import real
 from pfdf.data._utils import requests
 from pfdf.data.landfire import _validate, url
-from pfdf.errors import DataAPIError
+from pfdf.errors import DataAPIError, LFPSJobTimeoutError, MissingLFPSJobError
 
 if typing.TYPE_CHECKING:
-    from typing import Optional
+    from typing import Any, Optional
 
     from pfdf.typing.core import strs, timeout
     from pfdf.typing.raster import BoundsInput
 
 
+# Status codes for jobs that are no longer processing
+_FINAL = frozenset({"Succeeded", "Failed", "Canceled"})
+
+
 def submit(
-    layers: strs, bounds: BoundsInput, email: str, *, timeout: Optional[timeout] = 10
+    layers: strs,
+    bounds: BoundsInput,
+    email: str,
+    *,
+    timeout: Optional[timeout] = (3.05, 30),
 ) -> str:
     """
     Submits a job to LFPS and returns the job ID
@@ -53,6 +69,7 @@ def submit(
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -67,13 +84,13 @@ def submit(
         str: The ID of the newly submitted job
     """
 
-    base_url = url.job("submit")
     params = _validate.submit_job(layers, bounds, email)
-    response = requests.json(base_url, params, timeout, "LANDFIRE LFPS")
-    return _validate.field(response, "jobId", "job ID")
+    return _submit(params, timeout)
 
 
-def status(id: str, *, timeout: Optional[timeout] = 10, strict: bool = True) -> dict:
+def status(
+    id: str, *, timeout: Optional[timeout] = (3.05, 30), strict: bool = True
+) -> dict:
     """
     Queries an LFPS job's status and returns the JSON response
     ----------
@@ -88,6 +105,7 @@ def status(id: str, *, timeout: Optional[timeout] = 10, strict: bool = True) ->
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -108,12 +126,12 @@ def status(id: str, *, timeout: Optional[timeout] = 10, strict: bool = True) ->
     job = requests.json(base_url, params, timeout, "LANDFIRE LFPS")
 
     # Optionally stop if there were errors
-    if strict and "success" in job and job["success"] == False:
+    if strict and job.get("success") is False:
         raise _job_error(job, id)
     return job
 
 
-def status_code(id: str, *, timeout: Optional[timeout] = 10) -> str:
+def status_code(id: str, *, timeout: Optional[timeout] = (3.05, 30)) -> str:
     """
     Returns the status code of a queried LFPS job
     ----------
@@ -127,6 +145,7 @@ def status_code(id: str, *, timeout: Optional[timeout] = 10) -> str:
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -143,31 +162,144 @@ def status_code(id: str, *, timeout: Optional[timeout] = 10) -> str:
     return _validate.field(job, "status", "job status code")
 
 
-def _job_error(job: dict, id: str) -> ValueError | DataAPIError:
-    "Returns an informative error for a failed job status query"
+def poll(
+    id: str,
+    *,
+    interval: float = 2,
+    max_interval: float = 30,
+    jitter: float = 0.25,
+    max_job_time: Optional[float] = None,
+    timeout: Optional[timeout] = (3.05, 30),
+) -> str:
+    """
+    Waits for an LFPS job to finish and returns its final status code
+    ----------
+    poll(id)
+    Repeatedly queries the status code of an LFPS job until the job reaches a final
+    state, and then returns the final status code. This will be one of the following
+    strings: Succeeded, Failed, or Canceled. This is the recommended way to wait for a
+    submitted job to finish. Raises an error if the job ID does not exist on the LFPS
+    system.
+
+    poll(..., *, interval)
+    poll(..., *, max_interval)
+    poll(..., *, jitter)
+    Options for the time between status queries. The first query occurs immediately.
+    The command then waits `interval` seconds (default = 2) before the next query, and
+    the wait increases by 50% after each query, up to a maximum of `max_interval`
+    seconds (default = 30). This way, short jobs are detected soon after they finish,
+    while long jobs are not queried excessively. Each wait also adds a random delay of
+    up to `jitter` seconds (default = 0.25), so that many concurrent pollers do not
+    query the server in lockstep.
+
+    poll(..., *, max_job_time)
+    Specifies the maximum number of seconds that this command should wait for the job
+    to finish. Raises a LFPSJobTimeoutError if the job exceeds this limit. By default,
+    waits for any amount of time.
+
+    poll(..., *, timeout)
+    Specifies a maximum time in seconds for connecting to
+    the LFPS server. This option is typically a scalar, but may also use a vector with
+    two elements. In this case, the first value is the timeout to connect with the
+    server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
+    You can also set timeout to None, in which case API queries will never time out.
+    This may be useful for some slow connections, but is generally not recommended as
+    your code may hang indefinitely if the server fails to respond.
+    ----------
+    Inputs:
+        id: An LFPS job ID
+        interval: The initial number of seconds between status queries
+        max_interval: The maximum number of seconds between status queries
+        jitter: The maximum number of seconds of random delay added to each wait
+        max_job_time: The maximum number of seconds to wait for the job to finish
+        timeout: The maximum time in seconds to establish a connection with the LFPS server
+
+    Outputs:
+        str: The final status code of the job
+    """
 
-    # Parse any job messages
-    if "message" in job and isinstance(job["message"], str):
-        message = job["message"]
-
-        # Informative error if the job is missing
-        if message == "JobId not found":
-            return ValueError(
-                f"The queried job ({id}) could not be found on the LFPS server.\n"
-                f"Try checking that the job ID is spelled correctly.\n"
-                f"If you submitted the job a while ago, "
-                f"then the job may have been deleted."
-            )
-
-        # Otherwise, provide as much error info as possible
-        else:
-            return DataAPIError(
-                f"LANDFIRE LFPS reported the following error in the API query "
-                f"for job {id}:\n{message}",
-            )
+    # Validate the timing options
+    interval = _poll_time(interval, "interval", allow_zero=False)
+    max_interval = _poll_time(max_interval, "max_interval", allow_zero=False)
+    jitter = _poll_time(jitter, "jitter", allow_zero=True)
+    if max_job_time is not None:
+        max_job_time = _poll_time(max_job_time, "max_job_time", allow_zero=False)
+
+    # Query until the job reaches a final state or times out
+    start = monotonic()
+    while True:
+        code = status_code(id, timeout=timeout)
+        if code in _FINAL:
+            return code
+
+        # Wait before the next query, but not past the maximum job time
+        wait = min(interval, max_interval) + uniform(0, jitter)
+        if max_job_time is not None:
+            elapsed = monotonic() - start
+            if elapsed >= max_job_time:
+                raise LFPSJobTimeoutError(
+                    f"LANDFIRE LFPS took too long to process job {id}.", id
+                )
+            wait = min(wait, max_job_time - elapsed)
+
+        # Increase the wait time for the next query
+        sleep(wait)
+        interval *= 1.5
+
+
+#####
+# Internal
+#####
+
+
+def _submit(params: dict, timeout: timeout) -> str:
+    "Submits a job using validated submission parameters. Returns the job ID"
+
+    # Don't retry gateway errors, as LFPS may have already queued the job
+    base_url = url.job("submit")
+    response = requests.json(base_url, params, timeout, "LANDFIRE LFPS", retry=False)
+    return _validate.field(response, "jobId", "job ID")
+
+
+def _poll_time(time: Any, name: str, allow_zero: bool) -> float:
+    "Checks that a polling time option is a positive scalar"
+    time = cvalidate.scalar(time, name, dtype=real)
+    cvalidate.positive(time, name, allow_zero=allow_zero)
+    return float(time)
+
+
+def _job_error(job: dict, id: str) -> DataAPIError:
+    "Returns an informative error for a failed job status query"
 
     # If there's no message, just indicate that an error occurred
-    else:
+    message = job.get("message")
+    if not isinstance(message, str):
         return DataAPIError(
             f"LANDFIRE LFPS reported an error in the API query for job {id}"
         )
+
+    # Informative error for known messages. Otherwise, provide as much error info
+    # as possible
+    elif message in _KNOWN_ERRORS:
+        return _KNOWN_ERRORS[message](id)
+    else:
+        return DataAPIError(
+            f"LANDFIRE LFPS reported the following error in the API query "
+            f"for job {id}:\n{message}",
+        )
+
+
+def _missing_job(id: str) -> MissingLFPSJobError:
+    "Returns an informative error for a job that is not on the LFPS server"
+    return MissingLFPSJobError(
+        f"The queried job ({id}) could not be found on the LFPS server.\n"
+        f"Try checking that the job ID is spelled correctly.\n"
+        f"If you submitted the job a while ago, "
+        f"then the job may have been deleted.",
+        id,
+    )
+
+
+# Builds informative errors for known job status query failure messages
+_KNOWN_ERRORS = {"JobId not found": _missing_job}
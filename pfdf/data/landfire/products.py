@@ -10,12 +10,20 @@ determine the latest version of a given product using the `latest` function.
 ----------
 General Queries:
     query       - Returns information about queried LANDFIRE layers
+    query_many  - Returns information about the layers for multiple acronyms
     acronyms    - Returns a list of supported product acronyms
     layers      - Returns the names of queried LANDFIRE layers
 
 Specific Layers:
     latest      - Returns info of the latest version of a specific product
     layer       - Returns info on a queried layer
+    layers_info - Returns info on multiple queried layers
+
+Internal:
+    _version    - Returns a sort key for a product's version string
+    _catalog    - Returns the indexed LFPS product catalog
+    _layer      - Returns the product info for a validated layer name
+    _copy       - Returns copies of cached product info dicts
 """
 
 from __future__ import annotations
@@ -23,17 +31,18 @@ from __future__ import annotations
 import typing
 
 import pfdf._validate.core as cvalidate
+from pfdf._utils import aslist
 from pfdf.data._utils import requests
-from pfdf.data.landfire import _validate, url
+from pfdf.data.landfire import _cache, _validate, url
 
 if typing.TYPE_CHECKING:
     from typing import Optional
 
-    from pfdf.typing.core import timeout
+    from pfdf.typing.core import strs, timeout
 
 
 def query(
-    acronym: Optional[str] = None, *, timeout: Optional[timeout] = 10
+    acronym: Optional[str] = None, *, timeout: Optional[timeout] = (3.05, 30)
 ) -> list[dict]:
     """
     Returns information about available LANDFIRE layers
@@ -45,11 +54,18 @@ def query(
     on products matching the specified acronym. You can retrieve a list of supported
     acronyms using the `acronyms` function.
 
+    The LFPS product catalog changes rarely, so this command reuses the catalog from
+    any query made within the last 10 minutes, rather than querying LFPS again. After
+    10 minutes, the command asks LFPS whether the catalog has changed, and only
+    downloads the catalog again if it has. Use `pfdf.data.landfire.clear_cache` to
+    force a new query.
+
     query(..., *, timeout)
     The "timeout" option specifies a maximum time in seconds for connecting to
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -62,23 +78,58 @@ def query(
         list[dict]: A list of product info dicts
     """
 
-    # Make the request
-    base_url = url.products()
-    products = requests.json(base_url, {}, timeout, "LANDFIRE LFPS")
-    products = _validate.field(products, "products", '"products" field')
+    # Get the product catalog. Return copies so the cache cannot be altered
+    catalog = _catalog(timeout)
+    if acronym is None:
+        return _copy(catalog["products"])
+
+    # Optionally filter by acronym
+    cvalidate.string(acronym, "acronym")
+    return _copy(catalog["acronyms"].get(acronym.lower(), []))
+
+
+def query_many(
+    acronyms: strs, *, timeout: Optional[timeout] = (3.05, 30)
+) -> list[list[dict]]:
+    """
+    Returns information about the LANDFIRE layers for multiple acronyms
+    ----------
+    query_many(acronyms)
+    Returns the product info dicts for the LANDFIRE layers matching each of the input
+    acronyms. The output is a list with one element per acronym, in the same order as
+    the input acronyms. Each element is the list of product info dicts that would be
+    returned by calling `query` with that acronym. All the acronyms are matched against
+    a single product catalog, so this requires at most one LFPS query.
+
+    query_many(..., *, timeout)
+    Specifies a maximum time in seconds for connecting to
+    the LFPS server. This option is typically a scalar, but may also use a vector with
+    two elements. In this case, the first value is the timeout to connect with the
+    server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
+    You can also set timeout to None, in which case API queries will never time out.
+    This may be useful for some slow connections, but is generally not recommended as
+    your code may hang indefinitely if the server fails to respond.
+    ----------
+    Inputs:
+        acronyms: A list of product acronyms used to filter product info results
+        timeout: The maximum time in seconds to establish a connection with the LFPS server
 
-    # Optionally sort by acronym
-    if acronym is not None:
+    Outputs:
+        list[list[dict]]: The list of product info dicts for each acronym
+    """
+
+    # Validate before querying
+    acronyms = aslist(acronyms)
+    for acronym in acronyms:
         cvalidate.string(acronym, "acronym")
-        products = [
-            product
-            for product in products
-            if product["acronym"].lower() == acronym.lower()
-        ]
-    return products
+
+    # Filter a single catalog by each acronym
+    index = _catalog(timeout)["acronyms"]
+    return [_copy(index.get(acronym.lower(), [])) for acronym in acronyms]
 
 
-def acronyms(*, timeout: Optional[timeout] = 10) -> list[str]:
+def acronyms(*, timeout: Optional[timeout] = (3.05, 30)) -> list[str]:
     """
     Returns the list of product acronyms supported by LANDFIRE LFPS
     ----------
@@ -91,6 +142,7 @@ def acronyms(*, timeout: Optional[timeout] = 10) -> list[str]:
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -102,17 +154,14 @@ def acronyms(*, timeout: Optional[timeout] = 10) -> list[str]:
         list[str]: The list of product acronyms supported by LFPS
     """
 
-    products = query(timeout=timeout)
-    acronyms = []
-    for product in products:
-        acronym = product["acronym"]
-        if acronym not in acronyms:
-            acronyms.append(acronym)
-    return acronyms
+    # Remove duplicates in order of first appearance. Compare exact acronyms, so that
+    # acronyms that only differ by case are kept separate
+    products = _catalog(timeout)["products"]
+    return list(dict.fromkeys(product["acronym"] for product in products))
 
 
 def layers(
-    acronym: Optional[str] = None, *, timeout: Optional[timeout] = 10
+    acronym: Optional[str] = None, *, timeout: Optional[timeout] = (3.05, 30)
 ) -> list[str]:
     """
     Returns the names of LANDFIRE layers
@@ -129,6 +178,7 @@ def layers(
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -145,7 +195,7 @@ def layers(
     return [product["layerName"] for product in products]
 
 
-def latest(acronym: str, *, timeout: Optional[timeout] = 10) -> dict:
+def latest(acronym: str, *, timeout: Optional[timeout] = (3.05, 30)) -> dict:
     """
     Returns info on the latest version of a specific product
     ----------
@@ -158,6 +208,7 @@ def latest(acronym: str, *, timeout: Optional[timeout] = 10) -> dict:
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -178,15 +229,10 @@ def latest(acronym: str, *, timeout: Optional[timeout] = 10) -> dict:
         )
 
     # Return the most recent version
-    version = "0"
-    for layer in layers:
-        if layer["version"] > version:
-            latest = layer
-            version = latest["version"]
-    return latest
+    return max(layers, key=_version)
 
 
-def layer(layer: str, *, timeout: Optional[timeout] = 10) -> dict:
+def layer(layer: str, *, timeout: Optional[timeout] = (3.05, 30)) -> dict:
     """
     Returns the product info dict for a queried layer
     ----------
@@ -198,6 +244,7 @@ def layer(layer: str, *, timeout: Optional[timeout] = 10) -> dict:
     the LFPS server. This option is typically a scalar, but may also use a vector with
     two elements. In this case, the first value is the timeout to connect with the
     server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
@@ -210,17 +257,100 @@ def layer(layer: str, *, timeout: Optional[timeout] = 10) -> dict:
         dict: The product info dict for the queried layer
     """
 
-    # Validate. Use lower case layer name for case-insensitive matching
     cvalidate.string(layer, "layer")
-    layer = layer.lower()
+    return _layer(_catalog(timeout), layer)
+
 
-    # Return the matching layer
-    products = query(timeout=timeout)
-    for product in products:
-        if product["layerName"].lower() == layer:
-            return product
+def layers_info(layers: strs, *, timeout: Optional[timeout] = (3.05, 30)) -> list[dict]:
+    """
+    Returns the product info dicts for multiple queried layers
+    ----------
+    layers_info(layers)
+    Returns the product info dicts for the queried LANDFIRE layers, in the same order
+    as the input layer names. All the layers are matched against a single product
+    catalog, so this requires at most one LFPS query. Raises an error if any of the
+    layers cannot be found.
 
-    # Informative error if nothing was found
-    raise ValueError(
-        f'There are no LANDFIRE LFPS products matching the "{layer}" layer name'
+    layers_info(..., *, timeout)
+    Specifies a maximum time in seconds for connecting to
+    the LFPS server. This option is typically a scalar, but may also use a vector with
+    two elements. In this case, the first value is the timeout to connect with the
+    server, and the second value is the time for the server to return the first byte.
+    By default, allows 3.05 seconds to connect and 30 seconds for the first byte.
+    You can also set timeout to None, in which case API queries will never time out.
+    This may be useful for some slow connections, but is generally not recommended as
+    your code may hang indefinitely if the server fails to respond.
+    ----------
+    Inputs:
+        layers: The names of the LANDFIRE layers whose info should be returned
+        timeout: The maximum time in seconds to establish a connection with the LFPS server
+
+    Outputs:
+        list[dict]: The product info dicts for the queried layers
+    """
+
+    # Validate before querying
+    layers = aslist(layers)
+    for layer in layers:
+        cvalidate.string(layer, "layer")
+
+    # Match each layer against a single catalog
+    catalog = _catalog(timeout)
+    return [_layer(catalog, layer) for layer in layers]
+
+
+#####
+# Internal
+#####
+
+
+def _version(product: dict) -> tuple:
+    """Returns a sort key for a product's version string. Compares dot-separated
+    segments numerically, so that (for example) version 2.10.0 is newer than 2.9.0.
+    Any non-numeric segments sort before numeric segments, and by text otherwise"""
+    segments = str(product["version"]).split(".")
+    return tuple(
+        (1, int(segment)) if segment.isdigit() else (0, segment) for segment in segments
     )
+
+
+def _catalog(timeout: timeout) -> dict:
+    "Returns the indexed LFPS product catalog, reusing a recent catalog if possible"
+
+    # Use a recent catalog if available
+    catalog = _cache.catalog()
+    if catalog is not None:
+        return catalog
+
+    # Otherwise, make the request. If there is an expired catalog, only download the
+    # catalog if it has changed. Reuse the expired catalog if it has not
+    base_url = url.products()
+    headers = _cache.validators()
+    response = requests.get(base_url, {}, timeout, "LANDFIRE LFPS", headers=headers)
+    if response.status_code == 304:
+        catalog = _cache.renew_catalog()
+        if catalog is not None:
+            return catalog
+
+        # If the cache was cleared during the query, download the full catalog
+        response = requests.get(base_url, {}, timeout, "LANDFIRE LFPS")
+
+    # Index and cache the new catalog
+    products = requests.parse_json(response, "LANDFIRE LFPS")
+    products = _validate.field(products, "products", '"products" field')
+    return _cache.set_catalog(products, response.headers)
+
+
+def _layer(catalog: dict, layer: str) -> dict:
+    "Returns the product info for a validated layer name (case-insensitive)"
+    product = catalog["layers"].get(layer.lower())
+    if product is None:
+        raise ValueError(
+            f'There are no LANDFIRE LFPS products matching the "{layer}" layer name'
+        )
+    return dict(product)
+
+
+def _copy(products: list[dict]) -> list[dict]:
+    "Returns copies of cached product info dicts, so that callers cannot alter the cache"
+    return [dict(product) for product in products]
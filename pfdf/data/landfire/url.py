@@ -13,9 +13,6 @@ Base URLs:
 Jobs:
     submit_job  - Returns the URL used to submit a job
     job_status  - Returns the URL used to query a job's status
-
-Internal:
-    _query  - Returns the base URL for a specific API query
 """
 
 from __future__ import annotations
@@ -34,6 +31,17 @@ if typing.TYPE_CHECKING:
 
     JobAction = Literal["cancel", "status", "submit"]
 
+# The base URL of the LFPS API
+_API = "https://lfps.usgs.gov/api"
+
+# Supported job actions
+_JOB_ACTIONS = ("cancel", "status", "submit")
+
+# Complete base URLs for product and job queries
+_PRODUCTS = f"{_API}/products"
+_JOB = f"{_API}/job"
+_JOB_URLS = {action: f"{_JOB}/{action}" for action in _JOB_ACTIONS}
+
 
 #####
 # Base URLs
@@ -50,12 +58,7 @@ def api() -> str:
     Outputs:
         str: The API URL
     """
-    return "https://lfps.usgs.gov/api"
-
-
-def _query(query: str) -> str:
-    "Returns the base URL for a given API query"
-    return f"{api()}/{query}"
+    return _API
 
 
 def products() -> str:
@@ -68,7 +71,7 @@ def products() -> str:
     Outputs:
         str: The base URL
     """
-    return _query("products")
+    return _PRODUCTS
 
 
 def job(action: Optional[JobAction] = None) -> str:
@@ -89,13 +92,11 @@ def job(action: Optional[JobAction] = None) -> str:
         str: The base URL for a job query
     """
 
-    url = _query("job")
-    if action is not None:
-        action = cvalidate.option(
-            action, "action", allowed=["cancel", "status", "submit"]
-        )
-        url = f"{url}/{action}"
-    return url
+    if action is None:
+        return _JOB
+    elif action not in _JOB_ACTIONS:
+        action = cvalidate.option(action, "action", allowed=_JOB_ACTIONS)
+    return _JOB_URLS[action]
 
 
 #####
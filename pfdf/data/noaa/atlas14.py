@@ -7,21 +7,36 @@ file with PFEs at a given lat-lon coordinate. This module also provides commands
 return API URLs, which advanced users may find useful for generating custom queries.
 ----------
 Data:
-    download    - Downloads a .csv file of precipitation frequency estimates for a coordinate
+    download        - Downloads a .csv file of PFEs for a coordinate
+    download_many   - Concurrently downloads .csv files of PFEs for multiple coordinates
 
 URLs:
-    base_url    - Returns the base URL for the NOAA Atlas 14 data API
-    query_url   - Returns the URL used to query NOAA Atlas 14 for a specific PFE statistic
+    base_url        - Returns the base URL for the NOAA Atlas 14 data API
+    query_url       - Returns the URL used to query NOAA Atlas 14 for a PFE statistic
 
 Internal:
     _validate_statistic - Checks a PFE statistic is valid
+    _download           - Downloads the PFEs for a point using validated options
+    _coverage_error     - Returns an error for a location outside the project areas
+    _validate_cache     - Checks a cache folder option is valid
+    _default_cache      - Returns the default cache folder
+    _cache_file         - Returns the path to the cached response for a query
+    _is_recent          - Checks whether a cached response exists and has not expired
+    _add_to_cache       - Atomically adds a response to the cache folder
 
 """
 
 from __future__ import annotations
 
+import os
+import re
 import typing
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import blake2b
 from pathlib import Path
+from shutil import copyfile
+from tempfile import NamedTemporaryFile
+from time import time
 
 import pfdf._validate.core as validate
 from pfdf._utils import real
@@ -30,13 +45,41 @@ from pfdf.data._utils import requests
 if typing.TYPE_CHECKING:
     from typing import Any, Literal, Optional
 
-    from pfdf.typing.core import Pathlike, scalar, timeout
+    from pfdf.typing.core import Pathlike, scalar, timeout, vector
 
     Statistic = Literal["mean", "upper", "lower", "all"]
     Data = Literal["depth", "intensity"]
     Series = Literal["pds", "ams"]
     Units = Literal["metric", "english"]
 
+# Supported data options
+_STATISTICS = ("mean", "upper", "lower", "all")
+_DATA = ("depth", "intensity")
+_SERIES = ("pds", "ams")
+_UNITS = ("metric", "english")
+
+# The base URL of the PFDS data API
+_BASE_URL = "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new"
+
+# The file key used to query each PFE statistic, and the resulting query URLs
+_STATISTIC_KEYS = {"mean": "_mean", "upper": "_uppr", "lower": "_lwr", "all": ""}
+_QUERY_URLS = {
+    statistic: f"{_BASE_URL}/fe_text{key}.csv"
+    for statistic, key in _STATISTIC_KEYS.items()
+}
+
+# Detects PFDS responses for locations outside the Atlas 14 project areas
+_ERROR_SENTINELS = re.compile(rb"result = 'none'|Error 3\.0")
+
+# Extracts the error message from an invalid PFDS response
+_ERROR_MESSAGE = re.compile(r"ErrorMsg\s*=\s*'([^']*)'")
+
+# Maximum age (in seconds) of a cached PFDS response
+_CACHE_AGE = 30 * 24 * 3600
+
+# Name of the default cache folder within the user's cache directory
+_CACHE_FOLDER = Path("pfdf") / "noaa-atlas14"
+
 
 def base_url() -> str:
     """
@@ -48,15 +91,13 @@ def base_url() -> str:
     Outputs:
         str: The base URL for the NOAA Atlas 14 data API
     """
-    return "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new"
+    return _BASE_URL
 
 
 def _validate_statistic(statistic: Any) -> str:
     "Checks that a statistic option is valid"
 
-    return validate.option(
-        statistic, "statistic", allowed=["mean", "upper", "lower", "all"]
-    )
+    return validate.option(statistic, "statistic", allowed=_STATISTICS)
 
 
 def query_url(statistic: Statistic = "mean") -> str:
@@ -79,19 +120,8 @@ def query_url(statistic: Statistic = "mean") -> str:
         str: The URL used to query the indicated PFE statistic
     """
 
-    # Get the statistic file key
     statistic = _validate_statistic(statistic)
-    if statistic == "mean":
-        key = "_mean"
-    elif statistic == "upper":
-        key = "_uppr"
-    elif statistic == "lower":
-        key = "_lwr"
-    else:
-        key = ""
-
-    # Build the query url
-    return f"{base_url()}/fe_text{key}.csv"
+    return _QUERY_URLS[statistic]
 
 
 def download(
@@ -109,6 +139,7 @@ def download(
     units: Units = "metric",
     # HTTP
     timeout: Optional[timeout] = 10,
+    cache: Optional[bool | Pathlike] = None,
 ) -> Path:
     """
     Downloads a .csv file with precipitation frequency estimates for a given point
@@ -170,6 +201,15 @@ def download(
     You can also set timeout to None, in which case API queries will never time out.
     This may be useful for some slow connections, but is generally not recommended as
     your code may hang indefinitely if the server fails to respond.
+
+    download(..., *, cache)
+    Specifies a folder used to cache PFDS responses. If the folder holds a response
+    for the same point and data options that is less than 30 days old, then copies
+    the cached response to the download path, rather than querying NOAA. Otherwise,
+    queries NOAA and adds the response to the cache. The folder is created if it does
+    not exist. Set cache=True to use a "pfdf/noaa-atlas14" folder in the user's cache
+    directory ($XDG_CACHE_HOME, or ~/.cache if that is not set). By default, responses
+    are not cached.
     ----------
     Inputs:
         lat: The latitude of the query point in decimal degrees
@@ -187,6 +227,8 @@ def download(
             "pds" (partial duration), and "ams" (annual maximum).
         units: The units that PFE values should use. Options are "metric" and "english"
         timeout: The maximum number of seconds to connect with the data server
+        cache: A folder used to cache PFDS responses, or True to use the default
+            cache folder
 
     Outputs:
         Path: The Path to the downloaded data file
@@ -197,9 +239,11 @@ def download(
     validate.inrange(lat, "lat", -90, 90)
     lon = validate.scalar(lon, "lon", dtype=real)
     validate.inrange(lon, "lon", -180, 180)
-    data = validate.option(data, "data", allowed=["depth", "intensity"])
-    series = validate.option(series, "series", allowed=["pds", "ams"])
-    units = validate.option(units, "units", allowed=["metric", "english"])
+    statistic = _validate_statistic(statistic)
+    data = validate.option(data, "data", allowed=_DATA)
+    series = validate.option(series, "series", allowed=_SERIES)
+    units = validate.option(units, "units", allowed=_UNITS)
+    cache = _validate_cache(cache)
 
     # Validate the output path
     path = validate.download_path(
@@ -210,6 +254,23 @@ def download(
     )
 
     # Download the dataset
+    return _download(lat, lon, path, statistic, data, series, units, timeout, cache)
+
+
+def _download(
+    lat: scalar,
+    lon: scalar,
+    path: Path,
+    statistic: str,
+    data: str,
+    series: str,
+    units: str,
+    timeout: Optional[timeout],
+    cache: Path | None,
+) -> Path:
+    "Downloads the PFEs for a point using validated options"
+
+    # Build the query parameters
     params = {
         "lat": float(lat),
         "lon": float(lon),
@@ -218,32 +279,218 @@ def download(
         "units": units,
     }
 
+    # Reuse a recent cached response if possible
+    if cache is not None:
+        cached = _cache_file(cache, statistic, params)
+        if _is_recent(cached):
+            copyfile(cached, path)
+            return path
+
     # Get response content
-    response_content = requests.content(query_url(statistic), params, timeout, "NOAA PFDS")
-
-    # Validate response - check if location is not within a project area
-    response_text = response_content.decode('utf-8', errors='ignore')
-    if "result = 'none'" in response_text or "Error 3.0" in response_text:
-        # Extract error message if present
-        if "ErrorMsg" in response_text:
-            # Parse error message from JavaScript: ErrorMsg = 'Error 3.0: ...'
-            error_msg = "Location is not within an Atlas 14 project area"
-            if "Error 3.0:" in response_text:
-                # Try to extract the actual message
-                import re
-                match = re.search(r"ErrorMsg\s*=\s*'([^']*)'", response_text)
-                if match:
-                    error_msg = match.group(1)
-        else:
-            error_msg = "Location is not within an Atlas 14 project area"
-
-        raise ValueError(
-            f"NOAA Atlas 14 data is not available for this location "
-            f"(lat={lat}, lon={lon}). {error_msg}. "
-            f"Atlas 14 coverage varies by region - some areas like Oregon and Washington "
-            f"do not have Atlas 14 precipitation frequency estimates available."
-        )
+    content = requests.content(_QUERY_URLS[statistic], params, timeout, "NOAA PFDS")
 
-    # Response is valid, write to file
-    path.write_bytes(response_content)
+    # Check if the location is not within a project area. Check the raw bytes in a
+    # single pass, so that valid responses are never decoded
+    if _ERROR_SENTINELS.search(content):
+        raise _coverage_error(content, lat, lon)
+
+    # Response is valid, write to file. Optionally cache
+    path.write_bytes(content)
+    if cache is not None:
+        _add_to_cache(cached, content)
     return path
+
+
+def _coverage_error(content: bytes, lat: float, lon: float) -> ValueError:
+    "Returns an informative error for a location outside the Atlas 14 project areas"
+
+    # Parse the error message from JavaScript if present: ErrorMsg = 'Error 3.0: ...'
+    message = "Location is not within an Atlas 14 project area"
+    text = content.decode("utf-8", errors="ignore")
+    if "Error 3.0:" in text:
+        match = _ERROR_MESSAGE.search(text)
+        if match:
+            message = match.group(1)
+
+    return ValueError(
+        f"NOAA Atlas 14 data is not available for this location "
+        f"(lat={lat}, lon={lon}). {message}. "
+        f"Atlas 14 coverage varies by region - some areas like Oregon and Washington "
+        f"do not have Atlas 14 precipitation frequency estimates available."
+    )
+
+
+def _validate_cache(cache: Any) -> Path | None:
+    "Checks a cache folder option is valid"
+    if cache is None or cache is False:
+        return None
+    elif cache is True:
+        return _default_cache()
+    elif isinstance(cache, str):
+        cache = Path(cache)
+    validate.type(cache, "cache", Path, "path")
+    return cache.resolve()
+
+
+def _default_cache() -> Path:
+    "Returns the default cache folder within the user's cache directory"
+    parent = os.environ.get("XDG_CACHE_HOME")
+    if parent:
+        parent = Path(parent)
+    else:
+        parent = Path.home() / ".cache"
+    return (parent / _CACHE_FOLDER).resolve()
+
+
+def _cache_file(cache: Path, statistic: str, params: dict) -> Path:
+    "Returns the path to the cached response for a set of validated query parameters"
+    key = (
+        f"{params['lat']:.6f}|{params['lon']:.6f}|{statistic}|"
+        f"{params['data']}|{params['series']}|{params['units']}"
+    )
+    name = blake2b(key.encode(), digest_size=16).hexdigest()
+    return cache / f"{name}.csv"
+
+
+def _is_recent(file: Path) -> bool:
+    "Checks whether a cached response exists and has not expired"
+    try:
+        modified = file.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    return time() - modified <= _CACHE_AGE
+
+
+def _add_to_cache(file: Path, content: bytes) -> None:
+    """Atomically adds a response to the cache folder, so that concurrent downloads
+    never read a partially written response"""
+    file.parent.mkdir(parents=True, exist_ok=True)
+    temp = NamedTemporaryFile(dir=file.parent, delete=False)
+    try:
+        with temp:
+            temp.write(content)
+        os.replace(temp.name, file)
+
+    # Don't leave partial responses in the cache folder
+    except BaseException:
+        Path(temp.name).unlink(missing_ok=True)
+        raise
+
+
+def download_many(
+    lats: vector,
+    lons: vector,
+    *,
+    # Path
+    parent: Optional[Pathlike] = None,
+    overwrite: bool = False,
+    # Data
+    statistic: Statistic = "mean",
+    data: Data = "intensity",
+    series: Series = "pds",
+    units: Units = "metric",
+    # HTTP
+    timeout: Optional[timeout] = 10,
+    cache: Optional[bool | Pathlike] = None,
+    max_workers: int = 4,
+) -> list[Path]:
+    """
+    Concurrently downloads .csv files of precipitation frequency estimates for points
+    ----------
+    download_many(lats, lons)
+    Downloads a .csv file with precipitation frequency estimates for each of the given
+    points. The `lats` and `lons` inputs should be vectors with the same number of
+    elements, and each pair of elements is one point. Coordinates follow the same rules
+    as for the `download` command. The points are downloaded concurrently, so the
+    total time is typically much less than downloading each point in turn.
+
+    Returns a list with the path to each downloaded csv file, in the same order as the
+    input points. Repeated points are only downloaded once, and share the same file.
+    By default, the files are downloaded to the current folder, and each
+    file is named "noaa-atlas14-<statistic>-<series>-<data>-<units>-<lat>_<lon>.csv".
+    Raises an error if any of these files already exist, before downloading any points.
+
+    download_many(..., *, parent)
+    download_many(..., *, overwrite=True)
+    Use the `parent` input to specify the path to the parent folder where the files
+    should be saved. If a relative path, then parent is interpreted relative to the
+    current folder. Set overwrite=True to allow the downloads to overwrite existing
+    files.
+
+    download_many(..., *, statistic)
+    download_many(..., *, data)
+    download_many(..., *, series)
+    download_many(..., *, units)
+    download_many(..., *, timeout)
+    download_many(..., *, cache)
+    Options for the downloaded data, HTTP connection, and response cache. These options
+    are the same as for the `download` command, and are applied to every point.
+
+    download_many(..., *, max_workers)
+    Specifies the maximum number of points that should be downloaded at the same time.
+    Default is 4. NOAA PFDS is shared infrastructure, so large values are discouraged.
+    ----------
+    Inputs:
+        lats: The latitudes of the query points in decimal degrees
+        lons: The longitudes of the query points in decimal degrees on the interval
+            [-180, 180]
+        parent: The path to the parent folder where the files should be saved.
+            Defaults to the current folder.
+        overwrite: True to allow the downloaded files to replace existing files.
+            False (default) to not allow overwriting
+        statistic: The type of PFE statistic to download. Options are "mean", "upper",
+            "lower", and "all"
+        data: The type of PFE values to download. Options are "intensity" and "depth"
+        series: The type of time series to derive PFE values from. Options are
+            "pds" (partial duration), and "ams" (annual maximum).
+        units: The units that PFE values should use. Options are "metric" and "english"
+        timeout: The maximum number of seconds to connect with the data server
+        cache: A folder used to cache PFDS responses, or True to use the default
+            cache folder
+        max_workers: The maximum number of points to download at the same time
+
+    Outputs:
+        list[Path]: The Paths to the downloaded data files
+    """
+
+    # Validate the points and the concurrency limit
+    lats = validate.vector(lats, "lats", dtype=real)
+    validate.inrange(lats, "lats", -90, 90)
+    lons = validate.vector(lons, "lons", dtype=real, length=lats.size)
+    validate.inrange(lons, "lons", -180, 180)
+    max_workers = validate.scalar(max_workers, "max_workers", dtype=real)
+    validate.positive(max_workers, "max_workers")
+    validate.integers(max_workers, "max_workers")
+
+    # Validate the query options once for all the points
+    statistic = _validate_statistic(statistic)
+    data = validate.option(data, "data", allowed=_DATA)
+    series = validate.option(series, "series", allowed=_SERIES)
+    units = validate.option(units, "units", allowed=_UNITS)
+    cache = _validate_cache(cache)
+
+    # Name each file after its point, and check all the output paths before
+    # downloading anything
+    prefix = f"noaa-atlas14-{statistic}-{series}-{data}-{units}"
+    paths = [
+        validate.download_path(
+            parent,
+            None,
+            default_name=f"{prefix}-{float(lat)}_{float(lon)}.csv",
+            overwrite=overwrite,
+        )
+        for lat, lon in zip(lats, lons)
+    ]
+
+    # Repeated points share a file, so only download each unique point once
+    points = {path: (lat, lon) for path, lat, lon in zip(paths, lats, lons)}
+
+    # Download each point in a separate thread. The threads spend most of their time
+    # waiting on the NOAA server, so they can overlap in spite of the GIL.
+    def download_point(path: Path) -> Path:
+        lat, lon = points[path]
+        return _download(lat, lon, path, statistic, data, series, units, timeout, cache)
+
+    with ThreadPoolExecutor(max_workers=int(max_workers)) as executor:
+        list(executor.map(download_point, points))
+    return paths
@@ -45,6 +45,7 @@ Data Acquisition:
     NoTNMProductsError      - When there are no TNM products in the search results
     LFPSError               - Errors unique to the LANDFIRE LFPS API
     InvalidLFPSJobError     - When a LANDFIRE LFPS job cannot be used for a data read
+    MissingLFPSJobError     - When a LANDFIRE LFPS job is not on the LFPS server
     LFPSJobTimeoutError     - When a LANDFIRE LFPS job takes too long to execute
 """
 
@@ -211,5 +212,9 @@ class InvalidLFPSJobError(LFPSError):
     "When a LANDFIRE LFPS job cannot be used for a data read"
 
 
+class MissingLFPSJobError(LFPSError, ValueError):
+    "When a LANDFIRE LFPS job is not on the LFPS server"
+
+
 class LFPSJobTimeoutError(LFPSError):
     "When a LANDFIRE LFPS job takes too long to execute"
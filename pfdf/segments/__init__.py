@@ -22,6 +22,7 @@ Internal:
     _basins         - Module to locate basins sequentially or in parallel
     _confinement    - Module to compute confinement angles
     _segments       - Module implementing the Segments class
+    _summary        - Module to compute pixel summaries for every segment at once
     _update         - Module to update attributes after filtering
 """
 
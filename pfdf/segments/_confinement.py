@@ -70,7 +70,8 @@ def angles(
     }
 
     # Get the mean confinement angle for each stream segment
-    for i, pixels in enumerate(segments._indices):
+    for i in range(segments.size):
+        pixels = segments._pixels(i)
         theta[i] = angle(segments, pixels, lengths, kernel, dem)
     return theta
 
@@ -1,12 +1,13 @@
 """
 Subpackage to export a stream segment network to geojson
 ----------
-Main Function:
+Main Functions:
     features    - Converts a segment network to geojson
+    records     - Returns an iterator over geojson features for writing to file
 
 Submodules:
     _geojson    - Creates geojson FeatureCollections for various feature types
     _reproject  - Reprojects feature geometries to desired CRS
 """
 
-from pfdf.segments._geojson._geojson import features
+from pfdf.segments._geojson._geojson import features, records
@@ -3,8 +3,13 @@ Functions that build GeoJSON features for segments, outlets, and basins
 ----------
 Functions:
     features        - Main function to export a FeatureCollection
+    records         - Returns an iterator over features for writing to file
+
+Internal:
     _basins         - Builds features for basin polygons
+    _basin_features - Yields basin features from reprojected polygons
     _from_shapely   - Builds segment or outlet features derived from shapely linestrings
+    _line_features  - Yields segment or outlet features from reprojected coordinates
     _values         - Builds the property value dict for a feature
 """
 
@@ -21,7 +26,7 @@ import pfdf.segments._validate as validate
 from pfdf.segments._geojson import _reproject
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Callable
+    from typing import Any, Callable, Iterator
 
     from pfdf.projection import CRS
     from pfdf.typing.segments import ExportType, PropertySchema, SegmentValues
@@ -38,8 +43,8 @@ def _values(properties: PropertyConvert, index: int) -> dict:
     return values
 
 
-def _basins(segments, properties: PropertyConvert, crs: CRS) -> list[Feature]:
-    "Returns features for basin polygons"
+def _basins(segments, properties: PropertyConvert, crs: CRS) -> Iterator[Feature]:
+    "Returns an iterator over features for basin polygons"
 
     # Build (geometry, ID) tuples. Reproject as needed
     basins = segments._locate_basins()
@@ -49,22 +54,26 @@ def _basins(segments, properties: PropertyConvert, crs: CRS) -> list[Feature]:
     )
     basins = list(basins)
     _reproject.geometries(basins, "basins", segments.crs, crs)
+    return _basin_features(basins, segments.terminal_ids, properties)
+
 
-    # Convert basins to geojson Features. Track basin IDs when determining property
-    # values as basins are unordered
-    ids = segments.terminal_ids
-    for b, (geometry, id) in enumerate(basins):
+def _basin_features(
+    basins: list[tuple[dict, float]], ids: SegmentValues, properties: PropertyConvert
+) -> Iterator[Feature]:
+    "Yields basin features one at a time"
+
+    # Track basin IDs when determining property values as basins are unordered
+    for geometry, id in basins:
         index = np.argwhere(id == ids)
         index = int(index[0, 0])
         values = _values(properties, index)
-        basins[b] = Feature(geometry=geometry, properties=values)
-    return basins
+        yield Feature(geometry=geometry, properties=values)
 
 
 def _from_shapely(
     segments, type: ExportType, properties: PropertyConvert, crs: CRS
-) -> list[Feature]:
-    "Returns segments or outlets derived from the shapely linestrings"
+) -> Iterator[Feature]:
+    "Returns an iterator over segments or outlets derived from the shapely linestrings"
 
     # Get the linestring geometries. Limit to terminal segments as needed.
     features = [list(linestring.coords) for linestring in segments._segments]
@@ -80,19 +89,24 @@ def _from_shapely(
     else:
         to_geojson = LineString
     _reproject.geometries(features, type, segments.crs, crs)
+    return _line_features(features, to_geojson, properties)
+
 
-    # Get values and build each feature
-    for g, geometry in enumerate(features):
+def _line_features(
+    geometries: list, to_geojson: Callable, properties: PropertyConvert
+) -> Iterator[Feature]:
+    "Yields segment or outlet features one at a time"
+    for g, geometry in enumerate(geometries):
         values = _values(properties, g)
         geometry = to_geojson(geometry)
-        features[g] = Feature(geometry=geometry, properties=values)
-    return features
+        yield Feature(geometry=geometry, properties=values)
 
 
-def features(
+def records(
     segments, type: Any, properties: Any, crs: Any
-) -> tuple[FeatureCollection, PropertySchema, CRS]:
-    "Returns a GeoJSON feature collection for export"
+) -> tuple[Iterator[Feature], PropertySchema, CRS]:
+    """Returns an iterator over GeoJSON features for writing to file. Geometries are
+    built and reprojected immediately, but each Feature is only built when requested"""
 
     # Validate. Get final CRS
     type, properties, schema = validate.export(segments, properties, type)
@@ -107,9 +121,17 @@ def features(
         dtype = schema[field].split(":")[0]
         properties[field] = (value, builtins[dtype])
 
-    # Get Features and group in a FeatureCollection
+    # Get an iterator over the Features
     if type == "basins":
         features = _basins(segments, properties, crs)
     else:
         features = _from_shapely(segments, type, properties, crs)
-    return FeatureCollection(features), schema, crs
+    return features, schema, crs
+
+
+def features(
+    segments, type: Any, properties: Any, crs: Any
+) -> tuple[FeatureCollection, PropertySchema, CRS]:
+    "Returns a GeoJSON feature collection for export"
+    features, schema, crs = records(segments, type, properties, crs)
+    return FeatureCollection(list(features)), schema, crs
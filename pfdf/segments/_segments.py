@@ -12,21 +12,20 @@ Classes:
 from __future__ import annotations
 
 import typing
-from math import inf, nan
+from math import floor, inf, nan
 
 import fiona
 import numpy as np
-from rasterio.transform import rowcol
 
 import pfdf._validate.core as validate
 import pfdf.segments._validate as svalidate
 from pfdf import watershed
-from pfdf._utils import all_nones, real
+from pfdf._utils import all_nones, real, rowcol
 from pfdf._utils.nodata import NodataMask
 from pfdf.errors import MissingCRSError, MissingTransformError
 from pfdf.projection import crs
 from pfdf.raster import Raster
-from pfdf.segments import _basins, _confinement, _geojson, _update
+from pfdf.segments import _basins, _confinement, _geojson, _summary, _update
 
 if typing.TYPE_CHECKING:
     from pathlib import Path
@@ -186,14 +185,22 @@ class Segments:
         _flow                   - The flow direction raster for the watershed
         _segments               - A list of shapely LineStrings representing the segments
         _ids                    - The ID for each segment
-        _indices                - A list of each segment's pixel indices
+        _rows                   - The row index of every stream segment pixel
+        _cols                   - The column index of every stream segment pixel
+        _offsets                - The position of each segment's first pixel in _rows and _cols
         _npixels                - The number of catchment pixels for each stream segment
         _child                  - The index of each segment's downstream child
         _parents                - The indices of each segment's upstream parents
         _basins                 - Saved nested drainage basin raster values
+        _termini                - Cached index of each segment's terminal segment
+        _terminal               - Cached mask of the terminal segments
 
     Utilities:
         _indices_to_ids         - Converts segment IDs to indices
+        _pixels                 - Returns the pixel indices of a segment
+        _indices                - Returns a list of each segment's pixel indices
+        _terminal_indices       - Returns the index of each segment's terminal segment
+        _terminal_mask          - Returns a boolean mask of the terminal segments
         _basin_npixels          - Returns the number of pixels in catchment or terminal outlet basins
         _nbasins                - Returns the number of catchment or terminal outlet basins
         _preallocate            - Initializes an array to hold summary values
@@ -201,6 +208,7 @@ class Segments:
 
     Local Networks:
         _get_parents            - Returns indices of valid parent segments
+        _ancestors              - Returns the indices of all upstream segments
 
     Rasters:
         _segments_raster        - Builds a stream segment raster array
@@ -274,11 +282,15 @@ class Segments:
         self._flow: Raster = None
         self._segments: list[shapely.LineString] = None
         self._ids: SegmentValues = None
-        self._indices: NetworkIndices = None
+        self._rows: VectorArray = None
+        self._cols: VectorArray = None
+        self._offsets: VectorArray = None
         self._npixels: SegmentValues = None
         self._child: SegmentValues = None
         self._parents: SegmentParents = None
         self._basins: Optional[MatrixArray] = None
+        self._termini: Optional[SegmentValues] = None
+        self._terminal: Optional[SegmentValues] = None
 
         # Validate and record flow raster
         flow = Raster(flow, "flow directions")
@@ -307,67 +319,75 @@ class Segments:
         self._segments = watershed.network(self.flow, mask, max_length, units)
         self._ids = np.arange(self.size, dtype=int) + 1
 
-        # Initialize attributes - indices, child, parents
-        self._indices = []
+        # Initialize attributes - child
         self._child = np.full(self.size, -1, dtype=int)
-        self._parents = np.full((self.size, 2), -1, dtype=int)
-
-        # Initialize variables used to determine connectivity and split points.
-        # (A split point is where a long stream segment was split into 2 pieces)
-        starts = np.empty((self.size, 2), float)
-        outlets = np.empty((self.size, 2), float)
-        split = False
-
-        # Get the spatial coordinates of each segment
-        for s, segment in enumerate(self.segments):
-            coords = np.array(segment.coords)
-            starts[s, :] = coords[0, :]
-            outlets[s, :] = coords[-1, :]
-
-            # Get the pixel indices for each segment. Ensure they are lists
-            # (different rasterio versions may return lists or numpy arrays)
-            rows, cols = rowcol(
-                self.flow.transform.affine, xs=coords[:, 0], ys=coords[:, 1]
-            )
-            rows = np.array(rows).astype(int).tolist()
-            cols = np.array(cols).astype(int).tolist()
-
-            # If the first two indices match, then this is downstream of a split point
-            if rows[0] == rows[1] and cols[0] == cols[1]:
-                split = True
-
-            # If the segment is downstream of a split point, then remove the
-            # first index so that split pixels are assigned to the split segment
-            # that contains the majority of the pixel
-            if split:
-                del rows[0]
-                del cols[0]
-                split = False
-
-            # If the final two indices are identical, then the next segment
-            # is downstream of a split point.
-            if rows[-1] == rows[-2] and cols[-1] == cols[-2]:
-                split = True
-
-            # Record pixel indices. Remove the final coordinate so that junctions
-            # are assigned to the downstream segment.
-            indices = (rows[:-1], cols[:-1])
-            self._indices.append(indices)
-
-        # Find upstream parents (if any)
-        for s, start in enumerate(starts):
-            parents = np.equal(start, outlets).all(axis=1)
-            parents = np.argwhere(parents)
-
-            # Add extra columns if there are more parents than initially expected
-            nextra = parents.size - self._parents.shape[1]
-            if nextra > 0:
-                fill = np.full((self.size, nextra), -1, dtype=int)
-                self._parents = np.concatenate((self._parents, fill), axis=1)
-
-            # Record child-parent relationships
-            self._child[parents] = s
-            self._parents[s, 0 : parents.size] = parents.flatten()
+
+        # Get the spatial coordinates of every segment as a single array. Record the
+        # position of each segment's first and last coordinate
+        coords = [np.array(segment.coords) for segment in self._segments]
+        npoints = np.array([c.shape[0] for c in coords], dtype=int)
+        ends = np.cumsum(npoints)
+        begins = ends - npoints
+        coords = np.concatenate(coords) if self.size > 0 else np.empty((0, 2), float)
+        starts = coords[begins, :]
+        outlets = coords[ends - 1, :]
+
+        # Get the pixel indices of all the coordinates by applying the inverse affine
+        # transform to the full coordinate array at once
+        rows, cols = rowcol(
+            self.flow.transform.affine,
+            xs=coords[:, 0],
+            ys=coords[:, 1],
+            op=floor,
+            as_array=True,
+        )
+
+        # Locate split points. (A split point is where a long stream segment was split
+        # into 2 pieces). If the first two indices of a segment match, then it is
+        # downstream of a split point. If the final two indices match, then the next
+        # segment is downstream of a split point.
+        repeated = (rows[1:] == rows[:-1]) & (cols[1:] == cols[:-1])
+        split = repeated[begins]
+        split[1:] |= repeated[ends[:-1] - 2]
+
+        # If a segment is downstream of a split point, then remove its first index so
+        # that split pixels are assigned to the split segment that contains the
+        # majority of the pixel. Also remove the final index of each segment, so that
+        # junctions are assigned to the downstream segment.
+        keep = np.ones(rows.shape, dtype=bool)
+        keep[begins[split]] = False
+        keep[ends - 1] = False
+
+        # Record the pixel indices of every segment in two flat arrays. Also record
+        # the position of each segment's first pixel
+        self._rows = rows[keep]
+        self._cols = cols[keep]
+        npixels = npoints - 1 - split
+        self._offsets = np.concatenate(([0], np.cumsum(npixels))).astype(int)
+
+        # Find upstream parents (if any). Group segments by their outlet coordinates,
+        # so that each segment's parents are found with a single lookup
+        segments_by_outlet = {}
+        for s, outlet in enumerate(map(tuple, outlets.tolist())):
+            segments_by_outlet.setdefault(outlet, []).append(s)
+        parents = [
+            segments_by_outlet.get(tuple(start), []) for start in starts.tolist()
+        ]
+
+        # Size the parents array for the segment with the most parents (at least 2),
+        # so that it is only allocated once
+        nparents = np.array([len(p) for p in parents], dtype=int)
+        width = max(2, int(nparents.max(initial=0)))
+        self._parents = np.full((self.size, width), -1, dtype=int)
+
+        # Record child-parent relationships. Each parent is placed in the next free
+        # column of its child's row
+        parent = np.array([p for segment in parents for p in segment], dtype=int)
+        child = np.repeat(np.arange(self.size), nparents)
+        first = np.repeat(np.cumsum(nparents) - nparents, nparents)
+        column = np.arange(parent.size) - first
+        self._child[parent] = child
+        self._parents[child, column] = parent
 
         # Compute flow accumulation
         self._npixels = self._accumulation()
@@ -426,7 +446,7 @@ class Segments:
     @property
     def nlocal(self) -> int:
         "The number of local drainage networks"
-        ntermini = np.sum(self.isterminal())
+        ntermini = np.sum(self._terminal_mask())
         return int(ntermini)
 
     @property
@@ -454,12 +474,12 @@ class Segments:
     @property
     def terminal_ids(self) -> TerminalValues:
         "The IDs of the terminal segments in the network"
-        return self.ids[self.isterminal()]
+        return self._ids[self._terminal_mask()]
 
     @property
     def indices(self) -> NetworkIndices:
         "The row and column indices of the stream raster pixels for each segment"
-        return self._indices.copy()
+        return self._indices
 
     @property
     def npixels(self) -> SegmentValues:
@@ -501,20 +521,62 @@ class Segments:
         "Converts segment indices to (user-facing) IDs"
 
         # If empty, just return directly
-        indices = np.array(indices, copy=False)
+        indices = np.asarray(indices)
         if indices.size == 0:
-            return indices
+            return indices.astype(self._ids.dtype)
 
-        # Otherwise, convert to ids
-        ids = np.zeros(indices.shape)
+        # Otherwise, gather the ids. Missing segments (-1) become 0
         valid = indices != -1
-        ids[valid] = self._ids[indices[valid]]
-        return ids
+        ids = self._ids[np.where(valid, indices, 0)]
+        return np.where(valid, ids, 0)
+
+    def _pixels(self, index: int) -> PixelIndices:
+        "Returns the row and column indices of a segment's pixels"
+        start, stop = self._offsets[index], self._offsets[index + 1]
+        return self._rows[start:stop], self._cols[start:stop]
+
+    @property
+    def _indices(self) -> NetworkIndices:
+        "A list with the row and column indices of each segment's pixels"
+        indices = []
+        for start, stop in zip(self._offsets[:-1], self._offsets[1:]):
+            rows = self._rows[start:stop].tolist()
+            cols = self._cols[start:stop].tolist()
+            indices.append((rows, cols))
+        return indices
+
+    def _terminal_mask(self) -> SegmentValues:
+        "Returns a boolean mask of the terminal segments in the network"
+        if self._terminal is None:
+            self._terminal = self._child == -1
+        return self._terminal
+
+    def _terminal_indices(self) -> SegmentValues:
+        "Returns the index of the terminal segment for each segment in the network"
+
+        # Use the cached values if possible
+        if self._termini is not None:
+            return self._termini
+
+        # Point each terminal segment at itself, and every other segment at its child.
+        # Then repeatedly replace each pointer with the pointer of its target. Each
+        # step doubles the distance jumped, so all the pointers reach their terminal
+        # segments after log2(network depth) steps
+        termini = np.where(self._terminal_mask(), np.arange(self.size), self._child)
+        while True:
+            jumped = termini[termini]
+            if np.array_equal(jumped, termini):
+                break
+            termini = jumped
+
+        # Cache and return
+        self._termini = termini
+        return termini
 
     def _basin_npixels(self, terminal: bool) -> CatchmentValues | TerminalValues:
         "Returns the number of pixels in catchment or terminal outlet basins"
         if terminal:
-            return self._npixels[self.isterminal()]
+            return self._npixels[self._terminal_mask()]
         else:
             return self._npixels
 
@@ -577,6 +639,8 @@ class Segments:
             boolean 1D numpy array: Whether each segment is terminal.
         """
 
+        if ids is None:
+            return self._terminal_mask().copy()
         indices = svalidate.ids(self, ids)
         return self._child[indices] == -1
 
@@ -605,16 +669,9 @@ class Segments:
             numpy 1D array: The ID of the terminal segment for each queried segment
         """
 
-        # Walk downstream to locate the terminal index for each queried segment
+        # Locate the terminal index for each queried segment. Return as IDs
         indices = svalidate.ids(self, ids)
-        termini = []
-        for index in indices:
-            while self._child[index] != -1:
-                index = self._child[index]
-            termini.append(index)
-
-        # Return as a numpy array of IDs
-        termini = np.array(termini).reshape(-1)
+        termini = self._terminal_indices()[indices].reshape(-1)
         return self._indices_to_ids(termini)
 
     def outlets(
@@ -669,17 +726,21 @@ class Segments:
             ids = self.termini(ids)
         indices = svalidate.ids(self, ids)
 
-        # Extract outlet pixel indices
-        outlets = []
-        for index in indices:
-            pixels = self._indices[index]
-            row = pixels[0][-1]
-            column = pixels[1][-1]
-            outlets.append((row, column))
-
-        # Optionally convert to array
-        if as_array:
-            outlets = np.array(outlets).reshape(-1, 2)
+        # Extract outlet pixel indices. Each outlet is the final pixel of its segment,
+        # so a segment without pixels has no outlet
+        last = self._offsets[indices + 1] - 1
+        empty = last < self._offsets[indices]
+        if empty.any():
+            id = self._ids[indices[empty][0]]
+            raise IndexError(
+                f"Cannot locate the outlet of segment {id}, because the segment "
+                "does not contain any pixels."
+            )
+        outlets = np.stack((self._rows[last], self._cols[last]), axis=1)
+
+        # Optionally convert to a list of tuples
+        if not as_array:
+            outlets = list(map(tuple, outlets.tolist()))
         return outlets
 
     #####
@@ -689,7 +750,20 @@ class Segments:
     def _get_parents(self, index: int) -> list[int]:
         "Returns the indices of valid parent segments"
         parents = self._parents[index, :]
-        return [index for index in parents if index != -1]
+        return parents[parents != -1].tolist()
+
+    def _ancestors(self, index: int) -> VectorArray:
+        "Returns the indices of all segments upstream of a segment"
+
+        # Search upstream one level at a time. Each level is the set of valid
+        # parents of the previous level
+        levels = []
+        level = np.array([index])
+        while level.size > 0:
+            parents = self._parents[level, :].reshape(-1)
+            level = parents[parents != -1]
+            levels.append(level)
+        return np.concatenate(levels)
 
     def parents(self, id: scalar) -> list[int] | None:
         """
@@ -758,18 +832,7 @@ class Segments:
 
         # Validate ID and initial ancestors with immediate parents
         segment = svalidate.id(self, id)
-        ancestors = self._get_parents(segment)
-
-        # Recursively add parents of parents
-        k = 0
-        while k < len(ancestors):
-            index = ancestors[k]
-            upstream = self._get_parents(index)
-            ancestors += upstream
-            k += 1
-
-        # Convert indices to IDs and return as array
-        ancestors = np.array(ancestors).reshape(-1)
+        ancestors = self._ancestors(segment)
         return self._indices_to_ids(ancestors)
 
     def descendents(self, id: scalar) -> VectorArray:
@@ -824,16 +887,11 @@ class Segments:
             numpy 1D array: The IDs of all segments in the local drainage network.
         """
 
-        # Locate segments in the local drainage network
-        svalidate.id(self, id)
-        terminus = self.termini(id)
-        upstream = self.ancestors(terminus)
-
-        # Group into family array
-        family = np.empty(upstream.size + 1, upstream.dtype)
-        family[0] = terminus[0]
-        family[1:] = upstream
-        return family
+        # Locate the terminal segment and its ancestors. Return as IDs
+        segment = svalidate.id(self, id)
+        terminus = self._terminal_indices()[segment]
+        family = np.concatenate(([terminus], self._ancestors(terminus)))
+        return self._indices_to_ids(family)
 
     def isnested(self, ids: Optional[vector] = None) -> SegmentValues | VectorArray:
         """
@@ -987,8 +1045,8 @@ class Segments:
     def _segments_raster(self) -> MatrixArray:
         "Builds a stream segment raster array"
         raster = np.zeros(self._flow.shape, dtype="int32")
-        for id, (rows, cols) in zip(self._ids, self._indices):
-            raster[rows, cols] = id
+        ids = np.repeat(self._ids, np.diff(self._offsets))
+        raster[self._rows, self._cols] = ids
         return raster
 
     #####
@@ -1059,7 +1117,7 @@ class Segments:
         if terminal:
             ids = self.terminal_ids
         else:
-            ids = self.ids
+            ids = self._ids
         outlets = self.outlets(ids, segment_outlets=True)
         for k, outlet in enumerate(outlets):
             values[k] = self._summarize(identity, raster, indices=outlet)
@@ -1097,11 +1155,14 @@ class Segments:
         if statistic == "outlet":
             return self._values_at_outlets(values)
 
-        # ...or compute a statistical summary
+        # ...or compute a statistical summary. Use a single pass over all the pixels
+        # when possible. Otherwise, summarize each segment in turn
+        if _summary.vectorized(self, statistic):
+            return _summary.summary(self, statistic, values)
         statistic = _STATS[statistic][0]
         summary = self._preallocate()
-        for i, pixels in enumerate(self._indices):
-            summary[i] = self._summarize(statistic, values, pixels)
+        for i in range(self.size):
+            summary[i] = self._summarize(statistic, values, self._pixels(i))
         return summary
 
     def catchment_summary(
@@ -1227,9 +1288,9 @@ class Segments:
         # Get statistic, preallocate, and locate catchment outlets
         statistic = _STATS[statistic][0]
         summary = self._preallocate(terminal=terminal)
-        ids = self.ids
+        ids = self._ids
         if terminal:
-            ids = ids[self.isterminal()]
+            ids = ids[self._terminal_mask()]
         outlets = self.outlets(ids, segment_outlets=True)
 
         # Iterate through catchment basins and compute summaries
@@ -1504,9 +1565,18 @@ class Segments:
 
         mask = svalidate.raster(self, mask, "mask")
         validate.boolean(mask.values, "mask", ignore=mask.nodata)
-        isin = self.summary("nanmax", mask) == 1
+
+        # Locate stream pixels in the mask, ignoring NoData
+        values = mask.values[self._rows, self._cols]
+        nodatas = NodataMask(values, mask.nodata)
+        isin = nodatas.fill(values.astype(bool), False)
+
+        # Count each segment's pixels in the mask using a cumulative sum over the
+        # flat pixel arrays, so that segments without pixels have a count of 0
+        count = np.concatenate(([0], np.cumsum(isin)))
+        isin = (count[self._offsets[1:]] - count[self._offsets[:-1]]) > 0
         if terminal:
-            isin = isin[self.isterminal()]
+            isin = isin[self._terminal_mask()]
         return isin
 
     def in_perimeter(
@@ -1624,7 +1694,7 @@ class Segments:
         units = validate.units(units)
         lengths = np.array([segment.length for segment in self._segments])
         if terminal:
-            lengths = lengths[self.isterminal()]
+            lengths = lengths[self._terminal_mask()]
         if units != "base":
             lengths = crs.base_to_units(self.crs, "y", lengths, units)
         return lengths
@@ -1839,7 +1909,7 @@ class Segments:
             method = "mean"
         slopes = self.summary(method, slopes)
         if terminal:
-            slopes = slopes[self.isterminal()]
+            slopes = slopes[self._terminal_mask()]
         return slopes
 
     def relief(self, relief: RasterInput, terminal: bool = False) -> SegmentValues:
@@ -1864,7 +1934,7 @@ class Segments:
         relief = svalidate.raster(self, relief, "relief")
         relief = self._values_at_outlets(relief)
         if terminal:
-            relief = relief[self.isterminal()]
+            relief = relief[self._terminal_mask()]
         return relief
 
     def ruggedness(
@@ -2042,20 +2112,25 @@ class Segments:
         keep = ~remove
 
         # Compute new attributes
-        segments, indices = _update.segments(self, remove)
-        ids = self.ids[keep]
-        npixels = self.npixels[keep]
+        segments = _update.segments(self, remove)
+        rows, cols, offsets = _update.pixels(self, remove)
+        ids = self._ids[keep]
+        npixels = self._npixels[keep]
         child, parents = _update.connectivity(self, remove)
         basins = _update.basins(self, remove)
 
         # Update object
         self._segments = segments
         self._ids = ids
-        self._indices = indices
+        self._rows = rows
+        self._cols = cols
+        self._offsets = offsets
         self._npixels = npixels
         self._child = child
         self._parents = parents
         self._basins = basins
+        self._termini = None
+        self._terminal = None
 
     def keep(self, selected: Selection, type: SelectionType = "indices") -> None:
         """
@@ -2103,12 +2178,16 @@ class Segments:
         copy._flow = self._flow
         copy._segments = self._segments.copy()
         copy._ids = self._ids.copy()
-        copy._indices = self._indices.copy()
+        copy._rows = self._rows.copy()
+        copy._cols = self._cols.copy()
+        copy._offsets = self._offsets.copy()
         copy._npixels = self._npixels.copy()
         copy._child = self._child.copy()
         copy._parents = self._parents.copy()
         copy._basins = None
         copy._basins = self._basins
+        copy._termini = self._termini
+        copy._terminal = self._terminal
         return copy
 
     #####
@@ -2290,11 +2369,9 @@ class Segments:
             Path: The path to the saved file
         """
 
-        # Validate and get features as geojson
+        # Validate and get an iterator over the geojson features
         path = validate.output_file(path, overwrite)
-        collection, property_schema, crs = _geojson.features(
-            self, type, properties, crs
-        )
+        records, property_schema, crs = _geojson.records(self, type, properties, crs)
 
         # Build the file schema
         geometries = {
@@ -2308,8 +2385,7 @@ class Segments:
             "properties": property_schema,
         }
 
-        # Write file
-        records = collection["features"]
+        # Write file, building each feature as it is written
         with fiona.open(path, "w", driver=driver, crs=crs, schema=schema) as file:
             file.writerecords(records)
         return path
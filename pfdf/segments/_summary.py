@@ -0,0 +1,121 @@
+"""
+Functions that compute summary statistics over stream segment pixels
+----------
+The functions in this module compute a summary statistic for every stream segment
+in a single pass over the flat pixel index arrays of a Segments object, rather than
+summarizing each segment's pixels in turn. The per-segment reductions are implemented
+using numpy's ufunc.reduceat, so the loop over segments runs in compiled code.
+
+Only statistics that can be built from sums, minima, and maxima are supported.
+Medians require sorting each segment's pixels, so are not supported here.
+----------
+Functions:
+    vectorized  - Checks whether a statistic can be computed for every segment at once
+    summary     - Computes a summary statistic over the pixels of every segment
+
+Internal:
+    _reduce     - Reduces pixel values over each segment, optionally ignoring NaN
+"""
+
+from __future__ import annotations
+
+import typing
+from math import inf, nan
+
+import numpy as np
+
+from pfdf._utils.nodata import NodataMask
+
+if typing.TYPE_CHECKING:
+    from typing import Optional
+
+    from pfdf.raster import Raster
+    from pfdf.typing.core import BooleanArray, RealArray, VectorArray
+    from pfdf.typing.segments import SegmentValues
+
+
+# Statistics with a vectorized implementation
+_STATISTICS = frozenset(
+    {
+        "min",
+        "max",
+        "mean",
+        "std",
+        "sum",
+        "var",
+        "nanmin",
+        "nanmax",
+        "nanmean",
+        "nanstd",
+        "nansum",
+        "nanvar",
+    }
+)
+
+
+def vectorized(segments, statistic: str) -> bool:
+    "Checks whether a statistic can be computed for every segment at once"
+
+    if statistic not in _STATISTICS or segments.size == 0:
+        return False
+    npixels = np.diff(segments._offsets)
+    return bool(np.all(npixels > 0))
+
+
+def summary(segments, statistic: str, raster: Raster) -> SegmentValues:
+    """Computes a summary statistic over the pixels of every segment. Converts NoData
+    values to NaN. Returns NaN for segments whose pixels are all NaN"""
+
+    # Get the pixel values as float. Convert NoData to NaN
+    values = raster.values[segments._rows, segments._cols].astype(float)
+    nodatas = NodataMask(values, raster.nodata)
+    values = nodatas.fill(values, nan)
+
+    # Locate each segment's pixels
+    starts = segments._offsets[:-1]
+    npixels = np.diff(segments._offsets)
+
+    # For the NaN-ignoring statistics, only count pixels that are not NaN
+    isnan = None
+    nvalid = npixels
+    if statistic.startswith("nan"):
+        statistic = statistic[3:]
+        isnan = np.isnan(values)
+        nvalid = np.add.reduceat(~isnan, starts, dtype=int)
+
+    # Compute the statistic. Segments without valid pixels may divide by zero, but
+    # are set to NaN afterwards
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if statistic == "min":
+            result = _reduce(np.minimum, values, starts, isnan, inf)
+        elif statistic == "max":
+            result = _reduce(np.maximum, values, starts, isnan, -inf)
+        elif statistic == "sum":
+            result = _reduce(np.add, values, starts, isnan, 0)
+        else:
+            result = _reduce(np.add, values, starts, isnan, 0) / nvalid
+
+        # Variance and standard deviation use deviations from the mean
+        if statistic in ["std", "var"]:
+            deviations = (values - np.repeat(result, npixels)) ** 2
+            result = _reduce(np.add, deviations, starts, isnan, 0) / nvalid
+            if statistic == "std":
+                result = np.sqrt(result)
+
+    # Segments whose pixels are all NaN are NaN
+    if isnan is not None:
+        result[nvalid == 0] = nan
+    return result
+
+
+def _reduce(
+    ufunc: np.ufunc,
+    values: RealArray,
+    starts: VectorArray,
+    isnan: Optional[BooleanArray],
+    fill: float,
+) -> SegmentValues:
+    "Reduces pixel values over each segment, replacing NaN with a fill value if needed"
+    if isnan is not None:
+        values = np.where(isnan, fill, values)
+    return ufunc.reduceat(values, starts)
@@ -6,7 +6,8 @@ In-place updates:
     indices         - Updates connectivity indices in-place following segment removal
 
 Misc:
-    segments        - Computes updated segment linestrings and pixel indices
+    segments        - Computes updated segment linestrings
+    pixels          - Computes updated pixel indices
     connectivity    - Computes updated child and parents
     basins          - Resets basins if terminal outlets were removed
 """
@@ -21,12 +22,7 @@ if typing.TYPE_CHECKING:
     import shapely
 
     from pfdf.typing.core import MatrixArray, RealArray, VectorArray
-    from pfdf.typing.segments import (
-        BooleanIndices,
-        NetworkIndices,
-        SegmentParents,
-        SegmentValues,
-    )
+    from pfdf.typing.segments import BooleanIndices, SegmentParents, SegmentValues
 
 
 #####
@@ -59,21 +55,30 @@ def indices(family: RealArray, nremoved: VectorArray) -> None:
 #####
 
 
-def segments(
-    segments, remove: BooleanIndices
-) -> tuple[list[shapely.LineString], NetworkIndices]:
-    "Computes updated linestrings and pixel indices after segments are removed"
+def segments(segments, remove: BooleanIndices) -> list[shapely.LineString]:
+    "Computes updated linestrings after segments are removed"
 
-    # Initialize new attributes
     linestrings = segments.segments
-    indices = segments.indices
-
-    # Delete items from lists
     (removed,) = np.nonzero(remove)
     for k in reversed(removed):
         del linestrings[k]
-        del indices[k]
-    return linestrings, indices
+    return linestrings
+
+
+def pixels(
+    segments, remove: BooleanIndices
+) -> tuple[VectorArray, VectorArray, VectorArray]:
+    "Computes updated pixel rows, columns, and offsets after segments are removed"
+
+    # Remove the pixels of removed segments
+    npixels = np.diff(segments._offsets)
+    keep = np.repeat(~remove, npixels)
+    rows = segments._rows[keep]
+    cols = segments._cols[keep]
+
+    # Recompute the position of each retained segment's first pixel
+    offsets = np.concatenate(([0], np.cumsum(npixels[~remove]))).astype(int)
+    return rows, cols, offsets
 
 
 def connectivity(
@@ -107,7 +112,7 @@ def basins(segments, remove: BooleanIndices) -> MatrixArray | None:
 
     # Get the ids of the removed segments. Reset if any of the removed IDs
     # are in the raster. Otherwise, retain the old raster
-    ids = segments.ids[remove]
+    ids = segments._ids[remove]
     if np.any(np.isin(ids, segments._basins)):
         return None
     else:
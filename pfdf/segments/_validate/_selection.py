@@ -62,7 +62,7 @@ def ids(segments, ids: Any) -> VectorArray:
     # Convert IDs to indices
     indices = np.empty(ids.shape, int)
     for k, id in enumerate(ids):
-        indices[k] = np.argwhere(id == segments.ids)[0, 0]
+        indices[k] = np.argwhere(id == segments._ids)[0, 0]
     return indices
 
 
@@ -1,7 +1,20 @@
+from math import ceil, floor
+
 import numpy as np
 import pytest
-
-from pfdf._utils import all_nones, aslist, astuple, clean_dims, limits, no_nones, real
+import rasterio.transform
+from affine import Affine
+
+from pfdf._utils import (
+    all_nones,
+    aslist,
+    astuple,
+    clean_dims,
+    limits,
+    no_nones,
+    real,
+    rowcol,
+)
 
 #####
 # Misc
@@ -82,3 +95,53 @@ class TestLimits:
         assert limits(5, 15, 10) == (5, 10)
         assert limits(5, 8, 10) == (5, 8)
         assert limits(-2, 15, 10) == (0, 10)
+
+
+class TestRowcol:
+    def test(_):
+        affine = Affine(10, 0, 0, 0, -10, 0)
+        rows, cols = rowcol(affine, [5, 25], [-5, -15], op=floor)
+        assert rows == [0, 1]
+        assert cols == [0, 2]
+        assert isinstance(rows[0], int)
+
+    def test_array(_):
+        affine = Affine(10, 0, 0, 0, -10, 0)
+        rows, cols = rowcol(affine, [5, 25], [-5, -15], op=floor, as_array=True)
+        assert isinstance(rows, np.ndarray)
+        assert np.array_equal(rows, [0, 1])
+        assert np.array_equal(cols, [0, 2])
+        assert rows.dtype == int
+
+    def test_empty(_):
+        affine = Affine(10, 0, 0, 0, -10, 0)
+        rows, cols = rowcol(affine, [], [], op=floor, as_array=True)
+        assert rows.size == 0
+        assert cols.size == 0
+
+    @pytest.mark.parametrize("op", (floor, round, ceil))
+    @pytest.mark.parametrize(
+        "affine",
+        (
+            Affine(10, 0, 0, 0, -10, 0),
+            Affine(10, 0, -100, 0, 10, 50),
+            Affine(0.5, 0, 3.25, 0, -0.25, 7.5),
+            Affine.translation(20, -30) * Affine.rotation(30) * Affine.scale(10, -10),
+        ),
+    )
+    def test_rasterio_parity(_, affine, op):
+        # Points at pixel edges, pixel centers, half-pixels, and arbitrary offsets
+        pixels = np.array([-2, -1, -0.5, 0, 0.25, 0.5, 1, 1.5, 2.5, 3, 3.7])
+        cols, rows = np.meshgrid(pixels, pixels)
+        xs, ys = affine * (cols.flatten(), rows.flatten())
+
+        rows, cols = rowcol(affine, xs, ys, op=op)
+        expected = rasterio.transform.rowcol(affine, xs, ys, op=op)
+        assert rows == np.asarray(expected[0]).tolist()
+        assert cols == np.asarray(expected[1]).tolist()
+
+        for x, y in zip(xs, ys):
+            row, col = rowcol(affine, x, y, op=op)
+            expected = rasterio.transform.rowcol(affine, x, y, op=op)
+            assert row == int(expected[0])
+            assert col == int(expected[1])
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 from pysheds.sview import Raster, ViewFinder
 
+from pfdf._utils import patches
 from pfdf._utils.patches import NodataPatch
 
 
@@ -13,3 +14,9 @@ class TestNodataPatch:
             Raster(values, view)
         with NodataPatch():
             Raster(values, view)
+
+
+class TestImports:
+    def test_cached(_):
+        assert patches._sview() is patches._sview()
+        assert patches._sview().Raster is Raster
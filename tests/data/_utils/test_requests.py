@@ -1,9 +1,13 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
+import requests
 from requests import Response
 from requests.exceptions import ConnectTimeout, HTTPError, ReadTimeout
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
 
 from pfdf.data._utils import requests as _requests
 from pfdf.errors import InvalidJSONError
@@ -127,6 +131,42 @@ class TestReadTimeout:
 #####
 
 
+class TestSession:
+    def test(_):
+        output = _requests.session()
+        assert isinstance(output, requests.Session)
+        assert _requests.session() is output
+
+    def test_no_retry(_):
+        output = _requests.session(retry=False)
+        assert isinstance(output, requests.Session)
+        assert _requests.session(retry=False) is output
+        assert output is not _requests.session()
+
+    def test_threads(_, monkeypatch):
+        monkeypatch.setattr(_requests, "_SESSIONS", {})
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            sessions = list(executor.map(lambda _: _requests.session(), range(16)))
+        assert all(session is sessions[0] for session in sessions)
+
+    def test_retries(_):
+        adapter = _requests.session().get_adapter("https://www.usgs.gov")
+        retries = adapter.max_retries
+        assert retries.connect == 3
+        assert retries.read is False
+        assert retries.status == 3
+        assert 503 in retries.status_forcelist
+        assert retries.raise_on_status is False
+
+    def test_no_status_retries(_):
+        adapter = _requests.session(retry=False).get_adapter("https://www.usgs.gov")
+        retries = adapter.max_retries
+        assert retries.connect == 3
+        assert retries.read is False
+        for status in [429, 502, 503, 504]:
+            assert not retries.is_retry("GET", status, has_retry_after=True)
+
+
 class TestQueryUrl:
     def test(_):
         base = "https://www.usgs.gov"
@@ -146,29 +186,62 @@ class TestQueryUrl:
         output = _requests.query_url(base, params, decode=True)
         assert output == r"https://www.usgs.gov/?test=(in_parens)&another=5"
 
+    @pytest.mark.parametrize(
+        "base, params",
+        (
+            ("https://www.usgs.gov", {"a": "some text", "b": "test@usgs.gov"}),
+            ("https://www.usgs.gov/api", {"Layer_List": "240EVT;230CC"}),
+            ("https://www.usgs.gov/api", {"list": ["a", "b", 3], "none": None}),
+            ("https://www.usgs.gov/api?existing=1", {"new": 2}),
+            ("https://www.usgs.gov/api", {}),
+        ),
+    )
+    def test_parity(_, base, params):
+        expected = requests.Request(url=base, params=params).prepare().url
+        output = _requests.query_url(base, params, decode=False)
+        assert output == expected
+
 
 class TestGet:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_valid(_, mock, response, args):
         mock.return_value = response(200, b"Some content")
         output = _requests.get(*args)
         assert isinstance(output, Response)
+        mock.assert_called_with(
+            "https://www.usgs.gov",
+            params={"example": 1, "parameters": 2},
+            timeout=None,
+            stream=False,
+        )
+
+    @patch("requests.Session.get")
+    def test_headers(_, mock, response, args):
+        mock.return_value = response(200, b"Some content")
+        _requests.get(*args, headers={"If-None-Match": '"abc"'})
+        mock.assert_called_with(
+            "https://www.usgs.gov",
+            params={"example": 1, "parameters": 2},
+            timeout=None,
+            stream=False,
+            headers={"If-None-Match": '"abc"'},
+        )
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_connect_timeout(_, mock, args, assert_contains):
         mock.side_effect = ConnectTimeout("Took too long")
         with pytest.raises(ConnectTimeout) as error:
             _requests.get(*args)
         assert_contains(error, "Took too long to connect to the TNM server")
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_read_timeout(_, mock, args, assert_contains):
         mock.side_effect = ReadTimeout("Took too long")
         with pytest.raises(ReadTimeout) as error:
             _requests.get(*args)
         assert_contains(error, "The TNM server took too long to respond")
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_http_error(_, mock, response, args, assert_contains):
         mock.return_value = response(404, b"File not found")
         with pytest.raises(HTTPError) as error:
@@ -180,7 +253,7 @@ class TestGet:
 
 
 class TestContent:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, response, args):
         mock.return_value = response(200, b"Here is some content")
         output = _requests.content(*args)
@@ -189,7 +262,7 @@ class TestContent:
 
 
 class TestJson:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_valid(_, mock, json_response, args):
         content = {
             "text": "Some text",
@@ -201,16 +274,34 @@ class TestJson:
         assert isinstance(output, dict)
         assert output == content
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_invalid(_, mock, response, args, assert_contains):
         mock.return_value = response(200, b"This is not valid JSON")
         with pytest.raises(InvalidJSONError) as error:
             _requests.json(*args)
         assert_contains(error, "The TNM response was not valid JSON")
 
+    @patch("pfdf.data._utils.requests._validate", wraps=_requests._validate)
+    @patch("requests.Session.get")
+    def test_validates_once(_, mock, validate, json_response, args):
+        mock.return_value = json_response({"text": "Some text"})
+        _requests.json(*args)
+        validate.assert_called_once()
+
+
+class TestParseJson:
+    def test_valid(_, json_response):
+        output = _requests.parse_json(json_response({"text": "Some text"}), "TNM")
+        assert output == {"text": "Some text"}
+
+    def test_invalid(_, response, assert_contains):
+        with pytest.raises(InvalidJSONError) as error:
+            _requests.parse_json(response(200, b"This is not valid JSON"), "TNM")
+        assert_contains(error, "The TNM response was not valid JSON")
+
 
 class TestDownload:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, tmp_path, response, args):
         mock.return_value = response(200, b"This is some file")
         path = tmp_path / "test.txt"
@@ -218,6 +309,28 @@ class TestDownload:
 
         assert output == path
         assert output.read_text() == "This is some file"
+        assert list(tmp_path.iterdir()) == [path]
+
+    @pytest.mark.parametrize(
+        "failure",
+        (ReadTimeoutError(None, None, "timed out"), ProtocolError("dropped")),
+    )
+    @patch("requests.Session.get")
+    def test_interrupted(_, mock, failure, tmp_path, response, args, assert_contains):
+        class Interrupted(BytesIO):
+            def read(self, size=-1):
+                if self.tell() > 0:
+                    raise failure
+                return super().read(4)
+
+        output = response(200)
+        output.raw = Interrupted(b"This is some file")
+        mock.return_value = output
+        path = tmp_path / "test.txt"
+        with pytest.raises(ReadTimeout) as error:
+            _requests.download(path, *args)
+        assert_contains(error, "The TNM server took too long to respond")
+        assert list(tmp_path.iterdir()) == []
 
 
 #####
@@ -40,6 +40,16 @@ class TestUnzip:
         assert file2.exists()
         assert file2.read_text() == "Here is another file"
 
+    def test_path(_, zbytes, tmp_path, path):
+        archive = tmp_path / "archive.zip"
+        archive.write_bytes(zbytes)
+
+        assert not path.exists()
+        unzip(archive, path)
+        assert path.exists()
+        assert (path / "file1.txt").read_text() == "Here is a file"
+        assert (path / "file2.txt").read_text() == "Here is another file"
+
     def test_item(_, tmp_path, path):
 
         # Build two example files
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import numpy as np
 import pytest
 
@@ -49,6 +51,23 @@ class TestBounds:
         ]
         assert np.allclose(output, expected)
 
+    @patch("pfdf.projection.BoundingBox.reproject")
+    def test_epsg4326(_, mock):
+        validate._epsg4326.cache_clear()
+        a = BoundingBox(-107, 32, -106, 33, 4326)
+        assert validate.bounds(a) == "-107.0,32.0,-106.0,33.0"
+        mock.assert_not_called()
+
+    def test_cached(_):
+        validate._epsg4326.cache_clear()
+        a = BoundingBox(-107, 32, -106, 33, 4326).to_utm()
+        output1 = validate.bounds(a)
+        output2 = validate.bounds(a.copy())
+        assert output1 == output2
+        info = validate._epsg4326.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
     def test_other_crs_object(_):
         a = BoundingBox(1, 2, 3, 4, 26911)
         output = validate.bounds(a, as_string=False)
@@ -60,6 +79,10 @@ class TestStrings:
         output = validate.strings("some text", "")
         assert output == "some text"
 
+    def test_delimited_string(_):
+        output = validate.strings("240EVT;230CC", "", delimiter=";")
+        assert output == "240EVT;230CC"
+
     def test_list_single_string(_):
         output = validate.strings(["some text"], "")
         assert output == "some text"
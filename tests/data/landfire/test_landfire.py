@@ -3,8 +3,13 @@ from unittest.mock import patch
 import numpy as np
 import pytest
 
-from pfdf.data.landfire import _landfire
-from pfdf.errors import DataAPIError, InvalidLFPSJobError, LFPSJobTimeoutError
+from pfdf.data.landfire import _cache, _landfire, _validate
+from pfdf.errors import (
+    DataAPIError,
+    InvalidJSONError,
+    InvalidLFPSJobError,
+    LFPSJobTimeoutError,
+)
 from pfdf.projection import Transform
 from pfdf.raster import Raster
 
@@ -13,11 +18,26 @@ from pfdf.raster import Raster
 #####
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    "Ensures each test starts and ends with an empty job cache"
+    _landfire.clear_cache()
+    yield
+    _landfire.clear_cache()
+
+
+def job_key(bounds):
+    "Returns the cache key for a 240EVT job in the given bounds"
+    params = _validate.submit_job("240EVT", bounds, "test@usgs.gov")
+    return _cache.key(params)
+
+
 def check_status_mock(mock):
     mock.assert_called_with(
         "https://lfps.usgs.gov/api/job/status",
         params={"JobId": "12345"},
         timeout=10,
+        stream=False,
     )
 
 
@@ -91,6 +111,34 @@ def download_mock(json_response, completed_job, zip_data):
     return download_mock
 
 
+@pytest.fixture
+def many_mock(json_response, response, completed_job, zip_bytes, tmp_path, job_raster):
+    "Returns a function that mocks requests.get for repeated downloads"
+
+    files = {
+        "12345.tif": job_raster,
+        "12345.xml": "An XML metadata file in the job",
+    }
+    content = zip_bytes(tmp_path, files)
+
+    def many_mock(url, *args, **kwargs):
+        "Mocks requests.get with a new response for each query"
+
+        # Job submission
+        if url == "https://lfps.usgs.gov/api/job/submit":
+            return json_response({"jobId": "12345", "jobStatus": "esriJobSubmitted"})
+
+        # Job completion
+        elif url.startswith("https://lfps.usgs.gov/api/job/status"):
+            return json_response(completed_job)
+
+        # File download
+        elif url == completed_job["outputFile"]:
+            return response(200, content)
+
+    return many_mock
+
+
 @pytest.fixture
 def timeout_mock(json_response):
     "Returns a function used to mock requests.get for timed out jobs"
@@ -165,7 +213,7 @@ class TestCheckStatus:
 
 
 class TestExecuteJob:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_success(_, mock, json_response):
         running = {"jobId": "12345", "status": "Executing"}
         finished = {
@@ -180,7 +228,24 @@ class TestExecuteJob:
         assert output == "https://some-file.zip"
         check_status_mock(mock)
 
-    @patch("requests.get")
+    @patch("pfdf.data.landfire._landfire.sleep")
+    @patch("requests.Session.get")
+    def test_backoff(_, mock, sleep_mock, json_response):
+        running = {"jobId": "12345", "status": "Executing"}
+        finished = {
+            "jobId": "12345",
+            "status": "Succeeded",
+            "outputFile": "https://some-file.zip",
+        }
+        responses = [json_response(status) for status in [running] * 4 + [finished]]
+        mock.side_effect = responses
+
+        output = _landfire._execute_job("12345", 15, 5, 10)
+        assert output == "https://some-file.zip"
+        waits = [call.args[0] for call in sleep_mock.call_args_list]
+        assert waits == [1, 2, 4, 5, 3]
+
+    @patch("requests.Session.get")
     def test_failed(_, mock, json_response, assert_contains):
         running = {"jobId": "12345", "status": "Executing"}
         failed = {"jobId": "12345", "status": "Failed"}
@@ -192,7 +257,7 @@ class TestExecuteJob:
         assert_contains(error, "Cannot download job 12345 because the job failed")
         check_status_mock(mock)
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_timed_out(_, mock, json_response, assert_contains):
         running = {"jobId": "12345", "status": "Executing"}
         responses = [json_response(running)] * 5
@@ -211,6 +276,115 @@ class TestExecuteJob:
 #####
 
 
+class TestJobUrl:
+    @staticmethod
+    def submitted(get_mock):
+        return [
+            call
+            for call in get_mock.call_args_list
+            if call.args[0] == "https://lfps.usgs.gov/api/job/submit"
+        ]
+
+    @patch("requests.Session.get")
+    def test_new_job(self, get_mock, download_mock, download_url):
+        get_mock.side_effect = download_mock
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        output = _landfire._job_url("240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, True)
+        assert output == download_url
+        assert len(self.submitted(get_mock)) == 1
+
+        key = job_key(bounds)
+        assert _cache.get(key) == "12345"
+
+    @patch("requests.Session.get")
+    def test_cached_job(self, get_mock, download_mock, download_url):
+        get_mock.side_effect = download_mock
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        for _ in range(3):
+            output = _landfire._job_url(
+                "240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, True
+            )
+            assert output == download_url
+        assert len(self.submitted(get_mock)) == 1
+
+    @patch("requests.Session.get")
+    def test_no_cache(self, get_mock, download_mock, download_url):
+        get_mock.side_effect = download_mock
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        for _ in range(2):
+            output = _landfire._job_url(
+                "240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, False
+            )
+            assert output == download_url
+        assert len(self.submitted(get_mock)) == 2
+
+        key = job_key(bounds)
+        assert _cache.get(key) is None
+
+    @patch("requests.Session.get")
+    def test_validates_once(self, get_mock, download_mock, download_url):
+        get_mock.side_effect = download_mock
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        with patch.object(
+            _validate, "submit_job", wraps=_validate.submit_job
+        ) as validate_mock:
+            output = _landfire._job_url(
+                "240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, True
+            )
+        assert output == download_url
+        validate_mock.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_stale_job(self, get_mock, json_response, download_mock, download_url):
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        key = job_key(bounds)
+        _cache.add(key, "stale")
+
+        def stale_mock(url, params=None, *args, **kwargs):
+            if params == {"JobId": "stale"}:
+                return json_response({"success": False, "message": "JobId not found"})
+            return download_mock(url, params, *args, **kwargs)
+
+        get_mock.side_effect = stale_mock
+        output = _landfire._job_url("240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, True)
+        assert output == download_url
+        assert len(self.submitted(get_mock)) == 1
+        assert _cache.get(key) == "12345"
+
+    @patch("requests.Session.get")
+    def test_invalid_cached_response(self, get_mock, response, download_mock):
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        key = job_key(bounds)
+        _cache.add(key, "cached")
+
+        def invalid_mock(url, params=None, *args, **kwargs):
+            if params == {"JobId": "cached"}:
+                return response(200, b"This is not valid JSON")
+            return download_mock(url, params, *args, **kwargs)
+
+        get_mock.side_effect = invalid_mock
+        with pytest.raises(InvalidJSONError):
+            _landfire._job_url("240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, True)
+        assert len(self.submitted(get_mock)) == 0
+        assert _cache.get(key) == "cached"
+
+    @patch("requests.Session.get")
+    def test_failed_job(self, get_mock, json_response, assert_contains):
+        def failed_mock(url, *args, **kwargs):
+            if url == "https://lfps.usgs.gov/api/job/submit":
+                return json_response({"jobId": "12345", "status": "Submitted"})
+            return json_response({"jobId": "12345", "status": "Failed"})
+
+        get_mock.side_effect = failed_mock
+        bounds = [-107.8, 32.2, -107.6, 32.4, 4326]
+        with pytest.raises(InvalidLFPSJobError) as error:
+            _landfire._job_url("240EVT", bounds, "test@usgs.gov", 5, 0.1, 10, True)
+        assert_contains(error, "Cannot download job 12345 because the job failed")
+
+        key = job_key(bounds)
+        assert _cache.get(key) is None
+
+
 class TestDownload:
     @staticmethod
     def check_data(folder, job_raster):
@@ -228,7 +402,7 @@ class TestDownload:
         assert xml.read_text() == "An XML metadata file in the job"
 
     @patch("pfdf.data.landfire._validate.refresh_rate")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_default_path(
         self, get_mock, refresh_mock, download_mock, job_raster, tmp_path, monkeypatch
     ):
@@ -247,7 +421,7 @@ class TestDownload:
         self.check_data(path, job_raster)
 
     @patch("pfdf.data.landfire._validate.refresh_rate")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_custom_path(
         self, get_mock, refresh_mock, download_mock, job_raster, tmp_path
     ):
@@ -273,7 +447,7 @@ class TestDownload:
 
     @patch("pfdf.data.landfire._validate.max_job_time")
     @patch("pfdf.data.landfire._validate.refresh_rate")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_timeout(
         self, get_mock, refresh_mock, max_mock, timeout_mock, tmp_path, assert_contains
     ):
@@ -299,9 +473,79 @@ class TestDownload:
         assert not path.exists()
 
 
+class TestDownloadMany:
+    @patch("pfdf.data.landfire._validate.refresh_rate")
+    @patch("requests.Session.get")
+    def test_default_path(
+        self, get_mock, refresh_mock, many_mock, job_raster, tmp_path, monkeypatch
+    ):
+        get_mock.side_effect = many_mock
+        refresh_mock.return_value = 0.1
+        monkeypatch.chdir(tmp_path)
+
+        layers = ["240EVT", "240CC", "240CH"]
+        paths = [tmp_path / f"landfire-{layer}" for layer in layers]
+        output = _landfire.download_many(
+            layers, [-107.8, 32.2, -107.6, 32.4, 4326], "test@usgs.gov"
+        )
+        assert output == paths
+        for path in paths:
+            TestDownload.check_data(path, job_raster)
+
+    @patch("pfdf.data.landfire._validate.refresh_rate")
+    @patch("requests.Session.get")
+    def test_parent(self, get_mock, refresh_mock, many_mock, job_raster, tmp_path):
+        get_mock.side_effect = many_mock
+        refresh_mock.return_value = 0.1
+
+        output = _landfire.download_many(
+            ["240EVT", "240CC"],
+            [-107.8, 32.2, -107.6, 32.4, 4326],
+            "test@usgs.gov",
+            parent=tmp_path,
+            max_workers=1,
+        )
+        assert output == [tmp_path / "landfire-240EVT", tmp_path / "landfire-240CC"]
+        for path in output:
+            TestDownload.check_data(path, job_raster)
+
+    @patch("requests.Session.get")
+    def test_existing(self, get_mock, tmp_path, assert_contains):
+        (tmp_path / "landfire-240CC").mkdir()
+        with pytest.raises(FileExistsError) as error:
+            _landfire.download_many(
+                ["240EVT", "240CC"],
+                [-107.8, 32.2, -107.6, 32.4, 4326],
+                "test@usgs.gov",
+                parent=tmp_path,
+            )
+        assert_contains(error, "landfire-240CC")
+        get_mock.assert_not_called()
+        assert not (tmp_path / "landfire-240EVT").exists()
+
+    def test_duplicate_layers(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            _landfire.download_many(
+                ["240EVT", "240EVT"],
+                [-107.8, 32.2, -107.6, 32.4, 4326],
+                "test@usgs.gov",
+            )
+        assert_contains(error, "layers cannot contain duplicate layer names")
+
+    def test_invalid_workers(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            _landfire.download_many(
+                "240EVT",
+                [-107.8, 32.2, -107.6, 32.4, 4326],
+                "test@usgs.gov",
+                max_workers=0,
+            )
+        assert_contains(error, "max_workers")
+
+
 class TestRead:
     @patch("pfdf.data.landfire._validate.refresh_rate")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test(_, get_mock, refresh_mock, download_mock, job_raster):
         get_mock.side_effect = download_mock
         refresh_mock.return_value = 0.1
@@ -313,7 +557,7 @@ class TestRead:
         assert output == Raster(job_raster)
 
     @patch("pfdf.data.landfire._validate.refresh_rate")
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_not_raster(_, get_mock, refresh_mock, vector_mock, assert_contains):
         get_mock.side_effect = vector_mock
         refresh_mock.return_value = 0.1
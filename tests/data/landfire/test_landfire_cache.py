@@ -0,0 +1,131 @@
+from unittest.mock import patch
+
+import pytest
+
+from pfdf.data.landfire import _cache, _validate
+
+
+@pytest.fixture(autouse=True)
+def clear():
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
+@pytest.fixture
+def key():
+    params = _validate.submit_job(
+        "240EVT", [-107.8, 32.2, -107.6, 32.4, 4326], "test@usgs.gov"
+    )
+    return _cache.key(params)
+
+
+class TestKey:
+    def test(_, key):
+        assert isinstance(key, tuple)
+        assert key[0] == ("Layer_List", "240EVT")
+        assert key[2] == ("Email", "test@usgs.gov")
+
+    def test_equal(_, key):
+        params = _validate.submit_job(
+            ["240EVT"], (-107.8, 32.2, -107.6, 32.4, 4326), "test@usgs.gov"
+        )
+        output = _cache.key(params)
+        assert output == key
+        assert hash(output) == hash(key)
+
+    def test_different(_, key):
+        params = _validate.submit_job(
+            "240CC", [-107.8, 32.2, -107.6, 32.4, 4326], "test@usgs.gov"
+        )
+        output = _cache.key(params)
+        assert output != key
+
+
+class TestGet:
+    def test_missing(_, key):
+        assert _cache.get(key) is None
+
+    def test_cached(_, key):
+        _cache.add(key, "12345")
+        assert _cache.get(key) == "12345"
+
+    @patch("pfdf.data.landfire._cache.monotonic")
+    def test_expired(_, mock, key):
+        mock.return_value = 0
+        _cache.add(key, "12345")
+        mock.return_value = _cache._MAX_AGE + 1
+        assert _cache.get(key) is None
+        assert key not in _cache._JOBS
+
+
+class TestRemove:
+    def test(_, key):
+        _cache.add(key, "12345")
+        _cache.remove(key)
+        assert _cache.get(key) is None
+
+    def test_missing(_, key):
+        _cache.remove(key)
+        assert _cache.get(key) is None
+
+
+class TestCatalog:
+    def test_missing(_):
+        assert _cache.catalog() is None
+
+    def test_cached(_):
+        evt = {"layerName": "240EVT", "acronym": "EVT"}
+        cc = {"layerName": "240CC", "acronym": "CC"}
+        products = [evt, cc]
+        output = _cache.set_catalog(products)
+        assert output == {
+            "products": products,
+            "acronyms": {"evt": [evt], "cc": [cc]},
+            "layers": {"240evt": evt, "240cc": cc},
+        }
+        assert _cache.catalog() is output
+
+    @patch("pfdf.data.landfire._cache.monotonic")
+    def test_expired(_, mock):
+        mock.return_value = 0
+        _cache.set_catalog([{"layerName": "240EVT", "acronym": "EVT"}])
+        mock.return_value = _cache._CATALOG_AGE + 1
+        assert _cache.catalog() is None
+
+    def test_validators(_):
+        headers = {"ETag": '"abc"', "Last-Modified": "Wed, 01 Jan 2025 00:00:00 GMT"}
+        _cache.set_catalog([{"layerName": "240EVT", "acronym": "EVT"}], headers)
+        assert _cache.validators() == {
+            "If-None-Match": '"abc"',
+            "If-Modified-Since": "Wed, 01 Jan 2025 00:00:00 GMT",
+        }
+
+    def test_no_validators(_):
+        assert _cache.validators() == {}
+        _cache.set_catalog([{"layerName": "240EVT", "acronym": "EVT"}], {})
+        assert _cache.validators() == {}
+
+    @patch("pfdf.data.landfire._cache.monotonic")
+    def test_renew(_, mock):
+        mock.return_value = 0
+        output = _cache.set_catalog([{"layerName": "240EVT", "acronym": "EVT"}])
+        mock.return_value = _cache._CATALOG_AGE + 1
+        assert _cache.catalog() is None
+        assert _cache.renew_catalog() is output
+        assert _cache.catalog() is output
+
+    def test_renew_cleared(_):
+        _cache.set_catalog([{"layerName": "240EVT", "acronym": "EVT"}])
+        _cache.clear()
+        assert _cache.renew_catalog() is None
+        assert _cache.catalog() is None
+
+
+class TestClear:
+    def test(_, key):
+        _cache.add(key, "12345")
+        _cache.set_catalog([{"layerName": "240EVT", "acronym": "EVT"}])
+        _cache.clear()
+        assert _cache._JOBS == {}
+        assert _cache.catalog() is None
@@ -1,16 +1,25 @@
 from unittest.mock import patch
 
 import pytest
+from requests.exceptions import HTTPError
 
+from pfdf.data._utils import requests as _requests
 from pfdf.data.landfire import job
-from pfdf.errors import DataAPIError, MissingAPIFieldError, MissingCRSError
+from pfdf.errors import (
+    DataAPIError,
+    LFPSJobTimeoutError,
+    MissingAPIFieldError,
+    MissingCRSError,
+    MissingLFPSJobError,
+)
 
 
 def check_status_mock(mock):
     mock.assert_called_with(
-        url="https://lfps.usgs.gov/api/job/status",
+        "https://lfps.usgs.gov/api/job/status",
         params={"JobId": "12345"},
-        timeout=10,
+        timeout=(3.05, 30),
+        stream=False,
     )
 
 
@@ -25,7 +34,7 @@ def missing_job(missing, json_response):
 
 
 class TestSubmit:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {
             "jobId": "12345",
@@ -37,15 +46,30 @@ class TestSubmit:
         output = job.submit(layers, bounds, "test@usgs.gov")
         assert output == "12345"
         mock.assert_called_with(
-            url="https://lfps.usgs.gov/api/job/submit",
+            "https://lfps.usgs.gov/api/job/submit",
             params={
                 "Layer_List": "240EVT;230EVT",
                 "Area_of_Interest": "-107.6 32.2 -107.2 32.8",
                 "Email": "test@usgs.gov",
             },
-            timeout=10,
+            timeout=(3.05, 30),
+            stream=False,
         )
 
+    @patch("pfdf.data._utils.requests.session", wraps=_requests.session)
+    @patch("requests.Session.get")
+    def test_no_status_retry(_, mock, session, response, assert_contains):
+        mock.return_value = response(503)
+        layers = "240EVT"
+        bounds = [-107.6, 32.2, -107.2, 32.8, 4326]
+        with pytest.raises(HTTPError) as error:
+            job.submit(layers, bounds, "test@usgs.gov")
+        assert_contains(error, "problem connecting with the LANDFIRE LFPS server")
+        session.assert_called_once_with(False)
+        mock.assert_called_once()
+        adapter = _requests.session(False).get_adapter("https://lfps.usgs.gov")
+        assert not adapter.max_retries.is_retry("GET", 503, has_retry_after=True)
+
     def test_no_crs(_, assert_contains):
         layers = "240EVT"
         bounds = [-107.6, 32.2, -107.2, 32.8]
@@ -55,7 +79,7 @@ class TestSubmit:
 
 
 class TestStatus:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {
             "jobId": "12345",
@@ -67,7 +91,7 @@ class TestStatus:
         assert output == content
         check_status_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_missing(_, mock, missing_job, assert_contains):
         mock.return_value = missing_job
         with pytest.raises(ValueError) as error:
@@ -77,7 +101,7 @@ class TestStatus:
         )
         check_status_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_missing_not_strict(_, mock, missing_job, missing):
         mock.return_value = missing_job
         output = job.status("12345", strict=False)
@@ -86,7 +110,7 @@ class TestStatus:
 
 
 class TestStatusCode:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {"jobId": "12345", "status": "Succeeded"}
         mock.return_value = json_response(content)
@@ -94,7 +118,7 @@ class TestStatusCode:
         assert output == "Succeeded"
         check_status_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_missing(_, mock, missing_job, assert_contains):
         mock.return_value = missing_job
         with pytest.raises(ValueError) as error:
@@ -104,7 +128,7 @@ class TestStatusCode:
         )
         check_status_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_no_status(_, mock, json_response, assert_contains):
         content = {"jobId": "12345"}
         mock.return_value = json_response(content)
@@ -114,11 +138,80 @@ class TestStatusCode:
         check_status_mock(mock)
 
 
+class TestPoll:
+    @patch("pfdf.data.landfire.job.sleep")
+    @patch("requests.Session.get")
+    def test_backoff(_, mock, sleep_mock, json_response):
+        running = {"jobId": "12345", "status": "Executing"}
+        finished = {"jobId": "12345", "status": "Succeeded"}
+        mock.side_effect = [json_response(running)] * 4 + [json_response(finished)]
+
+        output = job.poll("12345", interval=2, max_interval=5, jitter=0)
+        assert output == "Succeeded"
+        waits = [call.args[0] for call in sleep_mock.call_args_list]
+        assert waits == [2, 3, 4.5, 5]
+        check_status_mock(mock)
+
+    @pytest.mark.parametrize("status", ("Failed", "Canceled"))
+    @patch("pfdf.data.landfire.job.sleep")
+    @patch("requests.Session.get")
+    def test_final(_, mock, sleep_mock, status, json_response):
+        mock.return_value = json_response({"jobId": "12345", "status": status})
+        assert job.poll("12345") == status
+        sleep_mock.assert_not_called()
+
+    @patch("pfdf.data.landfire.job.sleep")
+    @patch("requests.Session.get")
+    def test_jitter(_, mock, sleep_mock, json_response):
+        running = {"jobId": "12345", "status": "Executing"}
+        finished = {"jobId": "12345", "status": "Succeeded"}
+        mock.side_effect = [json_response(running)] * 10 + [json_response(finished)]
+
+        job.poll("12345", interval=1, max_interval=1, jitter=0.5)
+        for call in sleep_mock.call_args_list:
+            assert 1 <= call.args[0] <= 1.5
+
+    @patch("pfdf.data.landfire.job.monotonic")
+    @patch("pfdf.data.landfire.job.sleep")
+    @patch("requests.Session.get")
+    def test_max_job_time(_, mock, sleep_mock, time, json_response, assert_contains):
+        mock.side_effect = lambda *args, **kwargs: json_response(
+            {"jobId": "12345", "status": "Executing"}
+        )
+        time.side_effect = [0, 5, 10]
+        with pytest.raises(LFPSJobTimeoutError) as error:
+            job.poll("12345", max_job_time=10)
+        assert_contains(error, "LANDFIRE LFPS took too long to process job 12345")
+        assert sleep_mock.call_count == 1
+
+    @patch("pfdf.data.landfire.job.monotonic")
+    @patch("pfdf.data.landfire.job.sleep")
+    @patch("requests.Session.get")
+    def test_clipped_wait(_, mock, sleep_mock, time, json_response):
+        mock.side_effect = lambda *args, **kwargs: json_response(
+            {"jobId": "12345", "status": "Executing"}
+        )
+        time.side_effect = [0, 0, 8, 10]
+        with pytest.raises(LFPSJobTimeoutError):
+            job.poll("12345", interval=5, max_interval=5, jitter=1, max_job_time=10)
+        waits = [call.args[0] for call in sleep_mock.call_args_list]
+        assert len(waits) == 2
+        assert 5 <= waits[0] <= 6
+        assert waits[1] == 2
+
+    def test_invalid_interval(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            job.poll("12345", interval=0)
+        assert_contains(error, "interval")
+
+
 class TestJobError:
     def test_missing_job(_):
         response = {"message": "JobId not found"}
         output = job._job_error(response, "12345")
+        assert isinstance(output, MissingLFPSJobError)
         assert isinstance(output, ValueError)
+        assert output.id == "12345"
         assert (
             "The queried job (12345) could not be found on the LFPS server"
             in output.args[0]
@@ -1,18 +1,40 @@
+import json
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
+from requests import Response
 
+from pfdf.data.landfire import _cache
 from pfdf.data.landfire import products as _products
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    "Ensures each test queries the product catalog"
+    _cache.clear()
+    yield
+    _cache.clear()
+
+
 def check_mock(mock):
     mock.assert_called_with(
-        url="https://lfps.usgs.gov/api/products",
+        "https://lfps.usgs.gov/api/products",
         params={},
-        timeout=10,
+        timeout=(3.05, 30),
+        stream=False,
     )
 
 
+def json_content(content, status_code=200):
+    """Returns a single-use JSON response. (The json_response fixture can't be used
+    alongside the response fixture, which it overrides)"""
+    response = Response()
+    response.status_code = status_code
+    response.raw = BytesIO(json.dumps(content).encode())
+    return response
+
+
 def product(name, acronym, version):
     return {
         "layerName": name,
@@ -51,29 +73,171 @@ def response(json_response, products):
 
 
 class TestQuery:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_all(_, mock, response, products):
         mock.return_value = response
         output = _products.query()
         assert output == products
         check_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_acronym(_, mock, response, evts):
         mock.return_value = response
         output = _products.query(acronym="EVT")
         assert output == evts
         check_mock(mock)
 
+    @patch("requests.Session.get")
+    def test_acronym_case(_, mock, response, evts):
+        mock.return_value = response
+        output = _products.query(acronym="evt")
+        assert output == evts
+
+    @patch("requests.Session.get")
+    def test_unknown_acronym(_, mock, response):
+        mock.return_value = response
+        output = _products.query(acronym="unknown")
+        assert output == []
+
+
+class TestQueryMany:
+    @patch("requests.Session.get")
+    def test(_, mock, response, evts, others):
+        mock.return_value = response
+        output = _products.query_many(["other", "evt", "unknown"])
+        assert output == [others, evts, []]
+        assert mock.call_count == 1
+        check_mock(mock)
+
+    @patch("requests.Session.get")
+    def test_string(_, mock, response, evts):
+        mock.return_value = response
+        output = _products.query_many("EVT")
+        assert output == [evts]
+
+    @patch("requests.Session.get")
+    def test_invalid(_, mock, assert_contains):
+        with pytest.raises(TypeError) as error:
+            _products.query_many(["EVT", 5])
+        assert_contains(error, "acronym must be a string")
+        mock.assert_not_called()
+
+
+class TestCatalog:
+    @patch("requests.Session.get")
+    def test_cached(_, mock, response, products):
+        mock.return_value = response
+        for _ in range(3):
+            output = _products.query()
+            assert output == products
+        mock.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_copy(_, mock, response, products):
+        mock.return_value = response
+        output = _products.query()
+        output.clear()
+        assert _products.query() == products
+
+    @patch("requests.Session.get")
+    def test_copy_products(_, mock, response, products):
+        mock.return_value = response
+        _products.query()[0]["layerName"] = "altered"
+        _products.query("evt")[0]["layerName"] = "altered"
+        _products.query_many(["evt"])[0][0]["layerName"] = "altered"
+        _products.layer("250evt")["layerName"] = "altered"
+        assert _products.query() == products
+
+    @patch("pfdf.data.landfire._cache.monotonic")
+    @patch("requests.Session.get")
+    def test_expired(_, mock, time, products):
+        mock.side_effect = [
+            json_content({"products": products}),
+            json_content({"products": products[:1]}),
+        ]
+        time.return_value = 0
+        assert _products.query() == products
+        time.return_value = _cache._CATALOG_AGE + 1
+        assert _products.query() == products[:1]
+        assert mock.call_count == 2
+
+    @patch("pfdf.data.landfire._cache.monotonic")
+    @patch("requests.Session.get")
+    def test_not_modified(_, mock, time, products):
+        catalog = json_content({"products": products})
+        catalog.headers["ETag"] = '"abc"'
+        mock.side_effect = [catalog, json_content({}, status_code=304)]
+
+        time.return_value = 0
+        assert _products.query() == products
+        time.return_value = _cache._CATALOG_AGE + 1
+        assert _products.query() == products
+        assert mock.call_count == 2
+        mock.assert_called_with(
+            "https://lfps.usgs.gov/api/products",
+            params={},
+            timeout=(3.05, 30),
+            stream=False,
+            headers={"If-None-Match": '"abc"'},
+        )
+
+        # The renewed catalog is reused without another query
+        assert _products.query() == products
+        assert mock.call_count == 2
+
+    @patch("pfdf.data.landfire._cache.monotonic")
+    @patch("requests.Session.get")
+    def test_cleared_before_not_modified(_, mock, time, products):
+        catalog = json_content({"products": products})
+        catalog.headers["ETag"] = '"abc"'
+
+        responses = iter([catalog, None, json_content({"products": products[:1]})])
+
+        # Clear the cache while the conditional query is in progress
+        def get(*args, **kwargs):
+            response = next(responses)
+            if response is None:
+                _cache.clear()
+                response = json_content({}, status_code=304)
+            return response
+
+        mock.side_effect = get
+        time.return_value = 0
+        assert _products.query() == products
+        time.return_value = _cache._CATALOG_AGE + 1
+        assert _products.query() == products[:1]
+        assert mock.call_count == 3
+        mock.assert_called_with(
+            "https://lfps.usgs.gov/api/products",
+            params={},
+            timeout=(3.05, 30),
+            stream=False,
+        )
+
 
 class TestAcronyms:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, response):
         mock.return_value = response
         output = _products.acronyms()
         assert output == ["EVT", "other"]
         check_mock(mock)
 
+    @patch("requests.Session.get")
+    def test_copy(_, mock, response):
+        mock.return_value = response
+        output = _products.acronyms()
+        output.clear()
+        assert _products.acronyms() == ["EVT", "other"]
+        mock.assert_called_once()
+
+    @patch("requests.Session.get")
+    def test_case(_, mock, products):
+        products.append(product("100evt", "evt", "1.0.0"))
+        mock.return_value = json_content({"products": products})
+        output = _products.acronyms()
+        assert output == ["EVT", "other", "evt"]
+
     @pytest.mark.web
     def test_live(_):
         output = _products.acronyms()
@@ -123,7 +287,7 @@ class TestAcronyms:
 
 
 class TestLayers:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_all(_, mock, response):
         mock.return_value = response
         output = _products.layers()
@@ -137,7 +301,7 @@ class TestLayers:
         ]
         check_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_acronym(_, mock, response):
         mock.return_value = response
         output = _products.layers(acronym="EVT")
@@ -146,14 +310,25 @@ class TestLayers:
 
 
 class TestLatest:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, response):
         mock.return_value = response
         output = _products.latest("EVT")
         assert output == product("250EVT", "EVT", "2.5.0")
         check_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
+    def test_multidigit_version(_, mock):
+        products = [
+            product("290EVT", "EVT", "2.9.0"),
+            product("2100EVT", "EVT", "2.10.0"),
+            product("280EVT", "EVT", "2.8.0"),
+        ]
+        mock.return_value = json_content({"products": products})
+        output = _products.latest("EVT")
+        assert output == product("2100EVT", "EVT", "2.10.0")
+
+    @patch("requests.Session.get")
     def test_unknown_acronym(_, mock, response, assert_contains):
         mock.return_value = response
         with pytest.raises(ValueError) as error:
@@ -163,15 +338,31 @@ class TestLatest:
         )
 
 
+class TestVersion:
+    def test_numeric(_):
+        assert _products._version({"version": "2.10.0"}) == ((1, 2), (1, 10), (1, 0))
+
+    def test_text(_):
+        output = _products._version({"version": "2.0.beta"})
+        assert output == ((1, 2), (1, 0), (0, "beta"))
+        assert output < _products._version({"version": "2.0.0"})
+
+
 class TestLayer:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, response):
         mock.return_value = response
         output = _products.layer("other200")
         assert output == product("other200", "other", "2.0.0")
         check_mock(mock)
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
+    def test_case_insensitive(_, mock, response):
+        mock.return_value = response
+        output = _products.layer("250evt")
+        assert output == product("250EVT", "EVT", "2.5.0")
+
+    @patch("requests.Session.get")
     def test_no_match(_, mock, response, assert_contains):
         mock.return_value = response
         with pytest.raises(ValueError) as error:
@@ -181,3 +372,32 @@ class TestLayer:
             'There are no LANDFIRE LFPS products matching the "missing" layer name',
         )
         check_mock(mock)
+
+
+class TestLayersInfo:
+    @patch("requests.Session.get")
+    def test(_, mock, response):
+        mock.return_value = response
+        output = _products.layers_info(["other200", "250evt"])
+        assert output == [
+            product("other200", "other", "2.0.0"),
+            product("250EVT", "EVT", "2.5.0"),
+        ]
+        assert mock.call_count == 1
+        check_mock(mock)
+
+    @patch("requests.Session.get")
+    def test_string(_, mock, response):
+        mock.return_value = response
+        output = _products.layers_info("other200")
+        assert output == [product("other200", "other", "2.0.0")]
+
+    @patch("requests.Session.get")
+    def test_no_match(_, mock, response, assert_contains):
+        mock.return_value = response
+        with pytest.raises(ValueError) as error:
+            _products.layers_info(["250EVT", "missing"])
+        assert_contains(
+            error,
+            'There are no LANDFIRE LFPS products matching the "missing" layer name',
+        )
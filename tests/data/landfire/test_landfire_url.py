@@ -12,12 +12,6 @@ class TestApi:
         assert url.api() == "https://lfps.usgs.gov/api"
 
 
-class TestQuery:
-    def test(_):
-        output = url._query("test")
-        assert output == "https://lfps.usgs.gov/api/test"
-
-
 class TestProducts:
     def test(_):
         assert url.products() == "https://lfps.usgs.gov/api/products"
@@ -32,6 +26,13 @@ class TestJob:
         output = url.job(action)
         assert output == f"https://lfps.usgs.gov/api/job/{action}"
 
+    def test_action_constant(_):
+        assert url.job("status") is url.job("status")
+
+    def test_action_case(_):
+        output = url.job("SUBMIT")
+        assert output == "https://lfps.usgs.gov/api/job/submit"
+
     def test_invalid_action(_, assert_contains):
         with pytest.raises(ValueError) as error:
             url.job("invalid")
@@ -22,6 +22,26 @@ class TestLayer:
         assert_contains(error, "layer cannot contain semicolons")
 
 
+class TestLayers:
+    def test_single(_):
+        output = _validate.layers("240EVT")
+        assert output == ["240EVT"]
+
+    def test_multiple(_):
+        output = _validate.layers(("240EVT", "240CC"))
+        assert output == ["240EVT", "240CC"]
+
+    def test_invalid(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            _validate.layers(["240EVT", "240EVT;230EVT"])
+        assert_contains(error, "layer cannot contain semicolons")
+
+    def test_duplicate(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            _validate.layers(["240EVT", "240EVT"])
+        assert_contains(error, "layers cannot contain duplicate layer names")
+
+
 class TestJobTime:
     def test_valid(_):
         input = np.array(15)
@@ -71,10 +91,15 @@ class TestRefreshRate:
             error, "refresh_rate cannot be greater than 3600 seconds (1 hour)"
         )
 
+    def test_small(_):
+        output = _validate.refresh_rate(1)
+        assert isinstance(output, float)
+        assert output == 1
+
     def test_too_small(_, assert_contains):
         with pytest.raises(ValueError) as error:
-            _validate.refresh_rate(10)
-        assert_contains(error, "refresh_rate must be greater than or equal to 15")
+            _validate.refresh_rate(0.5)
+        assert_contains(error, "refresh_rate must be greater than or equal to 1")
 
 
 #####
@@ -1,8 +1,11 @@
+from io import BytesIO
 from unittest.mock import patch
 
 import pytest
+from requests import Response
 
 from pfdf.data.noaa import atlas14
+from pfdf.errors import ShapeError
 
 
 @pytest.fixture
@@ -10,6 +13,14 @@ def response(response):
     return response(200, b"Here is some content")
 
 
+def content_response(*args, content=b"Here is some content", **kwargs):
+    "Returns a new single-use response, suitable as a mock side effect"
+    response = Response()
+    response.status_code = 200
+    response.raw = BytesIO(content)
+    return response
+
+
 class TestBaseUrl:
     def test(_):
         assert atlas14.base_url() == "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new"
@@ -44,6 +55,9 @@ class TestQueryUrl:
         output = atlas14.query_url(statistic)
         assert output == f"https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text{key}.csv"
 
+    def test_cached(_):
+        assert atlas14.query_url("mean") is atlas14.query_url("MEAN")
+
     def test_invalid(_, assert_contains):
         with pytest.raises(ValueError) as error:
             atlas14.query_url("median")
@@ -54,7 +68,7 @@ class TestQueryUrl:
 
 
 class TestDownload:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_default_path(_, mock, response, monkeypatch, tmp_path):
         mock.return_value = response
         monkeypatch.chdir(tmp_path)
@@ -62,7 +76,7 @@ class TestDownload:
         assert output == tmp_path / "noaa-atlas14-mean-pds-intensity-metric.csv"
         assert output.read_text() == "Here is some content"
         mock.assert_called_with(
-            url="https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_mean.csv",
+            "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_mean.csv",
             params={
                 "lat": 39,
                 "lon": -105,
@@ -71,9 +85,10 @@ class TestDownload:
                 "units": "metric",
             },
             timeout=10,
+            stream=False,
         )
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_options_default_path(_, mock, response, monkeypatch, tmp_path):
         mock.return_value = response
         monkeypatch.chdir(tmp_path)
@@ -83,7 +98,7 @@ class TestDownload:
         assert output == tmp_path / "noaa-atlas14-upper-ams-depth-english.csv"
         assert output.read_text() == "Here is some content"
         mock.assert_called_with(
-            url="https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_uppr.csv",
+            "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_uppr.csv",
             params={
                 "lat": 39,
                 "lon": -105,
@@ -92,9 +107,10 @@ class TestDownload:
                 "units": "english",
             },
             timeout=10,
+            stream=False,
         )
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_custom_path(_, mock, response, tmp_path):
         mock.return_value = response
 
@@ -106,7 +122,7 @@ class TestDownload:
         assert output == path
         assert output.read_text() == "Here is some content"
         mock.assert_called_with(
-            url="https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_mean.csv",
+            "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_mean.csv",
             params={
                 "lat": 39,
                 "lon": -105,
@@ -115,9 +131,10 @@ class TestDownload:
                 "units": "metric",
             },
             timeout=10,
+            stream=False,
         )
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_valid_overwrite(_, mock, response, tmp_path):
         mock.return_value = response
 
@@ -130,7 +147,7 @@ class TestDownload:
         assert output == path
         assert output.read_text() == "Here is some content"
         mock.assert_called_with(
-            url="https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_mean.csv",
+            "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_mean.csv",
             params={
                 "lat": 39,
                 "lon": -105,
@@ -139,6 +156,7 @@ class TestDownload:
                 "units": "metric",
             },
             timeout=10,
+            stream=False,
         )
 
     def test_invalid_overwrite(_, tmp_path, assert_contains):
@@ -177,6 +195,101 @@ class TestDownload:
             "series (test) is not a recognized option. Supported options are: pds, ams",
         )
 
+    @patch("requests.Session.get")
+    def test_no_coverage(_, mock, tmp_path, assert_contains):
+        mock.return_value = content_response(
+            content=b"result = 'none';\n"
+            b"ErrorMsg = 'Error 3.0: Selected location is not within a project area';"
+        )
+        with pytest.raises(ValueError) as error:
+            atlas14.download(45, -122, parent=tmp_path)
+        assert_contains(
+            error,
+            "NOAA Atlas 14 data is not available for this location (lat=45, lon=-122)",
+            "Error 3.0: Selected location is not within a project area",
+        )
+        assert list(tmp_path.iterdir()) == []
+
+    @patch("requests.Session.get")
+    def test_no_coverage_default_message(_, mock, tmp_path, assert_contains):
+        mock.return_value = content_response(content=b"result = 'none';")
+        with pytest.raises(ValueError) as error:
+            atlas14.download(45, -122, parent=tmp_path)
+        assert_contains(error, "Location is not within an Atlas 14 project area")
+
+    @patch("requests.Session.get")
+    def test_cache(_, mock, tmp_path):
+        mock.side_effect = content_response
+        cache = tmp_path / "cache"
+        first = atlas14.download(39, -105, parent=tmp_path, name="a.csv", cache=cache)
+        assert len(list(cache.iterdir())) == 1
+
+        second = atlas14.download(39, -105, parent=tmp_path, name="b.csv", cache=cache)
+        assert second.read_text() == first.read_text() == "Here is some content"
+        assert mock.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_cache_options(_, mock, tmp_path):
+        mock.side_effect = content_response
+        cache = tmp_path / "cache"
+        atlas14.download(39, -105, parent=tmp_path, name="a.csv", cache=cache)
+        atlas14.download(
+            39, -105, parent=tmp_path, name="b.csv", cache=cache, units="english"
+        )
+        assert mock.call_count == 2
+        assert len(list(cache.iterdir())) == 2
+
+    @patch("pfdf.data.noaa.atlas14.time")
+    @patch("requests.Session.get")
+    def test_cache_expired(_, mock, time, tmp_path):
+        mock.side_effect = content_response
+        cache = tmp_path / "cache"
+        time.return_value = 0
+        atlas14.download(39, -105, parent=tmp_path, name="a.csv", cache=cache)
+        time.return_value = 1e12
+        atlas14.download(39, -105, parent=tmp_path, name="b.csv", cache=cache)
+        assert mock.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_cache_no_coverage(_, mock, tmp_path):
+        mock.return_value = content_response(content=b"result = 'none';")
+        cache = tmp_path / "cache"
+        with pytest.raises(ValueError):
+            atlas14.download(45, -122, parent=tmp_path, cache=cache)
+        assert not cache.exists()
+
+    @patch("requests.Session.get")
+    def test_default_cache(_, mock, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user-cache"))
+        mock.side_effect = content_response
+        atlas14.download(39, -105, parent=tmp_path, name="a.csv", cache=True)
+        cache = tmp_path / "user-cache" / "pfdf" / "noaa-atlas14"
+        assert len(list(cache.iterdir())) == 1
+
+        atlas14.download(39, -105, parent=tmp_path, name="b.csv", cache=True)
+        assert mock.call_count == 1
+
+    @patch("requests.Session.get")
+    def test_no_cache(_, mock, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "user-cache"))
+        mock.side_effect = content_response
+        atlas14.download(39, -105, parent=tmp_path, cache=False)
+        assert not (tmp_path / "user-cache").exists()
+
+    @patch("pfdf.data.noaa.atlas14.os.replace", side_effect=OSError("failed"))
+    @patch("requests.Session.get")
+    def test_cache_failed(_, mock, replace, tmp_path):
+        mock.side_effect = content_response
+        cache = tmp_path / "cache"
+        with pytest.raises(OSError):
+            atlas14.download(39, -105, parent=tmp_path, cache=cache)
+        assert list(cache.iterdir()) == []
+
+    def test_invalid_cache(_, assert_contains):
+        with pytest.raises(TypeError) as error:
+            atlas14.download(39, -105, cache=5)
+        assert_contains(error, "cache must be a path")
+
     def test_invalid_statistic(_, assert_contains):
         with pytest.raises(ValueError) as error:
             atlas14.download(39, -105, statistic="median")
@@ -186,6 +299,100 @@ class TestDownload:
         )
 
 
+class TestDownloadMany:
+    @patch("requests.Session.get")
+    def test(_, mock, tmp_path):
+        mock.side_effect = content_response
+        output = atlas14.download_many([39, 40], [-105, -106], parent=tmp_path)
+        assert output == [
+            tmp_path / "noaa-atlas14-mean-pds-intensity-metric-39.0_-105.0.csv",
+            tmp_path / "noaa-atlas14-mean-pds-intensity-metric-40.0_-106.0.csv",
+        ]
+        for path in output:
+            assert path.read_text() == "Here is some content"
+        assert mock.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_repeated(_, mock, tmp_path):
+        mock.side_effect = content_response
+        output = atlas14.download_many(
+            [39, 40, 39], [-105, -106, -105], parent=tmp_path
+        )
+        path = tmp_path / "noaa-atlas14-mean-pds-intensity-metric-39.0_-105.0.csv"
+        assert output == [
+            path,
+            tmp_path / "noaa-atlas14-mean-pds-intensity-metric-40.0_-106.0.csv",
+            path,
+        ]
+        assert path.read_text() == "Here is some content"
+        assert mock.call_count == 2
+
+    @patch("requests.Session.get")
+    def test_options(_, mock, tmp_path):
+        mock.side_effect = content_response
+        output = atlas14.download_many(
+            39,
+            -105,
+            parent=tmp_path,
+            statistic="upper",
+            data="depth",
+            series="ams",
+            units="english",
+        )
+        assert output == [
+            tmp_path / "noaa-atlas14-upper-ams-depth-english-39.0_-105.0.csv"
+        ]
+        mock.assert_called_with(
+            "https://hdsc.nws.noaa.gov/cgi-bin/hdsc/new/fe_text_uppr.csv",
+            params={
+                "lat": 39,
+                "lon": -105,
+                "data": "depth",
+                "series": "ams",
+                "units": "english",
+            },
+            timeout=10,
+            stream=False,
+        )
+
+    @patch("requests.Session.get")
+    def test_existing(_, mock, tmp_path, assert_contains):
+        path = tmp_path / "noaa-atlas14-mean-pds-intensity-metric-40.0_-106.0.csv"
+        path.write_text("This file already exists")
+        with pytest.raises(FileExistsError) as error:
+            atlas14.download_many([39, 40], [-105, -106], parent=tmp_path)
+        assert_contains(error, "Download path already exists")
+        mock.assert_not_called()
+
+    def test_length(_, assert_contains):
+        with pytest.raises(ShapeError) as error:
+            atlas14.download_many([39, 40], [-105, -106, -107])
+        assert_contains(error, "lons must have 2")
+
+    def test_invalid_lat(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            atlas14.download_many([39, 100], [-105, -106])
+        assert_contains(error, "lats must be less than or equal to 90")
+
+    @patch("pfdf.data.noaa.atlas14.download")
+    @patch("requests.Session.get")
+    def test_validates_once(_, mock, download, tmp_path):
+        mock.side_effect = content_response
+        atlas14.download_many([39, 40, 41], [-105, -106, -107], parent=tmp_path)
+        download.assert_not_called()
+        assert mock.call_count == 3
+
+    def test_invalid_cache(_, assert_contains):
+        with pytest.raises(TypeError) as error:
+            atlas14.download_many(39, -105, cache=5)
+        assert_contains(error, "cache must be a path")
+
+    def test_invalid_workers(_, assert_contains):
+        with pytest.raises(ValueError) as error:
+            atlas14.download_many(39, -105, max_workers=0)
+        assert_contains(error, "max_workers")
+
+
 @pytest.mark.web(api="atlas14")
 class TestLive:
     def test(_, tmp_path):
@@ -46,7 +46,7 @@ class TestDownload:
         assert file1.read_text() == "An index file in a gdb"
         assert file2.read_text() == "A table file in a gdb"
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_default_path(self, mock, response, monkeypatch, tmp_path):
         mock.return_value = response
         monkeypatch.chdir(tmp_path)
@@ -54,12 +54,13 @@ class TestDownload:
         assert output == tmp_path / "la-county-retainments.gdb"
         self.check_contents(output)
         mock.assert_called_with(
-            url="https://pw.lacounty.gov/sur/nas/landbase/AGOL/Debris_Basin.gdb.zip",
+            "https://pw.lacounty.gov/sur/nas/landbase/AGOL/Debris_Basin.gdb.zip",
             params={},
             timeout=15,
+            stream=False,
         )
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_relative_path(self, mock, response, monkeypatch, tmp_path):
         mock.return_value = response
         monkeypatch.chdir(tmp_path)
@@ -71,12 +72,13 @@ class TestDownload:
         assert output == path
         self.check_contents(output)
         mock.assert_called_with(
-            url="https://pw.lacounty.gov/sur/nas/landbase/AGOL/Debris_Basin.gdb.zip",
+            "https://pw.lacounty.gov/sur/nas/landbase/AGOL/Debris_Basin.gdb.zip",
             params={},
             timeout=15,
+            stream=False,
         )
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_absolute_path(self, mock, response, tmp_path):
         mock.return_value = response
 
@@ -88,9 +90,10 @@ class TestDownload:
         assert output == path
         self.check_contents(output)
         mock.assert_called_with(
-            url="https://pw.lacounty.gov/sur/nas/landbase/AGOL/Debris_Basin.gdb.zip",
+            "https://pw.lacounty.gov/sur/nas/landbase/AGOL/Debris_Basin.gdb.zip",
             params={},
             timeout=15,
+            stream=False,
         )
 
 
@@ -126,7 +126,7 @@ class TestUrl:
 
 
 class TestQuery:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {
             "title": "A title",
@@ -140,6 +140,7 @@ class TestQuery:
             "https://www.sciencebase.gov/catalog/item/6750c172d34ed8d3858534d8",
             params={"format": "json"},
             timeout=60,
+            stream=False,
         )
 
 
@@ -203,7 +204,7 @@ class TestS3Url:
 
 
 class TestDownload:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_default_path(_, mock, download_mock, monkeypatch, tmp_path):
         mock.side_effect = download_mock
         monkeypatch.chdir(tmp_path)
@@ -211,7 +212,7 @@ class TestDownload:
         assert output == tmp_path / "STATSGO-THICK.tif"
         assert output.read_text() == "Here is some content"
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_custom_path(_, mock, download_mock, tmp_path):
         mock.side_effect = download_mock
 
@@ -223,7 +224,7 @@ class TestDownload:
         assert output == path
         assert output.read_text() == "Here is some content"
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_valid_overwrite(_, mock, download_mock, tmp_path):
         mock.side_effect = download_mock
 
@@ -237,7 +238,7 @@ class TestDownload:
         assert output == path
         assert output.read_text() == "Here is some content"
 
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_invalid_overwrite(_, mock, download_mock, tmp_path, assert_contains):
         mock.side_effect = download_mock
 
@@ -253,7 +254,7 @@ class TestDownload:
 
 class TestRead:
     @patch("pfdf.raster.Raster.from_url", spec=True)
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test(_, get_mock, read_mock, json_response, item):
         get_mock.return_value = json_response(item)
         expected = Raster(np.ones((10, 10)))
@@ -118,7 +118,7 @@ class TestApiUrl:
 
 
 class TestQuery:
-    @patch("requests.get", spec=True)
+    @patch("requests.Session.get")
     def test_options(_, mock, json_response):
         content = {
             "total": 999,
@@ -149,9 +149,10 @@ class TestQuery:
             "https://tnmaccess.nationalmap.gov/api/v1/products",
             params=params,
             timeout=60,
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_not_strict(_, mock, json_response):
         content = {"errors": "An error occurred"}
         mock.return_value = json_response(content)
@@ -161,9 +162,10 @@ class TestQuery:
             "https://tnmaccess.nationalmap.gov/api/v1/products",
             params={"datasets": "test1", "outputFormat": "JSON"},
             timeout=60,
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_errors_message(_, mock, json_response, assert_contains):
         content = {"errors": {"message": "Some error message"}}
         mock.return_value = json_response(content)
@@ -178,9 +180,10 @@ class TestQuery:
             "https://tnmaccess.nationalmap.gov/api/v1/products",
             params={"datasets": "test1", "outputFormat": "JSON"},
             timeout=60,
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_error_no_message(_, mock, json_response, assert_contains):
         content = {"errors": ["Some", "errors"]}
         mock.return_value = json_response(content)
@@ -194,11 +197,12 @@ class TestQuery:
             "https://tnmaccess.nationalmap.gov/api/v1/products",
             params={"datasets": "test1", "outputFormat": "JSON"},
             timeout=60,
+            stream=False,
         )
 
 
 class TestNproducts:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {"total": 1234, "items": ["Some", "products"]}
         mock.return_value = json_response(content)
@@ -209,11 +213,12 @@ class TestNproducts:
             "https://tnmaccess.nationalmap.gov/api/v1/products",
             params={"datasets": "test1", "max": 1, "offset": 0, "outputFormat": "JSON"},
             timeout=60,
+            stream=False,
         )
 
 
 class TestProducts:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_single_query(_, mock, json_response):
         items = infos(10)
         mock.return_value = json_response(content(items))
@@ -228,9 +233,10 @@ class TestProducts:
                 "outputFormat": "JSON",
             },
             timeout=60,
+            stream=False,
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_offset_too_large(_, mock, json_response, assert_contains):
         items = infos(100)
         mock.return_value = json_response(content(items))
@@ -242,7 +248,7 @@ class TestProducts:
             "but the input offset (500) is not",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_too_many_queries(_, mock, json_response, assert_contains):
         items = infos(100)
         mock.return_value = json_response(content(items, total=500))
@@ -257,21 +263,21 @@ class TestProducts:
             "than the maximum allowed number of queries (3)",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_max_products_limited(_, mock, json_response):
         items = infos(50)
         mock.return_value = json_response(content(items, total=1000))
         output = api.products("test", max_queries=1, max_products=50)
         assert output == items
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_offset(_, mock, json_response):
         items = infos(15)
         mock.return_value = json_response(content(items, total=1000))
         output = api.products("test", max_products=15, offset=500)
         assert output == items
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_padded(_, mock, json_response):
         items = infos(20)
         mock.return_value = json_response(content(items, total=900))
@@ -279,14 +285,14 @@ class TestProducts:
         assert len(output) == 17
         assert output == items[:-3]
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_fewer_than_max(_, mock, json_response):
         items = infos(13)
         mock.return_value = json_response(content(items))
         output = api.products("test", max_products=20)
         assert output == items
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_multiple_queries_fewer_at_end(_, mock, multiple_mock):
         "Checks multiple queries with padding and fewer entries at the end"
         mock.side_effect = multiple_mock
@@ -195,7 +195,7 @@ class TestQuery:
             "Supported options are: 1/3 arc-second, 1 arc-second, 1 meter, 1/9 arc-second, 2 arc-second, 5 meter",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {"total": 10, "items": [{"value": k} for k in range(10)]}
         mock.return_value = json_response(content)
@@ -208,6 +208,7 @@ class TestQuery:
                 "outputFormat": "JSON",
             },
             timeout=60.0,
+            stream=False,
         )
 
 
@@ -221,7 +222,7 @@ class TestNTiles:
             "Supported options are: 1/3 arc-second, 1 arc-second, 1 meter, 1/9 arc-second, 2 arc-second, 5 meter",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test(_, mock, json_response):
         content = {"total": 10, "items": [{"value": k} for k in range(10)]}
         mock.return_value = json_response(content)
@@ -236,6 +237,7 @@ class TestNTiles:
                 "outputFormat": "JSON",
             },
             timeout=60.0,
+            stream=False,
         )
 
 
@@ -254,7 +256,7 @@ class TestTiles:
             "Supported options are: 1/3 arc-second, 1 arc-second, 1 meter, 1/9 arc-second, 2 arc-second, 5 meter",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test(_, mock, json_response, tile, tile_info):
         content = {"total": 3, "items": [tile] * 3}
         mock.return_value = json_response(content)
@@ -269,6 +271,7 @@ class TestTiles:
                 "outputFormat": "JSON",
             },
             timeout=60.0,
+            stream=False,
         )
 
 
@@ -278,7 +281,7 @@ class TestTiles:
 
 
 class TestQueryTiles:
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_too_many(_, mock, json_response, tile, assert_contains):
         content = {"total": 501, "items": [tile] * 3}
         mock.return_value = json_response(content)
@@ -292,7 +295,7 @@ class TestQueryTiles:
             error, "There are over 500 DEM tiles matching the search criteria."
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_valid(_, mock, json_response, tile, tile_info):
         content = {"total": 3, "items": [tile] * 3}
         mock.return_value = json_response(content)
@@ -39,7 +39,7 @@ class TestProduct:
             "format (Geodatabase) is not a recognized option. Supported options are: shapefile, geopackage, filegdb",
         )
 
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_invalid_huc(_, mock, response, assert_contains):
         mock.return_value = response(200, b"Not valid JSON")
         with pytest.raises(NoTNMProductsError) as error:
@@ -1,3 +1,5 @@
+from typing import Iterator
+
 from pyproj import CRS
 
 from pfdf.segments._geojson import _geojson
@@ -13,7 +15,8 @@ class TestValues:
 
 class TestBasins:
     def test(_, segments, terminal_propcon):
-        output = _geojson._basins(segments, terminal_propcon, CRS(26910))
+        features = _geojson._basins(segments, terminal_propcon, CRS(26910))
+        output = list(features)
         print(output)
         assert output == [
             {
@@ -67,7 +70,8 @@ class TestBasins:
 
 class TestFromShapely:
     def test_segments(_, segments, propcon):
-        output = _geojson._from_shapely(segments, "segments", propcon, CRS(26910))
+        features = _geojson._from_shapely(segments, "segments", propcon, CRS(26910))
+        output = list(features)
         assert output == [
             {
                 "geometry": {
@@ -145,9 +149,10 @@ class TestFromShapely:
         ]
 
     def test_segment_outlets(_, segments, propcon):
-        output = _geojson._from_shapely(
+        features = _geojson._from_shapely(
             segments, "segment outlets", propcon, CRS(26910)
         )
+        output = list(features)
         assert output == [
             {
                 "geometry": {"coordinates": [668188.092755, 4.487676], "type": "Point"},
@@ -182,9 +187,10 @@ class TestFromShapely:
         ]
 
     def test_outlets(_, segments, terminal_propcon):
-        output = _geojson._from_shapely(
+        features = _geojson._from_shapely(
             segments, "outlets", terminal_propcon, CRS(26910)
         )
+        output = list(features)
         assert output == [
             {
                 "geometry": {"coordinates": [668190.087278, 0.498631], "type": "Point"},
@@ -199,6 +205,36 @@ class TestFromShapely:
         ]
 
 
+class TestRecords:
+    def test(_, segments, properties):
+        records, schema, crs = _geojson.records(segments, "outlets", properties, None)
+        assert isinstance(records, Iterator)
+        assert list(records) == [
+            {
+                "geometry": {"coordinates": [5.5, 0.5], "type": "Point"},
+                "properties": {"afloat": 2.2, "anint": 2, "astr": "string", "id": 3},
+                "type": "Feature",
+            },
+            {
+                "geometry": {"coordinates": [3.5, 6.5], "type": "Point"},
+                "properties": {"afloat": 5.2, "anint": 5, "astr": "one", "id": 6},
+                "type": "Feature",
+            },
+        ]
+        assert schema == {
+            "id": "int",
+            "afloat": "float",
+            "anint": "int",
+            "astr": "str:7",
+        }
+        assert crs == segments.crs
+
+    def test_matches_features(_, segments, properties):
+        records = _geojson.records(segments, "segments", properties, None)[0]
+        collection = _geojson.features(segments, "segments", properties, None)[0]
+        assert list(records) == collection["features"]
+
+
 class TestFeatures:
     def test_basins(_, segments, properties):
         json, schema, crs = _geojson.features(segments, "basins", properties, None)
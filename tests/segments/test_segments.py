@@ -290,6 +290,19 @@ def test_indices(segments, indices):
     assert segments.indices is not segments._indices
 
 
+class TestPixels:
+    def test(_, segments, indices):
+        for k, (rows, cols) in enumerate(indices):
+            output = segments._pixels(k)
+            assert np.array_equal(output[0], rows)
+            assert np.array_equal(output[1], cols)
+
+    def test_flat(_, segments, indices):
+        assert segments._offsets[0] == 0
+        assert segments._offsets.size == segments.size + 1
+        assert segments._rows.size == sum(len(rows) for rows, _ in indices)
+
+
 def test_npixels(segments, npixels):
     assert np.array_equal(segments.npixels, npixels)
     assert segments.npixels is not segments._npixels
@@ -362,6 +375,12 @@ class TestIndicesToIds:
         indices = np.array([])
         output = segments._indices_to_ids(indices)
         assert np.array_equal(output, [])
+        assert output.dtype == segments._ids.dtype
+
+    def test_integer(_, segments):
+        output = segments._indices_to_ids(np.array([2, -1, 0]))
+        assert np.array_equal(output, [3, 0, 1])
+        assert output.dtype == segments._ids.dtype
 
 
 class TestPreallocate:
@@ -443,6 +462,19 @@ class TestIsTerminal:
         expected = [False, True]
         assert np.array_equal(output, expected)
 
+    def test_cached(_, segments):
+        output = segments.isterminal()
+        assert output is not segments._terminal
+        output[:] = False
+        assert np.array_equal(segments.isterminal(), [0, 0, 1, 0, 0, 1])
+
+    def test_remove(_, segments):
+        segments.isterminal()
+        segments.remove([6], type="ids")
+        output = segments.isterminal()
+        expected = [True, False, True, False, True]
+        assert np.array_equal(output, expected)
+
 
 class TestTermini:
     def test_all(_, segments):
@@ -463,6 +495,17 @@ class TestTermini:
         expected = [6, 3]
         assert np.array_equal(output, expected)
 
+    def test_cached(_, segments):
+        segments.termini()
+        assert np.array_equal(segments._termini, [5, 5, 2, 5, 5, 5])
+
+    def test_remove(_, segments):
+        segments.termini()
+        segments.remove([3], type="ids")
+        output = segments.termini()
+        expected = [6, 6, 6, 6, 6]
+        assert np.array_equal(output, expected)
+
 
 class TestOutlets:
     def test(_, segments):
@@ -488,6 +531,18 @@ class TestOutlets:
         )
         assert np.array_equal(output, expected)
 
+    def test_empty_array(_, segments):
+        segments.keep(np.zeros(segments.size))
+        output = segments.outlets(segment_outlets=True, as_array=True)
+        assert output.shape == (0, 2)
+
+    def test_no_pixels(_, segments, assert_contains):
+        segments._offsets = segments._offsets.copy()
+        segments._offsets[1] = segments._offsets[0]
+        with pytest.raises(IndexError) as error:
+            segments.outlets(1, segment_outlets=True)
+        assert_contains(error, "Cannot locate the outlet of segment 1")
+
 
 #####
 # Local Networks
@@ -1116,6 +1171,14 @@ class TestInMask:
         expected = np.array([True, False])
         assert np.array_equal(output, expected)
 
+    def test_nodata(_, segments, mask2, transform):
+        mask2 = mask2.astype(int)
+        mask2[2:4, 4] = 5
+        mask2 = Raster.from_array(mask2, nodata=5, transform=transform, crs=26911)
+        output = segments.in_mask(mask2)
+        expected = np.array([False, True, True, True, False, False])
+        assert np.array_equal(output, expected)
+
 
 class TestInPerimeter:
     def test(_, segments, mask2):
@@ -1643,7 +1706,9 @@ class TestCopy:
         assert np.array_equal(copy._ids, segments._ids)
         assert copy._ids is not segments._ids
         assert copy._indices == segments._indices
-        assert copy._indices is not segments._indices
+        assert copy._rows is not segments._rows
+        assert copy._cols is not segments._cols
+        assert copy._offsets is not segments._offsets
         assert np.array_equal(copy._npixels, segments._npixels)
         assert copy._npixels is not segments._npixels
         assert np.array_equal(copy._child, segments._child)
@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from pfdf.segments import _segments, _summary
+
+STATISTICS = (
+    "min",
+    "max",
+    "mean",
+    "std",
+    "sum",
+    "var",
+    "nanmin",
+    "nanmax",
+    "nanmean",
+    "nanstd",
+    "nansum",
+    "nanvar",
+)
+
+
+class TestVectorized:
+    @pytest.mark.parametrize("statistic", STATISTICS)
+    def test_supported(_, segments, statistic):
+        assert _summary.vectorized(segments, statistic) == True
+
+    @pytest.mark.parametrize("statistic", ("outlet", "median", "nanmedian"))
+    def test_unsupported(_, segments, statistic):
+        assert _summary.vectorized(segments, statistic) == False
+
+    def test_empty(_, segments):
+        segments.keep(np.zeros(segments.size))
+        assert _summary.vectorized(segments, "mean") == False
+
+
+class TestSummary:
+    @pytest.mark.parametrize("nodata", (3, 7))
+    @pytest.mark.parametrize("statistic", STATISTICS)
+    def test(_, segments, flow, statistic, nodata):
+        flow.override(nodata=nodata)
+        output = _summary.summary(segments, statistic, flow)
+
+        function = _segments._STATS[statistic][0]
+        expected = [
+            segments._summarize(function, flow, segments._pixels(k))
+            for k in range(segments.size)
+        ]
+        assert np.allclose(output, expected, equal_nan=True)
+
+    def test_all_nan(_, segments, flow):
+        flow.override(nodata=3)
+        output = _summary.summary(segments, "nanmean", flow)
+        assert np.isnan(output[2])
+        assert not np.isnan(output[[0, 1, 3, 4, 5]]).any()
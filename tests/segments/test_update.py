@@ -4,11 +4,21 @@ from pfdf.segments import Segments, _update
 
 
 class TestSegments:
-    def test(_, segments, linestrings245, indices245):
+    def test(_, segments, linestrings245):
         remove = np.array([1, 0, 1, 0, 0, 1], bool)
-        out1, out2 = _update.segments(segments, remove)
-        assert out1 == linestrings245
-        assert out2 == indices245
+        output = _update.segments(segments, remove)
+        assert output == linestrings245
+
+
+class TestPixels:
+    def test(_, segments, indices245):
+        remove = np.array([1, 0, 1, 0, 0, 1], bool)
+        rows, cols, offsets = _update.pixels(segments, remove)
+        output = [
+            (rows[start:stop].tolist(), cols[start:stop].tolist())
+            for start, stop in zip(offsets[:-1], offsets[1:])
+        ]
+        assert output == indices245
 
 
 class TestFamily: